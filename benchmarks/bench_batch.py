@@ -0,0 +1,52 @@
+"""
+Measures `anonymize_batch` throughput on CPU-bound document records per number of workers.
+
+Usage:
+    uv run python benchmarks/bench_batch.py [--records N] [--workers 1 2 4 8]
+"""
+
+import argparse
+import os
+import time
+
+from anonymizer_data.batch import anonymize_batch
+
+RECORD = {
+    "name": "Jhon Doe",
+    "cpf": "529.982.247-25",
+    "cnpj": "11.222.333/0001-81",
+    "pis": "689.37232.86-5",
+    "email": "jhondoe@example.com",
+    "telefone": "+55 (11) 91234-5678",
+    "cep": "12345-678",
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=200_000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1]
+    )
+    args = parser.parse_args()
+
+    records = [dict(RECORD) for _ in range(args.records)]
+    baseline = None
+
+    print(f"{'workers':>7} {'records/s':>12} {'speedup':>8}")
+    for workers in sorted(set(args.workers)):
+        start = time.perf_counter()
+        anonymize_batch(
+            records,
+            workers=workers,
+            chunk_size=args.chunk_size,
+            key_with_type_mask=True,
+        )
+        rate = args.records / (time.perf_counter() - start)
+        baseline = baseline or rate
+        print(f"{workers:>7} {rate:>12.0f} {rate / baseline:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
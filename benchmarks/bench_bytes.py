@@ -0,0 +1,61 @@
+"""
+Compares the bytes handlers with decoding the value, masking it with `MaskStr` and encoding
+the result again, for short documents and for long ASCII payloads.
+
+Usage:
+    uv run python benchmarks/bench_bytes.py [--number N] [--repeat N]
+"""
+
+import argparse
+import timeit
+from functools import partial
+from typing import Any
+
+from anonymizer_data import MaskStr
+from anonymizer_data.handlers import anonymize_bytes
+
+PAYLOAD = b"GET /orders/4412?cpf=529.982.247-25&tel=11912345678 HTTP/1.1 " * 1000
+
+CASES = {
+    "email": (b"jhondoe@example.com", {}),
+    "phone": (b"+55 (11) 91234-5678", {}),
+    "cpf": (b"529.982.247-25", {}),
+    "cnpj": (b"11.222.333/0001-81", {}),
+    "cep": (b"12345-678", {}),
+    "string": (b"Sensitive Data Value", {"size_anonymization": 0.7}),
+    "number_64k": (PAYLOAD, {}),
+    "string_64k": (PAYLOAD, {"size_anonymization": 0.5}),
+}
+
+
+def through_str(data: bytes, type_mask: str, **kwargs: Any) -> bytes:
+    return MaskStr(data.decode(), type_mask=type_mask, **kwargs).anonymize().encode()
+
+
+def best(func: Any, number: int, repeat: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'case':<12} {'bytes':>12} {'MaskStr':>12} {'speedup':>8}")
+    for name, (data, options) in CASES.items():
+        type_mask = name.partition("_")[0]
+        func = partial(anonymize_bytes, data, type_mask, **options)
+        reference = partial(through_str, data, type_mask, **options)
+        assert func() == reference(), name
+        number = max(1, args.number * 20 // len(data))
+        native = best(func, number, args.repeat)
+        decoded = best(reference, number, args.repeat)
+        print(
+            f"{name:<12} {native * 1e6:>9.2f} us {decoded * 1e6:>9.2f} us "
+            f"{decoded / native:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
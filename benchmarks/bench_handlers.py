@@ -0,0 +1,63 @@
+"""
+Microbenchmark of each handler of `anonymizer_data.handlers`.
+
+Usage:
+    uv run python benchmarks/bench_handlers.py [--number N] [--repeat N]
+"""
+
+import argparse
+import timeit
+
+from anonymizer_data.handlers import (
+    anonymize_all_string,
+    anonymize_cep,
+    anonymize_cnpj,
+    anonymize_cpf,
+    anonymize_email,
+    anonymize_numeric_digits,
+    anonymize_phone_number,
+    anonymize_pis,
+    anonymize_rg,
+    anonymize_string,
+    anonymize_substring,
+    mask_string_part,
+)
+
+CASES = {
+    "string": (anonymize_string, ("Sensitive Data Value", 0.7)),
+    "string_negative": (anonymize_string, ("Sensitive Data Value", -0.5)),
+    "all_string": (anonymize_all_string, ("Sensitive Data Value",)),
+    "email": (anonymize_email, ("jhondoe@example.com",)),
+    "phone": (anonymize_phone_number, ("+55 (11) 91234-5678",)),
+    "mask_string_part": (mask_string_part, ("52998224725", 0, 9)),
+    "numeric_digits": (anonymize_numeric_digits, ("My phone is 1234567890",)),
+    "substring": (anonymize_substring, ("Hello world, hello world", "world", 2)),
+    "cpf": (anonymize_cpf, ("529.982.247-25",)),
+    "cpf_invalid": (anonymize_cpf, ("123.456.789-00",)),
+    "cnpj": (anonymize_cnpj, ("11.222.333/0001-81",)),
+    "rg": (anonymize_rg, ("12.345.678-9",)),
+    "cep": (anonymize_cep, ("12345-678",)),
+    "pis": (anonymize_pis, ("689.37232.86-5",)),
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'handler':<18} {'ns/call':>10}")
+    for name, (handler, handler_args) in CASES.items():
+        best = min(
+            timeit.repeat(
+                lambda: handler(*handler_args),  # noqa: B023
+                number=args.number,
+                repeat=args.repeat,
+            )
+        )
+        print(f"{name:<18} {best / args.number * 1e9:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
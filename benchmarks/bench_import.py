@@ -0,0 +1,89 @@
+"""
+Import time of the package and of the CLI, as reported by `python -X importtime`.
+
+Each statement runs in a fresh interpreter with a warm bytecode cache, `--repeat` times, and
+the best run is kept: the cumulative time of the modules it imports that a bare interpreter
+does not. The script exits with status 1 when a statement takes longer than its budget, in
+milliseconds, multiplied by `--scale` on slower machines.
+
+Usage:
+    uv run python benchmarks/bench_import.py [--repeat N] [--scale X] [--top N]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+BUDGETS_MS = {
+    "import anonymizer_data": 5.0,
+    "from anonymizer_data import anonymize_value": 100.0,
+    "import anonymizer_data.cli": 150.0,
+}
+
+
+def importtime(statement: str, env: dict[str, str]) -> list[tuple[str, int, int]]:
+    """Returns the name, self and cumulative microseconds of each module imported."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        modules.append((name.rstrip()[1:], int(self_us), int(cumulative_us)))
+    return modules
+
+
+def measure(
+    statement: str, startup: set[str], env: dict[str, str]
+) -> tuple[float, list[tuple[str, int, int]]]:
+    """Returns the milliseconds of `statement` and the modules that it imported."""
+    modules = [
+        module
+        for module in importtime(statement, env)
+        if module[0].strip() not in startup
+    ]
+    total = sum(cumulative for name, _, cumulative in modules if name == name.lstrip())
+    return total / 1e3, modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--top", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache:
+        env = {**os.environ, "PYTHONPYCACHEPREFIX": cache}
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+        startup = {name.strip() for name, _, _ in importtime("pass", env)}
+
+        failed = False
+        print(f"{'statement':<46} {'best':>9} {'budget':>9}")
+        for statement, budget in BUDGETS_MS.items():
+            importtime(statement, env)
+            runs = [measure(statement, startup, env) for _ in range(args.repeat)]
+            milliseconds, modules = min(runs, key=lambda run: run[0])
+            budget *= args.scale
+            status = "ok" if milliseconds <= budget else "OVER"
+            failed = failed or milliseconds > budget
+            print(
+                f"{statement:<46} {milliseconds:>6.1f} ms {budget:>6.1f} ms  {status}"
+            )
+            slowest = sorted(modules, key=lambda module: -module[1])[: args.top]
+            for name, self_us, _ in slowest:
+                print(f"    {name.strip():<42} {self_us / 1e3:>6.1f} ms")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Peak memory of anonymizing a large document with a copy and in place.
+
+Each mode runs in a fresh process, since the peak RSS (`ru_maxrss`) of a process only grows.
+The tracemalloc peak is measured around the anonymization alone, while the RSS includes the
+document itself. tracemalloc only sees blocks allocated after it starts, so it counts the
+masked strings but not the release of the original strings they replace; the RSS shows both.
+
+Usage:
+    uv run python benchmarks/bench_in_place.py [--records N]
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from anonymizer_data import MaskList
+
+RECORD = {
+    "name": "Jhon Doe",
+    "email": "jhondoe@example.com",
+    "notes": "Customer since 2019, prefers contact by email",
+    "tags": ["vip", "newsletter", "beta"],
+    "address": {"street": "Rua das Flores", "number": "123", "city": "São Paulo"},
+}
+
+
+def build(records: int) -> list[dict]:
+    # json round trip, so that every string is a distinct object as in a parsed document
+    return json.loads(json.dumps([RECORD] * records))
+
+
+def run(mode: str, records: int) -> dict[str, float]:
+    document = build(records)
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    mask = MaskList(document, in_place=mode == "in_place")
+    del document
+    mask.anonymize()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        "seconds": elapsed,
+        "tracemalloc_peak_mib": peak / 2**20,
+        "rss_document_mib": rss_before / 1024,
+        "rss_peak_mib": rss_after / 1024,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--mode", choices=["copy", "in_place"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run(args.mode, args.records)))
+        return
+
+    print(
+        f"{'mode':<10} {'seconds':>8} {'tracemalloc MiB':>16} "
+        f"{'RSS document MiB':>17} {'RSS peak MiB':>13}"
+    )
+    for mode in ("copy", "in_place"):
+        output = subprocess.run(
+            [sys.executable, __file__, "--mode", mode, "--records", str(args.records)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        result = json.loads(output)
+        print(
+            f"{mode:<10} {result['seconds']:>8.2f} {result['tracemalloc_peak_mib']:>16.1f} "
+            f"{result['rss_document_mib']:>17.1f} {result['rss_peak_mib']:>13.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Throughput and peak memory of anonymizing a large log file with `anonymize_log_file`, which
+memory-maps it and scans its bytes, and by reading it line by line with `anonymize_text`.
+
+Each mode runs in a fresh process, since the peak RSS (`ru_maxrss`) of a process only grows.
+The peak RSS of the memory-mapped mode should stay flat as `--megabytes` grows.
+
+Usage:
+    uv run python benchmarks/bench_log_file.py [--megabytes N]
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from anonymizer_data.handlers import anonymize_text
+from anonymizer_data.streams import anonymize_log_file
+
+LINES = (
+    (
+        "2026-10-18T12:00:00Z INFO checkout order=4412 user=jhondoe@example.com "
+        "cpf=529.982.247-25 phone=(11) 91234-5678 cep=12345-678 status=ok\n"
+    ),
+    "2026-10-18T12:00:01Z DEBUG cache hit key=orders:4412 elapsed=0.8ms\n",
+    "2026-10-18T12:00:02Z WARN retrying request to payments, attempt 2 of 5\n",
+)
+OUTPUT_BUFFER_SIZE = 1024 * 1024
+
+
+def build(path: Path, megabytes: int) -> None:
+    block = "".join(LINES) * 1000
+    with path.open("w", encoding="utf-8") as file:
+        for _ in range(megabytes * 2**20 // len(block)):
+            file.write(block)
+
+
+def run(mode: str, path: Path) -> dict[str, float]:
+    start = time.perf_counter()
+    with open(os.devnull, "wb", buffering=OUTPUT_BUFFER_SIZE) as output:
+        if mode == "mmap":
+            anonymize_log_file(path, output)
+        else:
+            with path.open(encoding="utf-8") as source:
+                output.writelines(anonymize_text(line).encode() for line in source)
+    elapsed = time.perf_counter() - start
+
+    mebibytes = path.stat().st_size / 2**20
+    return {
+        "seconds": elapsed,
+        "mib_per_s": mebibytes / elapsed,
+        "rss_peak_mib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--megabytes", type=int, default=64)
+    parser.add_argument("--mode", choices=["mmap", "lines"], help=argparse.SUPPRESS)
+    parser.add_argument("--path", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run(args.mode, args.path)))
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory, "app.log")
+        build(path, args.megabytes)
+        print(f"{'mode':<6} {'seconds':>8} {'MiB/s':>8} {'RSS peak MiB':>13}")
+        for mode in ("mmap", "lines"):
+            output = subprocess.run(
+                [sys.executable, __file__, "--mode", mode, "--path", str(path)],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            result = json.loads(output)
+            print(
+                f"{mode:<6} {result['seconds']:>8.2f} {result['mib_per_s']:>8.1f} "
+                f"{result['rss_peak_mib']:>13.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
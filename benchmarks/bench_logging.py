@@ -0,0 +1,74 @@
+"""
+Overhead of anonymizing log records, measured at the logging call site.
+
+Compares a plain `StreamHandler`, the same handler with an `AnonymizingFilter`, and the
+non-blocking `queue_handler`, where anonymizing and writing happen in the listener thread.
+The listener is started only after the timing, so the queue numbers are the cost paid by the
+caller (on a single core the listener thread would otherwise compete for the same CPU).
+
+Usage:
+    uv run python benchmarks/bench_logging.py [--calls N] [--repeat N]
+"""
+
+import argparse
+import io
+import logging
+import timeit
+from functools import partial
+
+from anonymizer_data.logs import AnonymizingFilter, queue_handler
+
+EXTRA = {"cpf": "529.982.247-25", "request_id": "8c1f0a"}
+
+
+def make_logger(name: str, handler: logging.Handler) -> logging.Logger:
+    handler.setFormatter(logging.Formatter("%(levelname)s %(message)s %(cpf)s"))
+    logger = logging.getLogger(f"bench.{name}")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.handlers[:] = [handler]
+    return logger
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    filtered = logging.StreamHandler(io.StringIO())
+    filtered.addFilter(AnonymizingFilter())
+    queued, listener = queue_handler(logging.StreamHandler(io.StringIO()))
+
+    loggers = {
+        "plain": make_logger("plain", logging.StreamHandler(io.StringIO())),
+        "filter": make_logger("filter", filtered),
+        "queue": make_logger("queue", queued),
+    }
+
+    results = {}
+    for name, logger in loggers.items():
+        best = min(
+            timeit.repeat(
+                partial(
+                    logger.info,
+                    "Login of %s from %s",
+                    "jhondoe",
+                    "10.0.0.1",
+                    extra=EXTRA,
+                ),
+                number=args.calls,
+                repeat=args.repeat,
+            )
+        )
+        results[name] = best / args.calls * 1e9
+    listener.start()
+    listener.stop()
+
+    print(f"{'handler':<10} {'ns/call':>10} {'overhead':>10}")
+    for name, ns in results.items():
+        print(f"{name:<10} {ns:>10.0f} {ns / results['plain']:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Compares the per-record `MaskDict` path with a compiled `MaskDictPlan`.
+
+Usage:
+    uv run python benchmarks/bench_mask_dict_plan.py [--records N] [--repeat N]
+"""
+
+import argparse
+import timeit
+
+from anonymizer_data import MaskDict
+from anonymizer_data.core import MaskDictPlan
+
+RECORD = {
+    "name": "Jhon Doe",
+    "email": "jhondoe@example.com",
+    "cpf": "123.456.789-09",
+    "phone": "+55 (11) 91234-5678",
+    "cep": "12345-678",
+    "notes": "Customer since 2019",
+    "tags": ["vip", "newsletter", "beta"],
+    "address": {"street": "Rua das Flores", "number": "123", "city": "São Paulo"},
+}
+
+OPTIONS = {
+    "default": {},
+    "selected_keys": {"selected_keys": ["name", "email", "address"]},
+    "key_with_type_mask": {"key_with_type_mask": True},
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    records = [dict(RECORD) for _ in range(args.records)]
+
+    print(f"{'options':<20} {'MaskDict':>12} {'plan':>12} {'speedup':>8}")
+    for name, options in OPTIONS.items():
+        plan = MaskDict.compile(**options)
+
+        def per_record(options: dict = options) -> None:
+            for record in records:
+                MaskDict(record, **options).anonymize()
+
+        def compiled(plan: MaskDictPlan = plan) -> None:
+            for record in records:
+                plan.anonymize(record)
+
+        baseline = min(timeit.repeat(per_record, number=1, repeat=args.repeat))
+        fast = min(timeit.repeat(compiled, number=1, repeat=args.repeat))
+        print(
+            f"{name:<20} {args.records / baseline:>9.0f}r/s "
+            f"{args.records / fast:>9.0f}r/s {baseline / fast:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
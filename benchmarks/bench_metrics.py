@@ -0,0 +1,66 @@
+"""
+Cost of the handler metrics: masks the same records with a compiled plan and with
+`anonymize_value`, with `Config.metrics` disabled and enabled, and prints the snapshot.
+
+Usage:
+    uv run python benchmarks/bench_metrics.py [--records N] [--repeat N]
+"""
+
+import argparse
+import timeit
+from functools import partial
+
+from anonymizer_data import MaskDict, anonymize_value
+from anonymizer_data.core.config import Config
+from anonymizer_data.handlers import MaskDispatch
+
+RECORD = {
+    "name": "Jhon Doe",
+    "email": "jhondoe@example.com",
+    "cpf": "529.982.247-25",
+    "phone": "+55 (11) 91234-5678",
+    "cep": "12345-678",
+    "status": "active",
+    "tags": ["vip", "new"],
+}
+
+
+def best(func, repeat: int) -> float:
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    records = [RECORD] * args.records
+    plan = MaskDict.compile(key_with_type_mask=True)
+    cases = {
+        "plan": lambda: list(plan.anonymize_many(records)),
+        "anonymize_value": partial(anonymize_value, records, key_with_type_mask=True),
+    }
+
+    print(f"{'case':<16} {'disabled':>10} {'enabled':>10} {'overhead':>9}")
+    for name, func in cases.items():
+        Config.setup()
+        disabled = best(func, args.repeat)
+        Config.setup(metrics=True)
+        enabled = best(func, args.repeat)
+        print(
+            f"{name:<16} {disabled * 1e3:>7.1f} ms {enabled * 1e3:>7.1f} ms "
+            f"{enabled / disabled - 1:>8.0%}"
+        )
+
+    snapshot = MaskDispatch.metrics_snapshot()
+    for type_mask, stats in sorted(
+        snapshot.handlers.items(), key=lambda item: -item[1].seconds
+    ):
+        print(f"{type_mask:<8} {stats.calls:>9} calls {stats.seconds:>7.3f} s")
+    print("unmatched", snapshot.unmatched)
+    Config.setup()
+
+
+if __name__ == "__main__":
+    main()
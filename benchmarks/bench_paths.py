@@ -0,0 +1,78 @@
+"""
+Compares compiled path selectors with anonymizing the whole document, on documents of
+growing size where the same few fields are selected.
+
+`PathSelector` copies only the containers on the selected paths and returns the rest by
+reference, so its time should stay flat as the document grows, while `anonymize_value` and
+`MaskDict(selected_keys=...)` walk every value.
+
+Usage:
+    uv run python benchmarks/bench_paths.py [--sizes 10 100 1000 10000] [--repeat N]
+"""
+
+import argparse
+import timeit
+from typing import Any
+
+from anonymizer_data import MaskDict, anonymize_value
+from anonymizer_data.core import PathSelector
+
+PATHS = {
+    "customer.email": "email",
+    "customer.document": "cpf",
+    "customer.addresses[*].cep": "cep",
+}
+
+
+def document(size: int) -> dict[str, Any]:
+    """An order with a small customer and `size` line items that are not selected."""
+    return {
+        "id": 1,
+        "customer": {
+            "name": "Jhon Doe",
+            "email": "jhondoe@example.com",
+            "document": "529.982.247-25",
+            "addresses": [
+                {"street": "Rua A", "cep": "01001-000"},
+                {"street": "Rua B", "cep": "20040-020"},
+            ],
+        },
+        "items": [
+            {"sku": f"SKU-{index}", "description": "Notebook", "price": "10.00"}
+            for index in range(size)
+        ],
+    }
+
+
+def best(func: Any, number: int, repeat: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    selector = PathSelector.compile(PATHS)
+    print(
+        f"{'items':>7} {'PathSelector':>14} {'selected_keys':>14} {'anonymize_value':>16}"
+    )
+    for size in args.sizes:
+        data = document(size)
+        number = max(1, 20_000 // size)
+        paths = best(lambda d=data: selector.anonymize(d), number * 10, args.repeat)
+        keys = best(
+            lambda d=data: MaskDict(d, selected_keys=["customer"]).anonymize(),
+            number,
+            args.repeat,
+        )
+        whole = best(lambda d=data: anonymize_value(d), number, args.repeat)
+        print(
+            f"{size:>7} {paths * 1e6:>11.1f} us {keys * 1e6:>11.1f} us "
+            f"{whole * 1e6:>13.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Compares the explicit-stack traversal of `anonymize_value` with the recursive traversal it
+replaced, on payloads nested 10, 100 and 10 000 levels deep.
+
+`recursive_anonymize_value` reproduces the previous implementation, where each level of
+nesting called `anonymize_value` again. It raises `RecursionError` on deep payloads, which
+is reported instead of a time.
+
+Usage:
+    uv run python benchmarks/bench_traversal.py [--depths 10 100 10000] [--repeat N]
+"""
+
+import argparse
+import timeit
+from typing import Any
+
+from anonymizer_data import MaskDict, anonymize_value
+from anonymizer_data.core import MaskDictPlan
+from anonymizer_data.core.dispatcher import mask_str_value
+
+
+def _recursive_list(value: list, **kwargs: Any) -> list:
+    return [recursive_anonymize_value(item, **kwargs) for item in value]
+
+
+def _recursive_dict(
+    value: dict[str, Any],
+    key_with_type_mask: bool = False,
+    selected_keys: list[str] | None = None,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    if key_with_type_mask:
+        return {
+            key: recursive_anonymize_value(item, **{**kwargs, "type_mask": key})
+            for key, item in value.items()
+        }
+    if selected_keys:
+        not_selected = {**kwargs, "anonymize_string": False}
+        return {
+            key: recursive_anonymize_value(
+                item, **(kwargs if key in selected_keys else not_selected)
+            )
+            for key, item in value.items()
+        }
+    return {
+        key: recursive_anonymize_value(item, **kwargs) for key, item in value.items()
+    }
+
+
+RECURSIVE_MASKERS = {
+    "list": _recursive_list,
+    "dict": _recursive_dict,
+    "str": mask_str_value,
+}
+
+
+def recursive_anonymize_value(value: Any, **extra: Any) -> Any:
+    """The recursive traversal used before the explicit stack, kept as a reference."""
+    masker = RECURSIVE_MASKERS.get(type(value).__name__)
+    if masker:
+        return masker(value, **extra)
+    if extra.get("type_mask"):
+        return mask_str_value(str(value), **extra)
+    return value
+
+
+def deep_payload(depth: int) -> dict[str, Any]:
+    """A generated config: each level has a few settings and the next level."""
+    value: dict[str, Any] = {"name": "Jhon Doe", "email": "jhondoe@example.com"}
+    for level in range(depth):
+        value = {
+            "id": level,
+            "owner": "Jhon Doe",
+            "tags": ["config", f"level-{level}"],
+            "child": value,
+        }
+    return value
+
+
+def best(func: Any, number: int, repeat: int) -> float | None:
+    try:
+        return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+    except RecursionError:
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--depths", type=int, nargs="+", default=[10, 100, 10_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    plan = MaskDictPlan.compile()
+    print(
+        f"{'depth':>7} {'recursive':>12} {'anonymize_value':>16} "
+        f"{'MaskDict':>12} {'plan':>12} {'speedup':>8}"
+    )
+    for depth in args.depths:
+        payload = deep_payload(depth)
+        number = max(1, 20_000 // (depth * 4))
+        recursive = best(
+            lambda p=payload: recursive_anonymize_value(p), number, args.repeat
+        )
+        iterative = best(lambda p=payload: anonymize_value(p), number, args.repeat)
+        mask_dict = best(lambda p=payload: MaskDict(p).anonymize(), number, args.repeat)
+        compiled = best(lambda p=payload: plan.anonymize(p), number, args.repeat)
+
+        def show(seconds: float | None) -> str:
+            return "RecursionError" if seconds is None else f"{seconds * 1e3:.3f} ms"
+
+        speedup = f"{recursive / iterative:.2f}x" if recursive and iterative else "-"
+        print(
+            f"{depth:>7} {show(recursive):>12} {show(iterative):>16} "
+            f"{show(mask_dict):>12} {show(compiled):>12} {speedup:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
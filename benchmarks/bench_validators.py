@@ -0,0 +1,49 @@
+"""
+Compares the built-in CPF, CNPJ and PIS validators with `validate_docbr`, which gives the
+same verdicts and is installed with the development dependencies.
+
+Usage:
+    uv run python benchmarks/bench_validators.py [--number N] [--repeat N]
+"""
+
+import argparse
+import timeit
+from functools import partial
+
+from validate_docbr import CNPJ, CPF, PIS
+
+from anonymizer_data.handlers import validate_cnpj, validate_cpf, validate_pis
+
+CASES = {
+    "cpf": (validate_cpf, CPF(), "529.982.247-25"),
+    "cpf_digits": (validate_cpf, CPF(), "52998224725"),
+    "cpf_invalid": (validate_cpf, CPF(), "529.982.247-26"),
+    "cnpj": (validate_cnpj, CNPJ(), "11.222.333/0001-81"),
+    "cnpj_alphanumeric": (validate_cnpj, CNPJ(), "12.ABC.345/01DE-35"),
+    "pis": (validate_pis, PIS(), "689.37232.86-5"),
+}
+
+
+def best(func, number: int, repeat: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'case':<18} {'built-in':>10} {'validate_docbr':>15} {'speedup':>8}")
+    for name, (validate, reference, doc) in CASES.items():
+        assert validate(doc) == reference.validate(doc), name
+        builtin = best(partial(validate, doc), args.number, args.repeat)
+        docbr = best(partial(reference.validate, doc), args.number, args.repeat)
+        print(
+            f"{name:<18} {builtin * 1e6:>7.2f} us {docbr * 1e6:>12.2f} us "
+            f"{docbr / builtin:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
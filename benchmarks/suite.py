@@ -0,0 +1,317 @@
+"""
+Benchmark suite of the handlers, the mask classes and the dict strategies.
+
+Each case is timed with `timeit` (best of `--repeat` runs, calibrated so that each run takes
+at least `--min-time` seconds) and its peak allocation is measured once with `tracemalloc`.
+Results can be saved as JSON and compared with a saved baseline: a case is a regression
+when it is slower than the baseline by more than `--threshold` (a fraction, 0.1 is 10%).
+
+Usage:
+    uv run python benchmarks/suite.py [--filter TEXT] [--output results.json]
+    uv run python benchmarks/suite.py --baseline baseline.json [--threshold 0.1]
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import timeit
+import tracemalloc
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from anonymizer_data import MaskDict, MaskList, MaskStr, anonymize_value
+from anonymizer_data.core.dict_strategy import (
+    DefaultDictAnonymizationStrategy,
+    KeyAsTypeMaskDictAnonymizationStrategy,
+    KeyBasedDictAnonymizationStrategy,
+    PathDictAnonymizationStrategy,
+)
+from anonymizer_data.handlers import MaskDispatch, PiiScanner, anonymize_bytes
+
+SCHEMA_VERSION = 1
+DEFAULT_THRESHOLD = 0.10
+
+HANDLER_SAMPLES = {
+    "string": ("Sensitive Data Value", {"size_anonymization": 0.7}),
+    "email": ("jhondoe@example.com", {}),
+    "phone": ("+55 (11) 91234-5678", {}),
+    "number": ("My phone is 1234567890", {}),
+    "name": ("Jhon Doe", {}),
+    "cpf": ("529.982.247-25", {}),
+    "cnpj": ("11.222.333/0001-81", {}),
+    "rg": ("12.345.678-9", {}),
+    "cep": ("12345-678", {}),
+    "pis": ("689.37232.86-5", {}),
+    "pii_text": ("Ticket of Jhon, CPF 529.982.247-25, call (11) 91234-5678", {}),
+}
+DEFAULT_SAMPLE = ("Sensitive Data Value", {})
+
+RECORD = {
+    "name": "Jhon Doe",
+    "email": "jhondoe@example.com",
+    "cpf": "529.982.247-25",
+    "phone": "+55 (11) 91234-5678",
+    "cep": "12345-678",
+    "tags": ["vip", "newsletter", "beta"],
+    "address": {"street": "Rua das Flores", "number": "123", "city": "São Paulo"},
+}
+SELECTED_KEYS = ["name", "email", "address"]
+
+
+@dataclass(frozen=True, slots=True)
+class Result:
+    """Measurement of a single case."""
+
+    ns_per_op: float
+    ops_per_s: float
+    peak_kib: float
+    items: int = 1
+
+    @property
+    def ns_per_item(self) -> float:
+        return self.ns_per_op / self.items
+
+
+@dataclass(frozen=True, slots=True)
+class Comparison:
+    """A case present in both the current results and the baseline."""
+
+    name: str
+    baseline_ns: float
+    current_ns: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_ns / self.baseline_ns if self.baseline_ns else 1.0
+
+    def is_regression(self, threshold: float) -> bool:
+        return self.ratio > 1 + threshold
+
+
+type Case = tuple[Callable[[], Any], int]
+
+
+def nested(depth: int, leaf: Any) -> dict[str, Any]:
+    """Builds `depth` levels of dictionaries and lists around `leaf`."""
+    value = leaf
+    for level in range(depth):
+        value = {f"level{level}": [value, "Sensitive"]} if level % 2 else {"k": value}
+    return value
+
+
+def handler_cases() -> Iterator[tuple[str, Case]]:
+    """One case per registered handler, so new handlers are benchmarked automatically."""
+    dispatch = MaskDispatch()
+    for handler in dict.fromkeys(MaskDispatch._handlers.values()):
+        type_masks = MaskDispatch.type_masks_of(handler)
+        type_mask = next(
+            (name for name in type_masks if name in HANDLER_SAMPLES), type_masks[0]
+        )
+        value, options = HANDLER_SAMPLES.get(type_mask, DEFAULT_SAMPLE)
+        yield (
+            f"handler/{type_mask}",
+            (lambda t=type_mask, v=value, o=options: dispatch.mask(t, v, **o), 1),
+        )
+
+
+def bytes_handler_cases() -> Iterator[tuple[str, Case]]:
+    """One case per bytes handler, on the UTF-8 encoding of the handler samples."""
+    type_masks_of: dict[Callable, list[str]] = {}
+    for type_mask, handler in MaskDispatch._bytes_handlers.items():
+        type_masks_of.setdefault(handler, []).append(type_mask)
+    for type_masks in type_masks_of.values():
+        type_mask = next(
+            (name for name in type_masks if name in HANDLER_SAMPLES), type_masks[0]
+        )
+        value, options = HANDLER_SAMPLES.get(type_mask, DEFAULT_SAMPLE)
+        data = value.encode()
+        yield (
+            f"bytes/{type_mask}",
+            (lambda t=type_mask, d=data, o=options: anonymize_bytes(d, t, **o), 1),
+        )
+
+
+def structure_cases() -> Iterator[tuple[str, Case]]:
+    small_list = list(RECORD["tags"]) * 3
+    big_list = [dict(RECORD) for _ in range(100)]
+    deep = nested(30, dict(RECORD))
+
+    yield "MaskStr/small", (lambda: MaskStr("Sensitive Data Value").anonymize(), 1)
+    yield "MaskList/small", (lambda: MaskList(small_list).anonymize(), len(small_list))
+    yield "MaskList/records_100", (lambda: MaskList(big_list).anonymize(), 100)
+    yield "MaskDict/small", (lambda: MaskDict(RECORD).anonymize(), 1)
+    yield "MaskDict/nested_30", (lambda: MaskDict(deep).anonymize(), 1)
+    yield (
+        "MaskDict/key_with_type_mask",
+        (lambda: MaskDict(RECORD, key_with_type_mask=True).anonymize(), 1),
+    )
+    camel_case = {
+        f"customer_{key}".title().replace("_", ""): value
+        for key, value in RECORD.items()
+    }
+    yield (
+        "MaskDict/key_with_type_mask_normalized",
+        (lambda: MaskDict(camel_case, key_with_type_mask=True).anonymize(), 1),
+    )
+    yield (
+        "MaskDict/selected_keys",
+        (lambda: MaskDict(RECORD, selected_keys=SELECTED_KEYS).anonymize(), 1),
+    )
+    yield "anonymize_value/nested_30", (lambda: anonymize_value(deep), 1)
+    mixed = {
+        "customer": OrderedDict(RECORD),
+        "tags": tuple(RECORD["tags"]),
+        "groups": frozenset(RECORD["tags"]),
+    }
+    yield "anonymize_value/mixed_types", (lambda: anonymize_value(mixed), 1)
+
+
+def strategy_cases() -> Iterator[tuple[str, Case]]:
+    strategies = {
+        "default": DefaultDictAnonymizationStrategy(anonymize_value),
+        "key_based": KeyBasedDictAnonymizationStrategy(SELECTED_KEYS, anonymize_value),
+        "key_as_type_mask": KeyAsTypeMaskDictAnonymizationStrategy(anonymize_value),
+        "path": PathDictAnonymizationStrategy(SELECTED_KEYS, anonymize_value),
+    }
+    for name, strategy in strategies.items():
+        yield f"strategy/{name}", (lambda s=strategy: s.anonymize(RECORD), 1)
+
+
+def scaling_cases() -> Iterator[tuple[str, Case]]:
+    """The same work at growing sizes, compare `ns_per_item` to spot non-linear growth."""
+    for size in (10, 100, 1000):
+        records = [dict(RECORD) for _ in range(size)]
+        yield f"scaling/width_{size}", (lambda r=records: MaskList(r).anonymize(), size)
+    for depth in (10, 100, 10_000):
+        deep = nested(depth, "Sensitive")
+        yield f"scaling/depth_{depth}", (lambda d=deep: anonymize_value(d), depth)
+    scanner = PiiScanner()
+    sentence = "Customer asked about order 4412, CPF 529.982.247-25, CEP 12345-678. "
+    for size in (1, 10, 100):
+        text = sentence * size
+        yield (
+            f"scaling/text_{len(text)}",
+            (lambda t=text: scanner.anonymize(t), len(text)),
+        )
+
+
+def all_cases() -> Iterator[tuple[str, Case]]:
+    yield from handler_cases()
+    yield from bytes_handler_cases()
+    yield from structure_cases()
+    yield from strategy_cases()
+    yield from scaling_cases()
+
+
+def measure(
+    func: Callable[[], Any], items: int, repeat: int, min_time: float
+) -> Result:
+    timer = timeit.Timer(func)
+    number = 1
+    while (elapsed := timer.timeit(number)) < min_time:
+        number *= max(2, min(10, int(min_time / elapsed) + 1)) if elapsed else 10
+    best = min([elapsed, *timer.repeat(repeat - 1, number)]) / number
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Result(best * 1e9, 1 / best, peak / 1024, items)
+
+
+def run(
+    pattern: str = "", repeat: int = 5, min_time: float = 0.05
+) -> dict[str, Result]:
+    return {
+        name: measure(func, items, repeat, min_time)
+        for name, (func, items) in all_cases()
+        if pattern in name
+    }
+
+
+def to_json(results: dict[str, Result]) -> dict[str, Any]:
+    return {
+        "schema": SCHEMA_VERSION,
+        "created": datetime.now(UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "results": {name: asdict(result) for name, result in results.items()},
+    }
+
+
+def compare(results: dict[str, Result], baseline: dict[str, Any]) -> list[Comparison]:
+    """Pairs the current results with the cases of a baseline saved by `to_json`."""
+    saved = baseline.get("results", {})
+    return [
+        Comparison(name, saved[name]["ns_per_op"], result.ns_per_op)
+        for name, result in results.items()
+        if name in saved
+    ]
+
+
+def print_results(results: dict[str, Result]) -> None:
+    print(f"{'case':<32} {'ns/op':>12} {'ns/item':>10} {'ops/s':>12} {'peak KiB':>9}")
+    for name, result in results.items():
+        print(
+            f"{name:<32} {result.ns_per_op:>12.0f} {result.ns_per_item:>10.0f} "
+            f"{result.ops_per_s:>12.0f} {result.peak_kib:>9.1f}"
+        )
+
+
+def print_comparison(comparisons: list[Comparison], threshold: float) -> None:
+    print(f"\n{'case':<32} {'baseline':>12} {'current':>12} {'ratio':>7}")
+    for item in comparisons:
+        flag = "  REGRESSION" if item.is_regression(threshold) else ""
+        print(
+            f"{item.name:<32} {item.baseline_ns:>12.0f} {item.current_ns:>12.0f} "
+            f"{item.ratio:>6.2f}x{flag}"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--filter", default="", help="Run only cases containing TEXT")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05)
+    parser.add_argument("--output", type=Path, help="Save the results as JSON")
+    parser.add_argument("--baseline", type=Path, help="JSON results to compare with")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed slowdown before failing, as a fraction (default is 0.1)",
+    )
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = run(args.filter, args.repeat, args.min_time)
+    print_results(results)
+    print(f"\n{len(results)} cases in {time.perf_counter() - start:.1f}s")
+
+    if args.output:
+        args.output.write_text(json.dumps(to_json(results), indent=2) + "\n")
+
+    if args.baseline:
+        comparisons = compare(results, json.loads(args.baseline.read_text()))
+        print_comparison(comparisons, args.threshold)
+        regressions = [c for c in comparisons if c.is_regression(args.threshold)]
+        if regressions:
+            print(f"\n{len(regressions)} regressions above {args.threshold:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,8 +7,31 @@ Classes:
     MaskList: Class for anonymizing list with sensitive data
     MaskDict: Class for anonymizing dict with sensitive data
 
+Functions:
+    anonymize_value: Anonymizes a str, list or dict without creating the mask classes
+    anonymize_in_place: Anonymizes a list or dict by replacing its values instead of copying it
+
+The names are imported from `anonymizer_data.core` on first use, so `import anonymizer_data`
+stays cheap and registers no handler until a value is masked.
+
 """
 
-from .core import MaskDict, MaskList, MaskStr
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .core import MaskDict, MaskList, MaskStr, anonymize_in_place, anonymize_value
+
+__all__ = ["MaskStr", "MaskDict", "MaskList", "anonymize_in_place", "anonymize_value"]
+
+
+def __getattr__(name: str) -> object:
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from . import core
+
+    value = getattr(core, name)
+    globals()[name] = value
+    return value
+
 
-__all__ = ["MaskStr", "MaskDict", "MaskList"]
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,195 @@
+"""
+Asyncio entry points for anonymizing inside event-loop services without blocking the loop.
+
+Functions:
+    anonymize_async: Awaitable anonymization of a value, offloaded in chunks to an executor.
+    aiter_anonymize: Async generator anonymizing the records of a (async) iterable in order.
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from concurrent.futures import Executor
+from functools import partial
+from itertools import islice
+from typing import Any
+
+from .batch import _anonymize_records
+from .core.dispatcher import anonymize_value
+from .core.plan import MaskDictPlan
+
+DEFAULT_CHUNK_SIZE = 1000
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+def _anonymize_piece(piece: Any, plan: MaskDictPlan, options: dict[str, Any]) -> Any:
+    """Runs in the executor, so it only receives picklable arguments."""
+    if type(piece) is dict:
+        return plan.anonymize(piece)
+    return _anonymize_records(piece, plan, options)
+
+
+def _split(value: Any, chunk_size: int) -> list[Any]:
+    """Splits the top level of a `dict` or `list` into pieces of `chunk_size` items."""
+    if type(value) is dict:
+        items = iter(value.items())
+        return list(iter(lambda: dict(islice(items, chunk_size)), {}))
+    return [
+        value[start : start + chunk_size] for start in range(0, len(value), chunk_size)
+    ]
+
+
+def _join(pieces: list[Any], like: Any) -> Any:
+    if type(like) is dict:
+        return {key: item for piece in pieces for key, item in piece.items()}
+    return [item for piece in pieces for item in piece]
+
+
+async def _run(
+    func: Any, offload: bool, executor: Executor | None, semaphore: asyncio.Semaphore
+) -> Any:
+    async with semaphore:
+        if offload:
+            return await asyncio.get_running_loop().run_in_executor(executor, func)
+        result = func()
+        await asyncio.sleep(0)
+        return result
+
+
+async def anonymize_async(
+    value: Any,
+    *,
+    executor: Executor | None = None,
+    offload: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    **options: Any,
+) -> Any:
+    """
+    Awaitable version of `anonymize_value`, for use inside coroutines.
+
+    The work runs in `executor` (the default executor of the loop when None). A `dict` or
+    `list` with more than `chunk_size` top-level items is split into chunks, with at most
+    `max_concurrency` of them running at a time. With `offload=False` the chunks run in the
+    loop thread, yielding to other tasks after each one. The result is identical to
+    `anonymize_value(value, **options)`.
+
+    Parameters:
+        value (Any): The value to anonymize, usually a `dict` or `list`.
+        executor (Optional[Executor]): Executor of the chunks, such as a `ThreadPoolExecutor`
+            or a `ProcessPoolExecutor`.
+        offload (Optional[bool]): If false, runs in the loop thread yielding between chunks.
+        chunk_size (Optional[int]): Top-level items per chunk (default is 1000).
+        max_concurrency (Optional[int]): Chunks running at the same time (default is 4).
+        **options: Options accepted by `anonymize_value`, such as `key_with_type_mask`,
+            `selected_keys` and `size_anonymization`.
+
+    Returns:
+        Any: The anonymized value.
+
+    Examples:
+        >>> await anonymize_async({"cpf": "529.982.247-25"}, key_with_type_mask=True)
+        {'cpf': '***.982.***-**'}
+
+    Raises:
+        ValueError: The 'size_anonymization' field must be between 0 and 1.
+        ValueError: The 'size_anonymization' must be a float.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    if type(value) not in (dict, list) or len(value) <= chunk_size:
+        return await _run(
+            partial(anonymize_value, value, **options), offload, executor, semaphore
+        )
+
+    plan = MaskDictPlan.compile(**options)
+    pieces = await asyncio.gather(
+        *(
+            _run(
+                partial(_anonymize_piece, piece, plan, options),
+                offload,
+                executor,
+                semaphore,
+            )
+            for piece in _split(value, chunk_size)
+        )
+    )
+    return _join(pieces, value)
+
+
+async def _chunks(
+    records: AsyncIterable[Any] | Iterable[Any], chunk_size: int
+) -> AsyncIterator[list[Any]]:
+    chunk: list[Any] = []
+    if isinstance(records, AsyncIterable):
+        async for record in records:
+            chunk.append(record)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    else:
+        for record in records:
+            chunk.append(record)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+async def aiter_anonymize(
+    records: AsyncIterable[Any] | Iterable[Any],
+    *,
+    executor: Executor | None = None,
+    offload: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    **options: Any,
+) -> AsyncIterator[Any]:
+    """
+    Anonymize the records of `records` in chunks, yielding them in input order.
+
+    Records are read while earlier chunks are being anonymized in `executor`, with at most
+    `max_concurrency` chunks in flight, so memory stays bounded for endless sources such as
+    message queues. Each record is anonymized as `MaskDict(record, **options)` would.
+
+    Parameters:
+        records (AsyncIterable[Any] | Iterable[Any]): Records to anonymize.
+        executor (Optional[Executor]): Executor of the chunks, the default executor of the
+            loop when None. A `ProcessPoolExecutor` must be created with an `initializer` that
+            calls `Config.setup` if the global configuration was changed.
+        offload (Optional[bool]): If false, runs in the loop thread yielding between chunks.
+        chunk_size (Optional[int]): Records per chunk (default is 1000).
+        max_concurrency (Optional[int]): Chunks in flight at the same time (default is 4).
+        **options: Options accepted by `MaskDict`, such as `key_with_type_mask`,
+            `selected_keys` and `size_anonymization`.
+
+    Returns:
+        AsyncIterator[Any]: The anonymized records.
+
+    Examples:
+        >>> async for record in aiter_anonymize(queue_reader(), selected_keys=["cpf"]):
+        ...     await publish(record)
+
+    Raises:
+        ValueError: The 'size_anonymization' field must be between 0 and 1.
+        ValueError: The 'size_anonymization' must be a float.
+    """
+    plan = MaskDictPlan.compile(**options)  # also validates them before reading records
+    semaphore = asyncio.Semaphore(max_concurrency)
+    pending: deque[asyncio.Task[list[Any]]] = deque()
+
+    try:
+        async for chunk in _chunks(records, chunk_size):
+            job = partial(_anonymize_records, chunk, plan, options)
+            pending.append(
+                asyncio.ensure_future(_run(job, offload, executor, semaphore))
+            )
+            if len(pending) >= max_concurrency:
+                for record in await pending.popleft():
+                    yield record
+        while pending:
+            for record in await pending.popleft():
+                yield record
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,160 @@
+"""
+Parallel anonymization of large batches of records over a process pool.
+
+Functions:
+    anonymize_batch: Anonymize records in parallel and return them in input order.
+    iter_anonymize_batch: Lazily anonymize records in parallel, yielding them in input order.
+"""
+
+import multiprocessing
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import batched
+from typing import Any
+
+from .core.config import Config
+from .core.dispatcher import anonymize_value
+from .core.plan import MaskDictPlan
+from .handlers.dispatch import MaskDispatch
+from .handlers.keys import KeyRules
+
+DEFAULT_CHUNK_SIZE = 1000
+
+_worker_plan: MaskDictPlan | None = None
+_worker_options: dict[str, Any] = {}
+
+
+def _config_state() -> dict[str, Any]:
+    return {
+        "mask_char": Config.default_mask_char,
+        "strict_mode": Config.strict_mode,
+        "fallback_masking": Config.fallback_masking,
+        "validation_cache_size": Config.validation_cache_size,
+        "result_cache_size": Config.result_cache_size,
+    }
+
+
+def _anonymize_records(
+    records: Iterable[Any], plan: MaskDictPlan, options: dict[str, Any]
+) -> list[Any]:
+    anonymize_dict = plan.anonymize
+    return [
+        anonymize_dict(record)
+        if type(record) is dict
+        else anonymize_value(record, **options)
+        for record in records
+    ]
+
+
+def _init_worker(
+    options: dict[str, Any], config_state: dict[str, Any], key_rules: KeyRules
+) -> None:
+    """
+    Runs once per worker process: restores `Config` and the key rules, and compiles the
+    plan.
+    """
+    global _worker_plan, _worker_options
+
+    Config.setup(**config_state)
+    if key_rules != MaskDispatch.key_rules:
+        MaskDispatch.set_key_rules(key_rules)
+    _worker_options = options
+    _worker_plan = MaskDictPlan.compile(**options)
+
+
+def _anonymize_chunk(chunk: tuple[Any, ...]) -> list[Any]:
+    assert _worker_plan is not None, "worker was not initialized"
+    return _anonymize_records(chunk, _worker_plan, _worker_options)
+
+
+def _iter_pool(
+    records: Iterable[Any],
+    workers: int,
+    chunk_size: int,
+    mp_context: str | None,
+    options: dict[str, Any],
+) -> Iterator[Any]:
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context(mp_context),
+        initializer=_init_worker,
+        initargs=(options, _config_state(), MaskDispatch.key_rules),
+    ) as executor:
+        pending: deque[Future[list[Any]]] = deque()
+        for chunk in batched(records, chunk_size):
+            pending.append(executor.submit(_anonymize_chunk, chunk))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def iter_anonymize_batch(
+    records: Iterable[Any],
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    mp_context: str | None = None,
+    **options: Any,
+) -> Iterator[Any]:
+    """
+    Lazily anonymize `records` over a pool of processes, yielding them in input order.
+
+    Records are sent to the workers in chunks of `chunk_size`, and at most two chunks per
+    worker are in flight, so memory stays bounded for arbitrarily long iterables. Workers
+    receive only the options and the current `Config`, handlers are resolved by their
+    `type_mask` inside each process, so any start method (including "spawn") is supported.
+
+    Parameters:
+        records (Iterable[Any]): Records to anonymize, usually `dict` or `list` values.
+        workers (Optional[int]): Number of processes, defaults to `os.cpu_count()`. With 1 the
+            records are anonymized in the current process.
+        chunk_size (Optional[int]): Number of records sent to a worker at a time (default is 1000).
+        mp_context (Optional[str]): Start method of the processes, such as "spawn" or "fork".
+        **options: Options accepted by `MaskDict`, such as `key_with_type_mask`,
+            `selected_keys` and `size_anonymization`.
+
+    Returns:
+        Iterator[Any]: The anonymized records.
+
+    Note:
+        Custom handlers must be registered in an importable module (not in `__main__` or
+        interactively) to be available to "spawn" workers.
+
+    Raises:
+        ValueError: The 'size_anonymization' field must be between 0 and 1.
+        ValueError: The 'size_anonymization' must be a float.
+    """
+    plan = MaskDictPlan.compile(**options)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        return (
+            record
+            for chunk in batched(records, chunk_size)
+            for record in _anonymize_records(chunk, plan, options)
+        )
+    return _iter_pool(records, workers, chunk_size, mp_context, options)
+
+
+def anonymize_batch(
+    records: Iterable[Any],
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    mp_context: str | None = None,
+    **options: Any,
+) -> list[Any]:
+    """
+    Anonymize `records` over a pool of processes and return them in input order.
+
+    Same as `iter_anonymize_batch`, but collects the results in a list.
+
+    Examples:
+        >>> from anonymizer_data.batch import anonymize_batch
+        >>> anonymize_batch([{"cpf": "529.982.247-25"}], workers=2, key_with_type_mask=True)
+        [{'cpf': '***.982.***-**'}]
+    """
+    return list(
+        iter_anonymize_batch(records, workers, chunk_size, mp_context, **options)
+    )
@@ -1,15 +1,69 @@
+import io
 import os
+import sys
+import time
+from collections.abc import Callable, Iterator
+from contextlib import ExitStack, contextmanager, nullcontext
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated, BinaryIO, TextIO
 
-from rich.console import Console
-from typer import Typer, Argument
+from typer import Argument, BadParameter, Option, Typer
+from typer.core import TyperGroup
 
-from anonymizer_data.core import MaskStr
+if TYPE_CHECKING:
+    from click import Context
+    from rich.console import Console
 
-console = Console(color_system=None if os.environ.get("NO_COLOR") else "auto")
-app = Typer()
+    from anonymizer_data.core import MaskDictPlan
 
+STDIO_PATH = Path("-")
+OUTPUT_BUFFER_SIZE = 1024 * 1024
 
-@app.command()
+
+class DefaultCommandGroup(TyperGroup):
+    """
+    Runs `default_command` when the first argument is not a subcommand, is the only
+    argument, or is `--`, so a single value is masked even if it is a command name.
+    """
+
+    default_command = "string"
+
+    def parse_args(self, ctx: "Context", args: list[str]) -> list[str]:
+        if args and (
+            args[0] == "--"
+            or (
+                not args[0].startswith("-")
+                and (len(args) == 1 or args[0] not in self.commands)
+            )
+        ):
+            args.insert(0, self.default_command)
+        return super().parse_args(ctx, args)
+
+
+app = Typer(
+    cls=DefaultCommandGroup,
+    help="Anonymize a VALUE, or stream files with the commands below. A VALUE that is the "
+    "name of a command (string, log, jsonl, csv) and is followed by other arguments, or "
+    "that starts with '-', runs that command or option instead, use "
+    "'anonymize -- VALUE' to mask it.",
+)
+
+
+@cache
+def _console(stderr: bool = False) -> "Console":
+    """
+    Returns the console that prints to stdout, or to stderr, created on first use so that
+    rich is only imported by the commands that print with it.
+    """
+    from rich.console import Console
+
+    return Console(
+        stderr=stderr, color_system=None if os.environ.get("NO_COLOR") else "auto"
+    )
+
+
+@app.command("string")
 def anonymize(
     value: str = Argument(help="The string you want to anonymize"),
     type_mask: str = Argument(default="string", help="The type mask to use"),
@@ -18,9 +72,233 @@ def anonymize(
     ),
 ) -> None:
     """
-    cli anonymization string
+    cli anonymization string, used by default when no command is given. Use
+    'anonymize -- VALUE' for a value that starts with '-'
     """
+    from anonymizer_data.core import MaskStr
+
     string_mask = MaskStr(
         value, type_mask, size_anonymization=size_anonymization
     ).anonymize()
-    console.print(string_mask, style="#ccc010 bold")
+    _console().print(string_mask, style="#ccc010 bold")
+
+
+@app.command("log")
+def anonymize_log(
+    input_path: Annotated[
+        Path,
+        Argument(help="Text file to read, memory-mapped", exists=True, dir_okay=False),
+    ],
+    output_path: Annotated[
+        Path, Option("--output", "-o", help="File to write, '-' for stdout")
+    ] = STDIO_PATH,
+    type_masks: Annotated[
+        list[str] | None,
+        Option(
+            "--type",
+            "-t",
+            help="Look only for this type mask, can be repeated",
+            show_default=False,
+        ),
+    ] = None,
+) -> None:
+    """
+    cli anonymization of the sensitive values of a large text file, such as a log
+    """
+    from anonymizer_data.handlers import PiiScanner
+    from anonymizer_data.streams import anonymize_log_file
+
+    try:
+        scanner = PiiScanner(type_masks or None)
+    except ValueError as error:
+        raise BadParameter(str(error), param_hint="--type") from error
+
+    with ExitStack() as stack:
+        target: BinaryIO = (
+            sys.stdout.buffer
+            if output_path == STDIO_PATH
+            else stack.enter_context(
+                output_path.open("wb", buffering=OUTPUT_BUFFER_SIZE)
+            )
+        )
+        start = time.perf_counter()
+        total = anonymize_log_file(input_path, target, scanner)
+        target.flush()
+        elapsed = time.perf_counter() - start
+
+    mebibytes = input_path.stat().st_size / 2**20
+    rate = mebibytes / elapsed if elapsed else 0.0
+    _console(stderr=True).print(
+        f"{total} values masked in {mebibytes:.1f} MiB, "
+        f"{elapsed:.2f}s ({rate:.0f} MiB/s)",
+        style="bold",
+    )
+
+
+@app.command("jsonl")
+def anonymize_jsonl_file(
+    input_path: Annotated[
+        Path, Option("--input", "-i", help="JSON Lines file to read, '-' for stdin")
+    ] = STDIO_PATH,
+    output_path: Annotated[
+        Path, Option("--output", "-o", help="File to write, '-' for stdout")
+    ] = STDIO_PATH,
+    keys: Annotated[
+        list[str] | None,
+        Option(
+            "--key",
+            "-k",
+            help="Anonymize only this key, can be repeated",
+            show_default=False,
+        ),
+    ] = None,
+    key_with_type_mask: Annotated[
+        bool, Option("--key-with-type-mask", help="Use each key as the type mask")
+    ] = False,
+    paths: Annotated[
+        list[str] | None,
+        Option(
+            "--path",
+            "-p",
+            help="Anonymize only this path, as PATH or PATH=TYPE_MASK, can be repeated",
+            show_default=False,
+        ),
+    ] = None,
+    size_anonymization: Annotated[
+        float | None, Option(help="The size anonymization factor")
+    ] = None,
+    profile_path: Annotated[
+        Path | None,
+        Option(
+            "--profile",
+            help="Write the time of each key path and handler to this file as "
+            "collapsed stacks for flame graph tools, and print the hot spots on stderr",
+            dir_okay=False,
+        ),
+    ] = None,
+) -> None:
+    """
+    cli anonymization of JSON Lines records, streamed with constant memory
+    """
+    from anonymizer_data.core import MaskDict, PathSelector, Profiler
+    from anonymizer_data.streams import anonymize_jsonl
+
+    options = {}
+    if size_anonymization is not None:
+        options["size_anonymization"] = size_anonymization
+    if paths and (keys or key_with_type_mask):
+        raise BadParameter("--path cannot be used with --key or --key-with-type-mask")
+    if paths and profile_path:
+        raise BadParameter("--path cannot be used with --profile")
+
+    try:
+        plan: MaskDictPlan | PathSelector = (
+            PathSelector.compile(_path_type_masks(paths), **options)
+            if paths
+            else MaskDict.compile(key_with_type_mask, keys or None, **options)
+        )
+    except ValueError as error:
+        raise BadParameter(str(error)) from error
+
+    with (
+        _open_streams(input_path, output_path) as (source, target),
+        Profiler() if profile_path else nullcontext() as profiler,
+    ):
+        _run_stream(lambda: anonymize_jsonl(source, target, plan), target)
+
+    if profiler is not None and profile_path is not None:
+        with profile_path.open("w", encoding="utf-8") as file:
+            profiler.write_collapsed(file)
+        _console(stderr=True).print(profiler.report(), highlight=False)
+
+
+@app.command("csv")
+def anonymize_csv_file(
+    columns: Annotated[
+        list[str],
+        Argument(
+            help="Columns to anonymize as COLUMN=TYPE_MASK, or COLUMN to use its name"
+        ),
+    ],
+    input_path: Annotated[
+        Path, Option("--input", "-i", help="CSV file to read, '-' for stdin")
+    ] = STDIO_PATH,
+    output_path: Annotated[
+        Path, Option("--output", "-o", help="File to write, '-' for stdout")
+    ] = STDIO_PATH,
+    delimiter: Annotated[
+        str, Option("--delimiter", "-d", help="The field delimiter")
+    ] = ",",
+) -> None:
+    """
+    cli anonymization of CSV columns, streamed with constant memory
+    """
+    from anonymizer_data.streams import anonymize_csv
+
+    mapping: dict[str, str] = {}
+    for option in columns:
+        column, separator, type_mask = option.partition("=")
+        mapping[column] = type_mask if separator else column
+
+    with _open_streams(input_path, output_path, newline="") as (source, target):
+        _run_stream(
+            lambda: anonymize_csv(source, target, mapping, delimiter=delimiter),
+            target,
+        )
+
+
+def _path_type_masks(paths: list[str]) -> dict[str, str | None]:
+    """Splits each PATH=TYPE_MASK option, a PATH alone uses the default type mask."""
+    type_masks: dict[str, str | None] = {}
+    for option in paths:
+        path, _, type_mask = option.rpartition("=")
+        if path and type_mask.isidentifier():
+            type_masks[path] = type_mask
+        else:
+            type_masks[option] = None
+    return type_masks
+
+
+@contextmanager
+def _open_streams(
+    input_path: Path, output_path: Path, newline: str | None = None
+) -> Iterator[tuple[TextIO, TextIO]]:
+    """Opens the input and the output, using stdin and stdout for '-'."""
+    with ExitStack() as stack:
+        if input_path != STDIO_PATH:
+            source = stack.enter_context(
+                input_path.open(encoding="utf-8", newline=newline)
+            )
+        else:
+            source = sys.stdin
+            if newline is not None and isinstance(source, io.TextIOWrapper):
+                source.reconfigure(newline=newline)
+        target = (
+            sys.stdout
+            if output_path == STDIO_PATH
+            else stack.enter_context(
+                output_path.open(
+                    "w",
+                    encoding="utf-8",
+                    newline=newline,
+                    buffering=OUTPUT_BUFFER_SIZE,
+                )
+            )
+        )
+        yield source, target
+
+
+def _run_stream(stream: Callable[[], int], target: TextIO) -> None:
+    """Runs `stream` and reports the throughput on stderr."""
+    start = time.perf_counter()
+    try:
+        total = stream()
+    except (TypeError, ValueError) as error:
+        raise BadParameter(str(error), param_hint="--input") from error
+    target.flush()
+    elapsed = time.perf_counter() - start
+
+    rate = total / elapsed if elapsed else 0.0
+    _console(stderr=True).print(
+        f"{total} records in {elapsed:.2f}s ({rate:.0f} records/s)", style="bold"
+    )
@@ -1,7 +1,28 @@
-from .dispatcher import dispatch_value_mask
+from .dispatcher import anonymize_in_place, anonymize_value, dispatch_value_mask
 from .base import MaskBase
 from .dict import MaskDict
 from .list import MaskList
+from .paths import PathSelector
+from .plan import MaskDictPlan, ValuePlan
+from .profile import Profiler
+from .registry import TypeMasker, TypeRegistry
 from .string import MaskStr
+from .view import MaskDictView, MaskListView
 
-__all__ = ["dispatch_value_mask", "MaskBase", "MaskDict", "MaskList", "MaskStr"]
+__all__ = [
+    "anonymize_in_place",
+    "anonymize_value",
+    "dispatch_value_mask",
+    "MaskBase",
+    "MaskDict",
+    "MaskDictPlan",
+    "MaskDictView",
+    "MaskList",
+    "MaskListView",
+    "MaskStr",
+    "PathSelector",
+    "Profiler",
+    "TypeMasker",
+    "TypeRegistry",
+    "ValuePlan",
+]
@@ -0,0 +1,97 @@
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a `LRUCache`, in the same shape as `functools.lru_cache`."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+MISSING: Any = object()
+
+
+class LRUCache[K, V]:
+    """
+    Bounded mapping that evicts the least recently used entry when full.
+
+    Unlike `functools.lru_cache`, the size can be changed at any time, which lets it follow
+    the values configured in `Config`. A `maxsize` of 0 disables the cache.
+
+    Examples:
+        >>> cache = LRUCache[str, bool](maxsize=2)
+        >>> cache.put("a", True)
+        >>> cache.get("a")
+        True
+        >>> cache.get("b", MISSING) is MISSING
+        True
+        >>> cache.info()
+        CacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+    """
+
+    __slots__ = ("_data", "_maxsize", "hits", "misses")
+
+    def __init__(self, maxsize: int = 0) -> None:
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self._maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._evict()
+
+    def get(self, key: K, default: Any = None) -> V | Any:
+        """Returns the value of `key`, marking it as recently used."""
+        try:
+            value = self._data[key]
+            self._data.move_to_end(key)
+        except KeyError:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        """Stores `value`, evicting the least recently used entries if needed."""
+        if self._maxsize <= 0:
+            return
+        self._data[key] = value
+        self._data.move_to_end(key)
+        self._evict()
+
+    def clear(self) -> None:
+        """Removes every entry and resets the statistics."""
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self._maxsize, len(self._data))
+
+    def _evict(self) -> None:
+        data = self._data
+        while len(data) > max(self._maxsize, 0):
+            try:
+                data.popitem(last=False)
+            except KeyError:
+                break
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
@@ -4,6 +4,9 @@ class Config:
     default_mask_char: str = "*"
     strict_mode: bool = False
     fallback_masking: bool = True
+    validation_cache_size: int = 0
+    result_cache_size: int = 0
+    metrics: bool = False
 
     @classmethod
     def setup(
@@ -11,8 +14,14 @@ class Config:
         mask_char: str = "*",
         strict_mode: bool = False,
         fallback_masking: bool = True,
+        validation_cache_size: int = 0,
+        result_cache_size: int = 0,
+        metrics: bool = False,
     ) -> None:
         """Helper to configure global settings."""
         cls.default_mask_char = mask_char
         cls.strict_mode = strict_mode
         cls.fallback_masking = fallback_masking
+        cls.validation_cache_size = validation_cache_size
+        cls.result_cache_size = result_cache_size
+        cls.metrics = metrics
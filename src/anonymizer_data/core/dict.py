@@ -6,7 +6,13 @@ from .dict_strategy import (
     DictAnonymizationStrategy,
     KeyAsTypeMaskDictAnonymizationStrategy,
     KeyBasedDictAnonymizationStrategy,
+    PathDictAnonymizationStrategy,
 )
+from .dispatcher import _child_options, anonymize_in_place, anonymize_value
+from .paths import SelectedPaths
+from .plan import MaskDictPlan
+from .profile import Profiler
+from .view import MaskDictView, compile_resolver
 
 type DataDict = dict[str, Any]
 
@@ -19,40 +25,103 @@ class MaskDict(MaskBase[DataDict]):
         value: DataDict,
         key_with_type_mask: bool = False,
         selected_keys: list[str] | None = None,
+        in_place: bool = False,
+        lazy: bool = False,
+        selected_paths: SelectedPaths | None = None,
         **kwargs: Any,
     ) -> None:
+        if in_place and lazy:
+            raise ValueError(
+                "The 'in_place' and 'lazy' options cannot be used together."
+            )
+        if selected_paths is not None and (
+            key_with_type_mask or selected_keys or in_place or lazy
+        ):
+            raise ValueError(
+                "The 'selected_paths' option cannot be used with 'key_with_type_mask', "
+                "'selected_keys', 'in_place' or 'lazy'."
+            )
         super().__init__(value)
         self._extra = kwargs
+        self._in_place = in_place
+        self._dict_options: dict[str, Any] = {
+            "key_with_type_mask": key_with_type_mask,
+            "selected_keys": selected_keys,
+        }
+        self._lazy: MaskDictView | None = self._get_lazy_view() if lazy else None
         self._strategy: DictAnonymizationStrategy = self._get_strategy(
-            key_with_type_mask, selected_keys, **kwargs
+            key_with_type_mask, selected_keys, selected_paths, **kwargs
         )
 
     def _get_strategy(
         self,
         key_with_type_mask: bool,
         selected_keys: list[str] | None,
+        selected_paths: SelectedPaths | None = None,
         **kwargs: Any,
     ) -> DictAnonymizationStrategy:
-        from .dispatcher import dispatch_value_mask
-
+        if selected_paths is not None:
+            return PathDictAnonymizationStrategy(
+                selected_paths, anonymize_value, **kwargs
+            )
         if key_with_type_mask:
-            return KeyAsTypeMaskDictAnonymizationStrategy(dispatch_value_mask, **kwargs)
+            return KeyAsTypeMaskDictAnonymizationStrategy(anonymize_value, **kwargs)
         if selected_keys:
             return KeyBasedDictAnonymizationStrategy(
-                selected_keys, dispatch_value_mask, **kwargs
+                selected_keys, anonymize_value, **kwargs
             )
-        return DefaultDictAnonymizationStrategy(dispatch_value_mask, **kwargs)
+        return DefaultDictAnonymizationStrategy(anonymize_value, **kwargs)
 
     def with_keys(self, keys: list[str]) -> "MaskDict":
         """Reconfigures the dictionary mask to use only the specified keys."""
-        from .dispatcher import dispatch_value_mask
-
+        self._dict_options = {"key_with_type_mask": False, "selected_keys": keys}
+        if self._lazy is not None:
+            self._lazy = self._get_lazy_view()
         self._strategy = KeyBasedDictAnonymizationStrategy(
-            keys, dispatch_value_mask, **self._extra
+            keys, anonymize_value, **self._extra
         )
         return self
 
+    def _get_lazy_view(self) -> MaskDictView:
+        return MaskDictView(
+            self._value, compile_resolver(**self._dict_options, **self._extra)
+        )
+
+    @classmethod
+    def compile(
+        cls,
+        key_with_type_mask: bool = False,
+        selected_keys: list[str] | None = None,
+        **kwargs: Any,
+    ) -> MaskDictPlan:
+        """Compiles the configuration once into a plan reusable across many records."""
+        return MaskDictPlan.compile(key_with_type_mask, selected_keys, **kwargs)
+
     def _anonymize(self, value: DataDict) -> DataDict:
+        profiler = Profiler.active()
+        if profiler is None:
+            return self._anonymize_value(value)
+        if self._lazy is not None or self._in_place or self._selects_paths():
+            return profiler.profile_call("MaskDict", self._anonymize_value, value)
+        options = {
+            name: option for name, option in self._dict_options.items() if option
+        }
+        return profiler.profile_tree(
+            "MaskDict",
+            value,
+            anonymize_value,
+            {**self._extra, **options},
+            _child_options,
+        )
+
+    def _selects_paths(self) -> bool:
+        return isinstance(self._strategy, PathDictAnonymizationStrategy)
+
+    def _anonymize_value(self, value: DataDict) -> DataDict:
+        if self._lazy is not None:
+            return self._lazy.materialize()
+        if self._in_place:
+            return anonymize_in_place(value, **self._dict_options, **self._extra)
         return self._strategy.anonymize(value)
 
     @property
@@ -60,10 +129,14 @@ class MaskDict(MaskBase[DataDict]):
         return self._value_anonymized or self._value
 
     def __getitem__(self, key: str) -> Any:
+        if self._lazy is not None and self._value_anonymized is None:
+            return self._lazy[key]
         value_dict = self._value_anonymized or self._value
         return value_dict[key]
 
     def __iter__(self):
+        if self._lazy is not None and self._value_anonymized is None:
+            return iter(self._lazy.items())
         if self._value_anonymized:
             return iter(self._value_anonymized.items())
         return iter(self._value.items())
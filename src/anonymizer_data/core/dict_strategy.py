@@ -1,7 +1,12 @@
 from abc import ABC, abstractmethod
 from copy import deepcopy
+from functools import partial
 from typing import Any, Callable
 
+from anonymizer_data.handlers.dispatch import MaskDispatch
+
+from .paths import PathSelector, SelectedPaths, path_type_masks
+
 
 class DictAnonymizationStrategy(ABC):
     def __init__(self, dispatcher_func: Callable[..., Any], **kwargs: Any) -> None:
@@ -46,6 +51,32 @@ class KeyAsTypeMaskDictAnonymizationStrategy(DictAnonymizationStrategy):
         anonymized_dict = {}
         for key, value in data.items():
             extra_data = deepcopy(self._extra)
-            extra_data["type_mask"] = key
+            extra_data["type_mask"] = MaskDispatch.resolve_key(key)
             anonymized_dict[key] = self._dispatcher_func(value, **extra_data)
         return anonymized_dict
+
+
+class PathDictAnonymizationStrategy(DictAnonymizationStrategy):
+    def __init__(
+        self,
+        selected_paths: SelectedPaths,
+        dispatcher_func: Callable[..., Any],
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(dispatcher_func, **kwargs)
+        self._selector = PathSelector.from_rules(
+            {
+                path: partial(
+                    dispatcher_func,
+                    **(
+                        kwargs
+                        if type_mask is None
+                        else {**kwargs, "type_mask": type_mask}
+                    ),
+                )
+                for path, type_mask in path_type_masks(selected_paths).items()
+            }
+        )
+
+    def anonymize(self, data: dict[str, Any]) -> dict[str, Any]:
+        return self._selector.anonymize(data)
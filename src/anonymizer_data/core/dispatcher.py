@@ -1,33 +1,194 @@
 from typing import Any, Callable
 
+from anonymizer_data.handlers.dispatch import MaskDispatch
+
+from .string import MaskStr
+from .registry import TypeRegistry
+from .traverse import copy_tree
+
 Masker = Any
 MaskerFactory = Callable[..., Masker]
 
+_DISPATCH = MaskDispatch()
+
+
+def mask_str_value(
+    value: str,
+    type_mask: str | None = None,
+    anonymize_string: bool = True,
+    string_masker: MaskDispatch | None = None,
+    **kwargs: Any,
+) -> str:
+    """Same result as `MaskStr(value, ...).anonymize()` without building the wrapper."""
+    type_mask = type_mask or MaskStr._type_mask_default
+
+    if "size_anonymization" in kwargs:
+        MaskStr._validate_size_anonymization(kwargs["size_anonymization"])
+    elif type_mask == MaskStr._type_mask_default:
+        kwargs["size_anonymization"] = 0.7
+
+    if not anonymize_string:
+        return value
+    if string_masker is not None:
+        return string_masker.mask(type_mask, value, **kwargs)
+    return _DISPATCH.mask(type_mask, value, **kwargs)
+
+
+def mask_list_value(value: list, **kwargs: Any) -> list:
+    """Same result as `MaskList(value, ...).anonymize()` without building the wrapper."""
+    return copy_tree(value, anonymize_value, kwargs, _child_options)
+
+
+def mask_dict_value(
+    value: dict[str, Any],
+    key_with_type_mask: bool = False,
+    selected_keys: list[str] | None = None,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    """Same result as `MaskDict(value, ...).anonymize()` without building the wrapper."""
+    if key_with_type_mask:
+        kwargs["key_with_type_mask"] = key_with_type_mask
+    if selected_keys:
+        kwargs["selected_keys"] = selected_keys
+    return copy_tree(value, anonymize_value, kwargs, _child_options)
+
+
+# Maskers of the built-in types by name, kept for backward compatibility. `anonymize_value`
+# resolves types with `TypeRegistry`, where other types are registered.
+DEFAULT_MASKERS: dict[str, MaskerFactory] = {
+    "list": mask_list_value,
+    "dict": mask_dict_value,
+    "str": mask_str_value,
+}
+
+
+def anonymize_value(value: Any, **extra: Any) -> Masker:
+    """
+    Anonymizes any supported value without creating `MaskStr`, `MaskList` or `MaskDict` objects.
+
+    How `value` is masked is resolved by `TypeRegistry` from its type: strings (and their
+    subclasses) are masked, dicts, lists, tuples, sets, NamedTuples and dataclasses have their
+    items masked, and other values are kept unless a `type_mask` is given. The options are the
+    ones accepted by the classes, so the result is identical to the class API.
 
-DEFAULT_MASKERS: dict[str, MaskerFactory] = {}
+    Parameters:
+        value (Any): The value to anonymize, usually a `str`, `list` or `dict`.
+        **extra: Options accepted by the classes, such as `type_mask`, `size_anonymization`,
+            `anonymize_string`, `key_with_type_mask` and `selected_keys`.
 
+    Returns:
+        Any: The anonymized value.
 
-def dispatch_value_mask(value: Any, **extra: Any) -> Masker:
-    """Factory that contains the logic for choosing the correct masker for each type of data."""
-    from .list import MaskList
-    from .string import MaskStr
-    from .dict import MaskDict
+    Examples:
+        >>> from anonymizer_data import anonymize_value
+        >>> anonymize_value("Hello world")
+        '*******orld'
+        >>> anonymize_value({"email": "jhondoe@example.com"}, key_with_type_mask=True)
+        {'email': '******e@example.com'}
+    """
+    type_masker = TypeRegistry.resolved[type(value)]
 
-    DEFAULT_MASKERS.update(
-        {
-            "list": lambda value, **kwargs: MaskList(value, **kwargs).anonymize(),
-            "dict": lambda value, **kwargs: MaskDict(value, **kwargs).anonymize(),
-            "str": lambda value, **kwargs: MaskStr(value, **kwargs).anonymize(),
-        }
-    )
+    if type_masker is None:
+        if extra.get("type_mask"):
+            return mask_str_value(str(value), **extra)
+        return value
 
-    type_name = type(value).__name__
-    masker_factory = DEFAULT_MASKERS.get(type_name)
+    if type_masker.shape is not str:
+        return copy_tree(value, anonymize_value, extra, _child_options)
 
-    if masker_factory:
-        return masker_factory(value, **extra)
+    if type_masker.unpack is None:
+        masked = mask_str_value(value, **extra)
+    else:
+        masked = mask_str_value(type_masker.unpack(value), **extra)
+    return masked if type_masker.pack is None else type_masker.pack(value, masked)
 
-    if extra.get("type_mask"):
-        return MaskStr(str(value), **extra).anonymize()
 
+def _in_place_shape(value: Any) -> type | None:
+    """`dict` or `list` when `value` is a container whose items can be replaced."""
+    type_masker = TypeRegistry.containers[type(value)]
+    if type_masker is None or type_masker.unpack or type_masker.pack:
+        return None
+    return type_masker.shape
+
+
+def _child_options(
+    options: dict[str, Any],
+) -> Callable[[Any], dict[str, Any]] | None:
+    """
+    Options of each value of a dict, as `mask_dict_value` passes them, or None when every
+    value receives `options` itself.
+    """
+    if "key_with_type_mask" not in options and "selected_keys" not in options:
+        return None
+
+    kwargs = dict(options)
+    key_with_type_mask = kwargs.pop("key_with_type_mask", False)
+    selected_keys = kwargs.pop("selected_keys", None)
+
+    if key_with_type_mask:
+        key_index = MaskDispatch.key_index
+        return lambda key: {**kwargs, "type_mask": key_index[key]}
+    if selected_keys:
+        not_selected = {**kwargs, "anonymize_string": False}
+        return lambda key: kwargs if key in selected_keys else not_selected
+    return lambda key: kwargs
+
+
+def anonymize_in_place(value: Any, **extra: Any) -> Any:
+    """
+    Anonymizes a `dict` or `list` by replacing its values, instead of building a copy.
+
+    The values are the same as `anonymize_value` returns, but every `dict` and `list` of the
+    tree (including their subclasses and other mutable mappings and sequences) is reused,
+    while tuples, sets, NamedTuples and dataclasses are replaced by masked copies, so peak
+    memory stays close to the size of the input. Use it only when nothing else needs the
+    original data. The tree is walked with an explicit stack, and a container referenced
+    more than once is masked once, with the options of the first path that reaches it.
+
+    Parameters:
+        value (Any): The value to anonymize, usually a `dict` or `list`.
+        **extra: Options accepted by `anonymize_value`.
+
+    Returns:
+        Any: `value` itself when it is a `dict` or `list`, otherwise the anonymized value.
+
+    Examples:
+        >>> from anonymizer_data.core import anonymize_in_place
+        >>> data = {"email": "jhondoe@example.com", "tags": ["vip"]}
+        >>> anonymize_in_place(data, key_with_type_mask=True) is data
+        True
+        >>> data
+        {'email': '******e@example.com', 'tags': ['vip']}
+    """
+    shape = _in_place_shape(value)
+    if shape is None:
+        return anonymize_value(value, **extra)
+
+    seen = {id(value)}
+    stack: list[tuple[Any, type, dict[str, Any]]] = [(value, shape, extra)]
+    while stack:
+        container, shape, options = stack.pop()
+        if shape is dict:
+            child_options = _child_options(options) or (
+                lambda key, options=options: options
+            )
+            entries = (
+                (key, item, child_options(key)) for key, item in container.items()
+            )
+        else:
+            entries = ((index, item, options) for index, item in enumerate(container))
+
+        # Replacing the value of an existing key or index is safe while iterating.
+        for key, item, item_options in entries:
+            item_shape = _in_place_shape(item)
+            if item_shape is not None:
+                if id(item) not in seen:
+                    seen.add(id(item))
+                    stack.append((item, item_shape, item_options))
+            else:
+                container[key] = anonymize_value(item, **item_options)
     return value
+
+
+# Kept for backward compatibility, `anonymize_value` is the public name.
+dispatch_value_mask = anonymize_value
@@ -1,6 +1,8 @@
 from typing import Any
 
 from .base import MaskBase
+from .dispatcher import _child_options, anonymize_in_place, anonymize_value
+from .profile import Profiler
 
 
 class MaskList[T](MaskBase[list[T]]):
@@ -12,6 +14,9 @@ class MaskList[T](MaskBase[list[T]]):
         type_mask (Optional[str]): The type mask to anonymize. Default is "string".
         string_masker (bool): If false the string will never be anonymized. default is True.
         size_anonymization (float): The size of the anonymized string.
+        in_place (Optional[bool]): If true, `anonymize` replaces the values of `value` and of the
+            lists and dicts inside it instead of building a copy, so `view` no longer returns the
+            original data. Default is False.
 
     Note:
         The "size_anonymization" parameter will be passed to MaskStr for each string contained in "value" as well as
@@ -37,15 +42,26 @@ class MaskList[T](MaskBase[list[T]]):
 
     _allowed_type = list
 
-    def __init__(self, value: list[T], **kwargs: Any) -> None:
+    def __init__(self, value: list[T], in_place: bool = False, **kwargs: Any) -> None:
         super().__init__(value)
 
         self._extra: dict[str, Any] = kwargs
+        self._in_place = in_place
 
     def _anonymize(self, value: list) -> list:
-        from .dispatcher import dispatch_value_mask
+        profiler = Profiler.active()
+        if profiler is None:
+            return self._anonymize_value(value)
+        if self._in_place:
+            return profiler.profile_call("MaskList", self._anonymize_value, value)
+        return profiler.profile_tree(
+            "MaskList", value, anonymize_value, self._extra, _child_options
+        )
 
-        return [dispatch_value_mask(item, **self._extra) for item in value]
+    def _anonymize_value(self, value: list) -> list:
+        if self._in_place:
+            return anonymize_in_place(value, **self._extra)
+        return [anonymize_value(item, **self._extra) for item in value]
 
     @property
     def __list__(self) -> list:
@@ -0,0 +1,155 @@
+from collections import Counter
+from collections.abc import Callable, Collection
+from threading import Lock
+from time import perf_counter
+from typing import Any, NamedTuple
+
+from .cache import CacheInfo
+
+
+class HandlerStats(NamedTuple):
+    """Calls, cumulative time in seconds and bytes of the values masked by a handler."""
+
+    calls: int
+    seconds: float
+    bytes: int
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes / self.seconds if self.seconds else 0.0
+
+
+class MetricsSnapshot(NamedTuple):
+    """
+    Copy of the metrics at a point in time.
+
+    Attributes:
+        handlers (dict[str, HandlerStats]): Stats of each mask type that masked a value.
+        invalid (dict[str, int]): Invalid documents of each kind (such as "CPF"), which
+            raised, were kept or fell back to `anonymize_all_string` according to `Config`.
+        unmatched (dict[str, int]): Values kept because their mask type has no handler.
+        result_cache (CacheInfo): Statistics of the result cache of `MaskDispatch`.
+    """
+
+    handlers: dict[str, HandlerStats]
+    invalid: dict[str, int]
+    unmatched: dict[str, int]
+    result_cache: CacheInfo
+
+    @property
+    def calls(self) -> int:
+        return sum(stats.calls for stats in self.handlers.values())
+
+    @property
+    def seconds(self) -> float:
+        return sum(stats.seconds for stats in self.handlers.values())
+
+
+def _size(data: Any) -> int:
+    """Size in bytes of `data` as UTF-8, or 0 when it is not text nor a buffer."""
+    if isinstance(data, str):
+        return len(data) if data.isascii() else len(data.encode(errors="surrogatepass"))
+    if isinstance(data, memoryview):
+        return data.nbytes
+    if isinstance(data, bytes | bytearray):
+        return len(data)
+    return 0
+
+
+class MetricsRegistry:
+    """
+    Counters of the handlers, filled while `Config.metrics` is true.
+
+    The callers check `Config.metrics` before calling the registry, so the disabled cost is
+    a single attribute lookup per value. The counters are protected by a lock and are kept
+    per process: values masked by the workers of `anonymize_batch` are not counted.
+    `observer`, when set, also receives the mask type and the time of each recorded call;
+    with `counting` false, the calls are only sent to it.
+
+    Examples:
+        >>> registry = MetricsRegistry()
+        >>> registry.call("cep", "12345-678", str.upper, "12345-678")
+        '12345-678'
+        >>> registry.record_unmatched("tags")
+        >>> registry.snapshot(CacheInfo(0, 0, 0, 0)).unmatched
+        {'tags': 1}
+    """
+
+    __slots__ = ("_handlers", "_invalid", "_lock", "_unmatched", "counting", "observer")
+
+    def __init__(self) -> None:
+        self._handlers: dict[str, list[Any]] = {}
+        self._invalid: Counter[str] = Counter()
+        self._unmatched: Counter[str] = Counter()
+        self._lock = Lock()
+        self.observer: Callable[[str, float], None] | None = None
+        self.counting = True
+
+    def record(self, type_mask: str, calls: int, seconds: float, size: int) -> None:
+        """Adds `calls` values of `size` bytes masked in `seconds` to `type_mask`."""
+        if self.counting:
+            with self._lock:
+                stats = self._handlers.get(type_mask)
+                if stats is None:
+                    self._handlers[type_mask] = [calls, seconds, size]
+                else:
+                    stats[0] += calls
+                    stats[1] += seconds
+                    stats[2] += size
+        if self.observer is not None:
+            self.observer(type_mask, seconds)
+
+    def call(
+        self, type_mask: str, data: Any, func: Callable[..., Any], *args: Any
+    ) -> Any:
+        """Returns `func(*args)`, recording it as one value `data` masked by `type_mask`."""
+        start = perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self.record(type_mask, 1, perf_counter() - start, _size(data))
+
+    def call_column(
+        self,
+        type_mask: str,
+        values: Collection[Any],
+        func: Callable[..., Any],
+        *args: Any,
+    ) -> Any:
+        """Same as `call`, recording each item of `values` as a value masked."""
+        start = perf_counter()
+        try:
+            return func(*args)
+        finally:
+            size = sum(map(_size, values))
+            self.record(type_mask, len(values), perf_counter() - start, size)
+
+    def record_invalid(self, doc_name: str) -> None:
+        if self.counting:
+            with self._lock:
+                self._invalid[doc_name] += 1
+
+    def record_unmatched(self, type_mask: Any) -> None:
+        if self.counting:
+            with self._lock:
+                self._unmatched[type_mask] += 1
+
+    def snapshot(self, result_cache: CacheInfo) -> MetricsSnapshot:
+        """Returns a copy of the counters, which keep counting."""
+        with self._lock:
+            return MetricsSnapshot(
+                handlers={
+                    type_mask: HandlerStats(*stats)
+                    for type_mask, stats in self._handlers.items()
+                },
+                invalid=dict(self._invalid),
+                unmatched=dict(self._unmatched),
+                result_cache=result_cache,
+            )
+
+    def reset(self) -> None:
+        """Sets every counter back to zero."""
+        with self._lock:
+            self._handlers.clear()
+            self._invalid.clear()
+            self._unmatched.clear()
@@ -0,0 +1,287 @@
+import re
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from .plan import ValuePlan
+from .registry import TypeRegistry
+
+type Segment = str | int | None
+type Rule = Callable[[Any], Any]
+type SelectedPaths = Iterable[str] | Mapping[str, str | None]
+
+_SEGMENT = re.compile(
+    r"""
+    \.(?P<name>[^.\[\]]+)
+    | \[(?:
+        (?P<index>\d+)
+        | (?P<wildcard>\*)
+        | "(?P<double>(?:[^"\\]|\\.)*)"
+        | '(?P<single>(?:[^'\\]|\\.)*)'
+    )\]
+    """,
+    re.VERBOSE,
+)
+_ESCAPE = re.compile(r"\\(.)")
+
+
+def parse_path(path: str) -> tuple[Segment, ...]:
+    """
+    Splits a JSONPath-like selector into its segments.
+
+    A path is a sequence of `.name`, `["name"]`, `[index]` and wildcard (`.*` or `[*]`)
+    segments, optionally preceded by `$`. The first name may omit the dot. Names select a
+    key of a dict, indices an item of a list and wildcards every key or item.
+
+    Parameters:
+        path (str): The selector, such as `customer.addresses[*].cep`.
+
+    Returns:
+        tuple[str | int | None, ...]: The segments, a `str` for names, an `int` for indices
+            and None for wildcards.
+
+    Raises:
+        ValueError: Invalid path {path} at position {position}.
+
+    Examples:
+        >>> parse_path("$.customer.addresses[*].cep")
+        ('customer', 'addresses', None, 'cep')
+        >>> parse_path('items[0]["first name"]')
+        ('items', 0, 'first name')
+    """
+    if path.startswith("$"):
+        text = path[1:]
+    elif path.startswith("["):
+        text = path
+    else:
+        text = "." + path
+    offset = len(path) - len(text)
+
+    segments: list[Segment] = []
+    position = 0
+    while position < len(text):
+        match = _SEGMENT.match(text, position)
+        if match is None:
+            column = max(position + offset, 0)
+            raise ValueError(f"Invalid path {path!r} at position {column}")
+        name, index, wildcard, double, single = match.groups()
+        if wildcard is not None or name == "*":
+            segments.append(None)
+        elif name is not None:
+            segments.append(name)
+        elif index is not None:
+            segments.append(int(index))
+        else:
+            segments.append(
+                _ESCAPE.sub(r"\1", double if double is not None else single)
+            )
+        position = match.end()
+
+    return tuple(segments)
+
+
+class _Node:
+    """Node of the selection trie, one per segment of the compiled paths."""
+
+    __slots__ = ("indices", "keys", "rule", "wildcard")
+
+    def __init__(self) -> None:
+        self.rule: Rule | None = None
+        self.keys: dict[str, _Node] = {}
+        self.indices: dict[int, _Node] = {}
+        self.wildcard: _Node | None = None
+
+    def insert(self, segments: tuple[Segment, ...], rule: Rule) -> None:
+        node = self
+        for segment in segments:
+            if segment is None:
+                node.wildcard = node.wildcard or _Node()
+                node = node.wildcard
+            elif isinstance(segment, str):
+                node = node.keys.setdefault(segment, _Node())
+            else:
+                node = node.indices.setdefault(segment, _Node())
+        node.rule = rule
+
+    def merge(self, other: "_Node | None") -> "_Node":
+        """New node selecting what `self` or `other` select, `self` wins on conflicts."""
+        if other is None:
+            return self
+        node = _Node()
+        node.rule = self.rule if self.rule is not None else other.rule
+        node.keys = _merge_children(self.keys, other.keys)
+        node.indices = _merge_children(self.indices, other.indices)
+        node.wildcard = (
+            other.wildcard
+            if self.wildcard is None
+            else self.wildcard.merge(other.wildcard)
+        )
+        return node
+
+    def finalize(self) -> "_Node":
+        """
+        Merges the wildcard into the explicit children, so a key or index is looked up a
+        single time when the data is walked.
+        """
+        if self.rule is not None:
+            self.keys, self.indices, self.wildcard = {}, {}, None
+            return self
+        if self.wildcard is not None:
+            self.wildcard = self.wildcard.finalize()
+        _finalize_children(self.keys, self.wildcard)
+        _finalize_children(self.indices, self.wildcard)
+        return self
+
+
+def _merge_children[K](first: dict[K, _Node], second: dict[K, _Node]) -> dict[K, _Node]:
+    merged = dict(second)
+    for segment, child in first.items():
+        merged[segment] = child.merge(second.get(segment))
+    return merged
+
+
+def _finalize_children[K](children: dict[K, _Node], wildcard: _Node | None) -> None:
+    for segment, child in children.items():
+        children[segment] = child.merge(wildcard).finalize()
+
+
+def _select(node: _Node, value: Any) -> Any:
+    """
+    Applies the rules of `node` to `value`, copying only the containers on a selected path.
+
+    Returns `value` itself when nothing inside it was changed. A copied container is rebuilt
+    from its `TypeRegistry` shape, so subclasses of dict and list (`OrderedDict`, for
+    example) come back as a plain dict or list, as they do from `anonymize_value`.
+    """
+    if node.rule is not None:
+        return node.rule(value)
+
+    masker = TypeRegistry.containers[type(value)]
+    if masker is None:
+        return value
+    data = value if masker.unpack is None else masker.unpack(value)
+
+    changes: dict[Any, Any] = {}
+    wildcard = node.wildcard
+    if masker.shape is dict:
+        if wildcard is None:
+            selected = ((key, data[key]) for key in node.keys if key in data)
+        else:
+            selected = data.items()
+        for key, item in selected:
+            masked = _select(node.keys.get(key, wildcard), item)  # type: ignore[arg-type]
+            if masked is not item:
+                changes[key] = masked
+        if not changes:
+            return value
+        copy: Any = dict(data)
+        copy.update(changes)
+    else:
+        items = data if type(data) is list else list(data)
+        if wildcard is None:
+            size = len(items)
+            selected = ((index, items[index]) for index in node.indices if index < size)
+        else:
+            selected = enumerate(items)
+        for index, item in selected:
+            masked = _select(node.indices.get(index, wildcard), item)  # type: ignore[arg-type]
+            if masked is not item:
+                changes[index] = masked
+        if not changes:
+            return value
+        copy = list(items)
+        for index, masked in changes.items():
+            copy[index] = masked
+
+    return copy if masker.pack is None else masker.pack(value, copy)
+
+
+def path_type_masks(paths: SelectedPaths) -> dict[str, str | None]:
+    """Normalizes a list of paths, or a mapping of paths to type masks, into a mapping."""
+    if isinstance(paths, Mapping):
+        return dict(paths)
+    if isinstance(paths, str):
+        raise TypeError("The selected paths must be a list of paths, not a string")
+    return dict.fromkeys(paths)
+
+
+@dataclass(frozen=True, slots=True)
+class PathSelector:
+    """
+    Compiled set of JSONPath-like selectors that anonymizes only the values they reach.
+
+    The paths are compiled into a trie. Anonymizing walks only the branches of the data that
+    can contain a selected value, and the containers along them are copied; everything else
+    is returned by reference, so the cost grows with the number of selected values and not
+    with the size of the document. A selected value is masked with everything nested inside
+    it, as `anonymize_value` would.
+
+    See `parse_path` for the syntax. Names only match keys of dicts (and fields of
+    NamedTuples and dataclasses), indices only items of lists, tuples and other list-shaped
+    containers. Paths that do not exist in the data are ignored.
+
+    Attributes:
+        root (_Node): Root of the compiled trie.
+
+    Note:
+        The result shares the values that were not selected with the input, so changing one
+        changes the other. When nothing is selected, the input itself is returned. Dict and
+        list subclasses on a selected path are copied as a plain dict or list.
+
+    Examples:
+        >>> selector = PathSelector.compile(["customer.addresses[*].cep"], type_mask="cep")
+        >>> selector.anonymize(
+        ...     {"customer": {"name": "Jhon", "addresses": [{"cep": "01001-000"}]}}
+        ... )
+        {'customer': {'name': 'Jhon', 'addresses': [{'cep': '*****-000'}]}}
+    """
+
+    root: _Node
+
+    @classmethod
+    def compile(cls, paths: SelectedPaths, **kwargs: Any) -> "PathSelector":
+        """
+        Compiles the selectors once, resolving the handler of each path.
+
+        Parameters:
+            paths (Iterable[str] | Mapping[str, Optional[str]]): The paths to anonymize, or a
+                mapping of each path to its `type_mask` (None uses the `type_mask` of the
+                kwargs).
+            **kwargs: Options of the selected values, as accepted by `anonymize_value`.
+
+        Raises:
+            ValueError: Invalid path {path} at position {position}.
+        """
+        shared = ValuePlan.compile(**kwargs)
+        rules = {
+            path: (
+                shared
+                if type_mask is None
+                else ValuePlan.compile(**{**kwargs, "type_mask": type_mask})
+            ).apply
+            for path, type_mask in path_type_masks(paths).items()
+        }
+        return cls.from_rules(rules)
+
+    @classmethod
+    def from_rules(cls, rules: Mapping[str, Rule]) -> "PathSelector":
+        """
+        Compiles selectors that apply a function of their own to the values they reach.
+
+        When several paths reach the same value, the one that names it explicitly is used
+        over a wildcard, and otherwise the last one.
+        """
+        root = _Node()
+        for path, rule in rules.items():
+            root.insert(parse_path(path), rule)
+        return cls(root.finalize())
+
+    def anonymize(self, data: Any) -> Any:
+        """Returns `data` with the selected values anonymized."""
+        return _select(self.root, data)
+
+    def anonymize_many(self, records: Iterable[Any]) -> Iterator[Any]:
+        """Lazily anonymizes each record of `records`."""
+        root = self.root
+        for record in records:
+            yield _select(root, record)
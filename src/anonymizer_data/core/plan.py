@@ -0,0 +1,214 @@
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import Any
+
+from anonymizer_data.handlers.dispatch import MaskDispatch
+
+from .profile import Profiler
+from .registry import TypeRegistry
+from .string import MaskStr
+from .traverse import copy_tree
+
+type StringMasker = Callable[[str], str]
+
+_MASK_STR_OPTIONS = ("type_mask", "anonymize_string", "string_masker")
+_DISPATCH = MaskDispatch()
+
+
+def _keep_string(value: str) -> str:
+    return value
+
+
+def _compile_string_masker(**kwargs: Any) -> StringMasker:
+    """Resolves, once, what `MaskStr(value, **kwargs).anonymize()` would do."""
+    type_mask: str = kwargs.get("type_mask") or MaskStr._type_mask_default
+    string_masker: MaskDispatch | None = kwargs.get("string_masker")
+    extra = {
+        key: value for key, value in kwargs.items() if key not in _MASK_STR_OPTIONS
+    }
+
+    if "size_anonymization" in extra:
+        MaskStr._validate_size_anonymization(extra["size_anonymization"])
+    elif type_mask == MaskStr._type_mask_default:
+        extra["size_anonymization"] = 0.7
+
+    if not kwargs.get("anonymize_string", True):
+        return _keep_string
+    if string_masker is not None:
+        return partial(string_masker.mask, type_mask, **extra)
+    return _DISPATCH.bind(type_mask, **extra)
+
+
+@dataclass(frozen=True, slots=True)
+class ValuePlan:
+    """
+    Resolved masking rule applied to a value and everything nested inside it.
+
+    Attributes:
+        mask_string (Callable[[str], str]): Handler already bound to its options.
+        coerce (bool): If true, values that are not `str`, `list` or `dict` are converted to
+            `str` and masked, mirroring what happens when a `type_mask` is given.
+    """
+
+    mask_string: StringMasker
+    coerce: bool
+
+    @classmethod
+    def compile(cls, **kwargs: Any) -> "ValuePlan":
+        return cls(_compile_string_masker(**kwargs), bool(kwargs.get("type_mask")))
+
+    def apply(self, value: Any) -> Any:
+        if type(value) is str:
+            return self.mask_string(value)
+
+        type_masker = TypeRegistry.resolved[type(value)]
+        if type_masker is None:
+            return self.mask_string(str(value)) if self.coerce else value
+        if type_masker.shape is not str:
+            return copy_tree(value, self.apply, {})
+
+        text = value if type_masker.unpack is None else type_masker.unpack(value)
+        masked = self.mask_string(text)
+        return masked if type_masker.pack is None else type_masker.pack(value, masked)
+
+
+class _KeyTypeMaskRules(dict[Any, ValuePlan]):
+    """
+    Rules of `key_with_type_mask`, by mask type. Other keys are resolved on their first use
+    with `MaskDispatch.resolve_key` and remembered, up to the size of
+    `MaskDispatch.key_index`, so every key has a rule. Keys without a handler keep their
+    values, which are counted as unmatched with `Config.metrics`.
+    """
+
+    def __init__(
+        self,
+        rules: dict[str, ValuePlan],
+        default: ValuePlan,
+        count_unmatched: bool = True,
+    ) -> None:
+        super().__init__(rules)
+        self._by_type_mask = rules
+        self._default = default
+        self._count_unmatched = count_unmatched
+
+    def __missing__(self, key: Any) -> ValuePlan:
+        type_mask = MaskDispatch.resolve_key(key)
+        rule = self._by_type_mask.get(type_mask)
+        if rule is None:
+            rule = self._default
+            if self._count_unmatched:
+                rule = ValuePlan(MaskDispatch._keep_unmatched(type_mask), rule.coerce)
+        if len(self) >= MaskDispatch.key_index.maxsize:
+            del self[next(iter(self))]
+        self[key] = rule
+        return rule
+
+    def get(self, key: Any, default: Any = None) -> ValuePlan:  # type: ignore[override]
+        return self[key]
+
+
+@dataclass(frozen=True, slots=True)
+class MaskDictPlan:
+    """
+    Anonymization plan for dictionaries that share the same configuration.
+
+    The options accepted by `MaskDict` are resolved a single time: each key is bound to the
+    handler and kwargs it would receive, so applying the plan to a record involves no strategy
+    objects, kwargs copies or handler lookups. The output is identical to
+    `MaskDict(record, ...).anonymize()`.
+
+    Attributes:
+        rules (Mapping[str, ValuePlan]): Read-only view of the plan used for each known key.
+            With `key_with_type_mask`, other keys are memoized in it the first time they are
+            seen, with the plan of the mask type given by `MaskDispatch.resolve_key`, keeping
+            at most `MaskDispatch.key_index.maxsize` keys. So its length changes as records are
+            anonymized, while the plan of a key never does.
+        default (ValuePlan): Plan used for keys not present in `rules`.
+        options (Optional[tuple]): The options given to `compile`, as sorted pairs.
+
+    Note:
+        Handlers are resolved when the plan is compiled, handlers registered afterwards in
+        `MaskDispatch` are not seen by the plan. A compiled plan can be pickled, to send it
+        to a process pool: it is compiled again from its options, once per process.
+
+    Examples:
+        >>> from anonymizer_data import MaskDict
+        >>> plan = MaskDict.compile(key_with_type_mask=True)
+        >>> plan.anonymize({"email": "jhondoe@example.com", "name": "Jhon"})
+        {'email': '******e@example.com', 'name': '****'}
+
+    Raises:
+        ValueError: The 'size_anonymization' field must be between 0 and 1.
+        ValueError: The 'size_anonymization' must be a float.
+    """
+
+    rules: Mapping[str, ValuePlan]
+    default: ValuePlan
+    options: tuple[tuple[str, Any], ...] | None = field(
+        default=None, repr=False, compare=False
+    )
+
+    @classmethod
+    def compile(
+        cls,
+        key_with_type_mask: bool = False,
+        selected_keys: list[str] | None = None,
+        **kwargs: Any,
+    ) -> "MaskDictPlan":
+        if key_with_type_mask:
+            default = ValuePlan(_keep_string, coerce=True)
+            rules = _KeyTypeMaskRules(
+                {
+                    type_mask: ValuePlan.compile(**{**kwargs, "type_mask": type_mask})
+                    for type_mask in [*MaskDispatch._handlers, ""]
+                },
+                default,
+                count_unmatched=kwargs.get("anonymize_string", True),
+            )
+        elif selected_keys:
+            selected = ValuePlan.compile(**kwargs)
+            rules = {key: selected for key in selected_keys}
+            default = ValuePlan.compile(**{**kwargs, "anonymize_string": False})
+        else:
+            rules = {}
+            default = ValuePlan.compile(**kwargs)
+        options = {
+            **kwargs,
+            "key_with_type_mask": key_with_type_mask,
+            "selected_keys": None if selected_keys is None else tuple(selected_keys),
+        }
+        return cls(MappingProxyType(rules), default, tuple(sorted(options.items())))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # The bound handlers cannot be pickled, so the plan is compiled again from its
+        # options, once per process, see `_compile_pickled`.
+        if self.options is None:
+            raise TypeError("Only plans built by MaskDictPlan.compile can be pickled")
+        return _compile_pickled, (self.options,)
+
+    def anonymize(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Returns an anonymized copy of `data`."""
+        profiler = Profiler.active()
+        if profiler is not None:
+            return profiler.profile_plan(self, data)
+        rules_get = self.rules.get
+        default = self.default
+        return {
+            key: rules_get(key, default).apply(value) for key, value in data.items()
+        }
+
+    def anonymize_many(
+        self, records: Iterable[dict[str, Any]]
+    ) -> Iterator[dict[str, Any]]:
+        """Lazily anonymizes each record of `records`."""
+        anonymize = self.anonymize
+        for record in records:
+            yield anonymize(record)
+
+
+@lru_cache(maxsize=32)
+def _compile_pickled(options: tuple[tuple[str, Any], ...]) -> MaskDictPlan:
+    """Compiles a pickled `MaskDictPlan`, reusing the plan of the same options."""
+    return MaskDictPlan.compile(**dict(options))
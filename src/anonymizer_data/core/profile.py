@@ -0,0 +1,288 @@
+import re
+from collections.abc import Callable
+from contextvars import ContextVar, Token
+from functools import partial
+from math import ceil
+from threading import Lock
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, NamedTuple, Self, TextIO
+
+from anonymizer_data.core.config import Config
+from anonymizer_data.handlers.dispatch import MaskDispatch
+
+from .registry import TypeRegistry
+from .traverse import KeyOptions, Options, _no_key_options, copy_tree
+
+if TYPE_CHECKING:
+    from .plan import MaskDictPlan
+
+type PathKey = tuple[Any, ...]
+
+_NAME = re.compile(r"[^.\[\]\"'*]+")
+_active: ContextVar["Profiler | None"] = ContextVar("profiler", default=None)
+
+# Profilers entered in any thread, and the metrics settings to restore after the last one.
+_lock = Lock()
+_entered = 0
+_saved: tuple[bool, Callable[[str, float], None] | None] = (False, None)
+
+
+class HotSpot(NamedTuple):
+    """Values masked at a dict path, or by a handler, and the time spent on them."""
+
+    name: str
+    calls: int
+    seconds: float
+
+
+def format_path(path: PathKey) -> str:
+    """
+    Writes the keys of a path in the syntax of `parse_path`, with `[*]` for list items.
+
+    Examples:
+        >>> format_path(("orders", None, "customer", "cpf"))
+        'orders[*].customer.cpf'
+        >>> format_path((None, "e.mail", 1))
+        '[*]["e.mail"]["1"]'
+        >>> format_path(())
+        '$'
+    """
+    text = ""
+    for key in path:
+        if key is None:
+            text += "[*]"
+        elif type(key) is str and _NAME.fullmatch(key):
+            text += f".{key}" if text else key
+        else:
+            escaped = str(key).replace("\\", "\\\\").replace('"', '\\"')
+            text += f'["{escaped}"]'
+    return text or "$"
+
+
+def _frame_name(key: Any) -> str:
+    name = "[*]" if key is None else str(key)
+    return name.replace(";", ":").replace("\n", " ")
+
+
+def _observe(type_mask: str, seconds: float) -> None:
+    observer = _saved[1]
+    if observer is not None:
+        observer(type_mask, seconds)
+    profiler = _active.get()
+    if profiler is not None and profiler._current is not None:
+        handler = MaskDispatch._handlers.get(type_mask)
+        name = getattr(handler, "__name__", type_mask)
+        profiler._add(profiler._handlers, (*profiler._current, name), seconds)
+
+
+class Profiler:
+    """
+    Context manager that attributes the time of `MaskDict`, `MaskList` and `MaskDictPlan`
+    calls to the dict paths of the values they mask and to the handlers that mask them.
+
+    Inside the block, containers are copied by a traversal that times each value and
+    remembers its path, such as `orders[*].customer.cpf`, with `[*]` for the items of any
+    list, so the results are the same, only slower. Handlers are timed by the metrics of
+    `MaskDispatch`: while any profiler is active, `Config.metrics` is on and the registry
+    observer is set, but values are only counted in the metrics if they were already
+    enabled. Lazy, in-place and `selected_paths` calls are timed as a whole, at the `$`
+    path. Only the calls of the thread or task that entered the block are profiled, and
+    profilers can be nested or active in several threads at once.
+
+    Examples:
+        >>> from anonymizer_data import MaskDict
+        >>> order = {"customer": {"name": "Jhon Doe"}, "items": [{"sku": "A1"}]}
+        >>> with Profiler() as profiler:
+        ...     _ = MaskDict(order).anonymize()
+        >>> sorted(spot.name for spot in profiler.hot_paths())
+        ['customer.name', 'items[*].sku']
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.seconds = 0.0
+        self._paths: dict[PathKey, list[Any]] = {}
+        self._handlers: dict[PathKey, list[Any]] = {}
+        self._current: PathKey | None = None
+        self._token: Token[Profiler | None] | None = None
+
+    @staticmethod
+    def active() -> "Profiler | None":
+        """Returns the profiler of the current context, if any."""
+        return _active.get()
+
+    def __enter__(self) -> Self:
+        global _entered, _saved
+        metrics = MaskDispatch.metrics
+        with _lock:
+            if _entered == 0:
+                _saved = (Config.metrics, metrics.observer)
+                metrics.counting = Config.metrics
+                metrics.observer = _observe
+                Config.metrics = True
+            _entered += 1
+        self._token = _active.set(self)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        global _entered
+        if self._token is None:
+            return
+        _active.reset(self._token)
+        self._token = None
+        metrics = MaskDispatch.metrics
+        with _lock:
+            _entered -= 1
+            if _entered == 0:
+                Config.metrics, metrics.observer = _saved
+                metrics.counting = True
+
+    @staticmethod
+    def _add(stats: dict[PathKey, list[Any]], key: PathKey, seconds: float) -> None:
+        entry = stats.get(key)
+        if entry is None:
+            stats[key] = [1, seconds]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+
+    def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        start = perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self.calls += 1
+            self.seconds += perf_counter() - start
+            self._current = None
+
+    def _mask(
+        self, mask: Callable[..., Any], path: PathKey, value: Any, options: Options
+    ) -> Any:
+        self._current = path
+        start = perf_counter()
+        try:
+            return mask(value, **options)
+        finally:
+            self._add(self._paths, path, perf_counter() - start)
+
+    def _copy(
+        self,
+        path: PathKey,
+        value: Any,
+        mask: Callable[..., Any],
+        options: Options,
+        key_options: KeyOptions,
+    ) -> Any:
+        """Same as `copy_tree(value, mask, options, key_options)`, timing each leaf."""
+        if TypeRegistry.containers[type(value)] is None:
+            return self._mask(mask, path, value, options)
+        on_leaf = partial(self._mask, mask)
+        return copy_tree(value, mask, options, key_options, on_leaf=on_leaf, path=path)
+
+    def profile_tree(
+        self,
+        root: str,
+        value: Any,
+        mask: Callable[..., Any],
+        options: Options,
+        key_options: KeyOptions = _no_key_options,
+    ) -> Any:
+        """Same as `copy_tree`, recording the time of each leaf under its path in `root`."""
+        return self._run(self._copy, (root,), value, mask, options, key_options)
+
+    def profile_plan(
+        self, plan: "MaskDictPlan", data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Same as `plan.anonymize(data)`, recording the time of each leaf under its path."""
+
+        def anonymize() -> dict[str, Any]:
+            rules_get = plan.rules.get
+            default = plan.default
+            return {
+                key: self._copy(
+                    ("MaskDictPlan", key),
+                    value,
+                    rules_get(key, default).apply,
+                    {},
+                    _no_key_options,
+                )
+                for key, value in data.items()
+            }
+
+        return self._run(anonymize)
+
+    def profile_call(self, root: str, func: Callable[..., Any], *args: Any) -> Any:
+        """Returns `func(*args)`, recording its time at the `$` path of `root`."""
+
+        def call() -> Any:
+            return self._mask(lambda _: func(*args), (root,), None, {})
+
+        return self._run(call)
+
+    @staticmethod
+    def _hot_spots(stats: dict[str, list[Any]]) -> list[HotSpot]:
+        return sorted(
+            (HotSpot(name, calls, seconds) for name, (calls, seconds) in stats.items()),
+            key=lambda spot: spot.seconds,
+            reverse=True,
+        )
+
+    def hot_paths(self) -> list[HotSpot]:
+        """Returns the time spent on the values of each path, slowest first."""
+        stats: dict[str, list[Any]] = {}
+        for (_, *path), (calls, seconds) in self._paths.items():
+            entry = stats.setdefault(format_path(tuple(path)), [0, 0.0])
+            entry[0] += calls
+            entry[1] += seconds
+        return self._hot_spots(stats)
+
+    def hot_handlers(self) -> list[HotSpot]:
+        """Returns the time spent in each handler, slowest first."""
+        stats: dict[str, list[Any]] = {}
+        for key, (calls, seconds) in self._handlers.items():
+            entry = stats.setdefault(key[-1], [0, 0.0])
+            entry[0] += calls
+            entry[1] += seconds
+        return self._hot_spots(stats)
+
+    def report(self, limit: int = 20) -> str:
+        """Returns the `limit` slowest paths and handlers as a table."""
+        total = self.seconds or 1.0
+        lines = [
+            f"{self.calls} calls profiled in {self.seconds * 1e3:.2f} ms",
+        ]
+        for title, spots in (
+            ("path", self.hot_paths()),
+            ("handler", self.hot_handlers()),
+        ):
+            width = max([len(title), *(len(spot.name) for spot in spots[:limit])])
+            lines.append("")
+            lines.append(f"{title:<{width}} {'calls':>9} {'ms':>10} {'share':>6}")
+            for spot in spots[:limit]:
+                lines.append(
+                    f"{spot.name:<{width}} {spot.calls:>9} "
+                    f"{spot.seconds * 1e3:>10.2f} {spot.seconds / total:>6.1%}"
+                )
+        return "\n".join(lines)
+
+    def write_collapsed(self, output: TextIO) -> None:
+        """
+        Writes the profile in the collapsed stack format read by flame graph tools such as
+        `flamegraph.pl`, speedscope or inferno: one `root;key;...;handler weight` line per
+        path and handler, weighted in microseconds.
+        """
+        handler_seconds: dict[PathKey, float] = {}
+        for (*path, name), (_, seconds) in self._handlers.items():
+            key = tuple(path)
+            handler_seconds[key] = handler_seconds.get(key, 0.0) + seconds
+            self._write_stack(output, (*path, name), seconds)
+        for path, (_, seconds) in self._paths.items():
+            self._write_stack(
+                output, path, max(seconds - handler_seconds.get(path, 0.0), 0.0)
+            )
+
+    @staticmethod
+    def _write_stack(output: TextIO, frames: PathKey, seconds: float) -> None:
+        weight = ceil(seconds * 1e6)
+        if weight > 0:
+            output.write(f"{';'.join(map(_frame_name, frames))} {weight}\n")
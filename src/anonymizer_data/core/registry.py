@@ -0,0 +1,166 @@
+import dataclasses
+from collections import UserString
+from collections.abc import Callable, MutableMapping, MutableSequence
+from copy import copy
+from typing import Any, ClassVar, NamedTuple
+
+SHAPES = (str, dict, list)
+
+
+class TypeMasker(NamedTuple):
+    """
+    How the values of a type are anonymized.
+
+    Attributes:
+        shape (type): `str` masks the value as a string. `dict` and `list` walk its items,
+            which receive the options as the values of a dict or the items of a list do.
+        unpack (Optional[Callable[[Any], Any]]): Converts the value into the `str`, mapping
+            or iterable that is masked. When None the value itself is used.
+        pack (Optional[Callable[[Any, Any], Any]]): Receives the original value and the
+            masked `str`, `dict` or `list`, and returns the result. When None the masked
+            `str`, `dict` or `list` is returned.
+    """
+
+    shape: type
+    unpack: Callable[[Any], Any] | None = None
+    pack: Callable[[Any, Any], Any] | None = None
+
+
+class _ResolvedTypes(dict[type, TypeMasker | None]):
+    """Cache of the resolution of each concrete type, filled on the first lookup."""
+
+    def __init__(self, resolve: Callable[[type], TypeMasker | None]) -> None:
+        super().__init__()
+        self._resolve = resolve
+
+    def __missing__(self, value_type: type) -> TypeMasker | None:
+        masker = self[value_type] = self._resolve(value_type)
+        return masker
+
+
+def _dataclass_fields(value: Any) -> dict[str, Any]:
+    return {
+        field.name: getattr(value, field.name) for field in dataclasses.fields(value)
+    }
+
+
+def _replace_fields(value: Any, masked: dict[str, Any]) -> Any:
+    # Set directly, so frozen dataclasses and fields without `init` work too.
+    clone = copy(value)
+    for name, field_value in masked.items():
+        object.__setattr__(clone, name, field_value)
+    return clone
+
+
+_NAMED_TUPLE = TypeMasker(
+    dict,
+    lambda value: value._asdict(),
+    lambda value, masked: type(value)._make(masked.values()),
+)
+_DATACLASS = TypeMasker(dict, _dataclass_fields, _replace_fields)
+
+
+class TypeRegistry:
+    """
+    Registry of how each type of value is anonymized, resolved through the MRO.
+
+    A type uses the entry of the first class of its MRO that is registered, so subclasses of
+    `str`, `dict` and `list` (such as `OrderedDict`, `defaultdict` or a `str` enum) are
+    masked like them. NamedTuples and dataclasses are masked field by field, as dicts whose
+    keys are the field names, and keep their type. Other containers are returned as the
+    registered type they resolve to: a subclass of `tuple`, `set`, `frozenset`, `dict` or
+    `list` comes back as a plain `tuple`, `set`, `frozenset`, `dict` or `list`, unless the
+    subclass is registered itself.
+
+    The resolution is cached per concrete type, so after the first value of a type the
+    lookup is a single dict access. Registering a type clears the cache.
+
+    Values of types that are not resolved are kept, or converted to `str` and masked when a
+    `type_mask` is given.
+
+    Examples:
+        >>> from anonymizer_data import anonymize_value
+        >>> anonymize_value(("Hello world", 42))
+        ('*******orld', 42)
+        >>> class Pair:
+        ...     def __init__(self, first, second):
+        ...         self.first, self.second = first, second
+        >>> TypeRegistry.register(
+        ...     Pair,
+        ...     list,
+        ...     unpack=lambda pair: (pair.first, pair.second),
+        ...     pack=lambda pair, items: Pair(*items),
+        ... )
+        >>> anonymize_value(Pair("Hello world", "Hello Python")).second
+        '********thon'
+    """
+
+    _types: ClassVar[dict[type, TypeMasker]] = {}
+    resolved: ClassVar[_ResolvedTypes] = _ResolvedTypes(
+        lambda value_type: TypeRegistry._lookup(value_type)
+    )
+    containers: ClassVar[_ResolvedTypes] = _ResolvedTypes(
+        lambda value_type: TypeRegistry._container(value_type)
+    )
+
+    @classmethod
+    def register(
+        cls,
+        value_type: type,
+        shape: type,
+        unpack: Callable[[Any], Any] | None = None,
+        pack: Callable[[Any, Any], Any] | None = None,
+    ) -> None:
+        """
+        Registers how the values of `value_type` and of its subclasses are anonymized.
+
+        Parameters:
+            value_type (type): The type, it replaces an existing registration.
+            shape (type): `str`, `dict` or `list`, see `TypeMasker`.
+            unpack (Optional[Callable[[Any], Any]]): See `TypeMasker`.
+            pack (Optional[Callable[[Any, Any], Any]]): See `TypeMasker`.
+
+        Raises:
+            ValueError: The shape must be str, dict or list.
+        """
+        if shape not in SHAPES:
+            raise ValueError(f"The shape must be str, dict or list, not {shape!r}")
+
+        cls._types[value_type] = TypeMasker(shape, unpack, pack)
+        cls.resolved.clear()
+        cls.containers.clear()
+
+    @classmethod
+    def resolve(cls, value_type: type) -> TypeMasker | None:
+        """Returns how values of `value_type` are anonymized, None if they are not."""
+        return cls.resolved[value_type]
+
+    @classmethod
+    def _lookup(cls, value_type: type) -> TypeMasker | None:
+        for base in value_type.__mro__:
+            masker = cls._types.get(base)
+            if masker is not None:
+                if base is tuple and hasattr(value_type, "_fields"):
+                    return _NAMED_TUPLE
+                return masker
+        if dataclasses.is_dataclass(value_type):
+            return _DATACLASS
+        return None
+
+    @classmethod
+    def _container(cls, value_type: type) -> TypeMasker | None:
+        masker = cls.resolved[value_type]
+        if masker is None or masker.shape is str:
+            return None
+        return masker
+
+
+TypeRegistry.register(str, str)
+TypeRegistry.register(UserString, str, unpack=str)
+TypeRegistry.register(dict, dict)
+TypeRegistry.register(MutableMapping, dict)
+TypeRegistry.register(list, list)
+TypeRegistry.register(MutableSequence, list)
+TypeRegistry.register(tuple, list, pack=lambda value, items: tuple(items))
+TypeRegistry.register(set, list, pack=lambda value, items: set(items))
+TypeRegistry.register(frozenset, list, pack=lambda value, items: frozenset(items))
@@ -0,0 +1,148 @@
+from collections.abc import Callable, Iterator, Mapping
+from typing import Any
+
+from .registry import TypeMasker, TypeRegistry
+
+type Options = dict[str, Any]
+type KeyOptions = Callable[[Options], Callable[[Any], Options] | None]
+type Path = tuple[Any, ...]
+type OnLeaf = Callable[[Path, Any, Options], Any]
+type Slot = tuple[Callable[[Any, Any], Any], Any, dict | list, Any]
+type Frame = tuple[
+    Iterator[Any],
+    dict | list,
+    Options,
+    Callable[[Any], Options] | None,
+    int,
+    Slot | None,
+    Path,
+]
+
+
+def _no_key_options(options: Options) -> None:
+    return None
+
+
+def _frame(
+    source: Any,
+    masker: TypeMasker,
+    options: Options,
+    key_options: KeyOptions,
+    slot: Slot | None,
+    path: Path,
+) -> Frame:
+    """Frame that masks the items of `source` into an empty `dict` or `list`."""
+    data = source if masker.unpack is None else masker.unpack(source)
+    if masker.shape is dict:
+        options_of = key_options(options)
+        return iter(data.items()), {}, options, options_of, id(source), slot, path
+    return iter(data), [], options, None, id(source), slot, path
+
+
+def copy_tree(
+    value: Any,
+    mask: Callable[..., Any],
+    options: Options,
+    key_options: KeyOptions = _no_key_options,
+    containers: Mapping[type, TypeMasker | None] = TypeRegistry.containers,
+    on_leaf: OnLeaf | None = None,
+    path: Path = (),
+) -> Any:
+    """
+    Builds a masked copy of a tree of containers with an explicit stack, so the nesting depth
+    is not limited by the recursion limit.
+
+    The tree is visited depth first, in the same order as a recursive copy, so the leaves are
+    masked in the same order and the result is the same. Containers are the values whose
+    type resolves to a `dict` or `list` shape in `TypeRegistry`; they are copied into a
+    `dict` or `list`, which is passed to the `pack` of their type once its items are masked.
+
+    Parameters:
+        value (Any): The root of the tree, a container.
+        mask (Callable[..., Any]): Called as `mask(leaf, **options)` for each leaf.
+        options (dict[str, Any]): Options of `value`.
+        key_options (Optional[Callable]): Receives the options of a dict-shaped container and
+            returns the function that gives the options of each of its keys, or None when
+            the values receive the options of the container. The items of a list-shaped
+            container always receive the options of the container.
+        containers (Mapping[type, Optional[TypeMasker]]): Resolution of each type, None for
+            leaves. Defaults to `TypeRegistry.containers`.
+        on_leaf (Optional[Callable]): Called as `on_leaf(path, leaf, options)` instead of
+            `mask`, with the keys from `path` to the leaf and None for the items of
+            list-shaped containers. Paths are only built when it is given.
+        path (tuple): Path of `value`, the start of the paths given to `on_leaf`.
+
+    Returns:
+        Any: The copy of `value`.
+
+    Raises:
+        TypeError: {type} is not a container.
+        ValueError: Circular reference detected.
+    """
+    root_masker = containers[type(value)]
+    if root_masker is None:
+        raise TypeError(f"{type(value).__name__} is not a container")
+
+    stack = [_frame(value, root_masker, options, key_options, None, path)]
+    root = stack[0][1]
+    active = {id(value)}
+
+    while stack:
+        # The frame on top is resumed until it is exhausted or meets a child container,
+        # which is pushed and copied first, as a recursive copy would. Containers with a
+        # `pack` are replaced in their parent by the packed copy once they are done.
+        items, target, options, options_of, ident, slot, path = stack[-1]
+        if isinstance(target, dict):
+            for key, item in items:
+                item_options = options if options_of is None else options_of(key)
+                masker = containers[type(item)]
+                if masker is not None:
+                    if id(item) in active:
+                        raise ValueError("Circular reference detected")
+                    pack = masker.pack and (masker.pack, item, target, key)
+                    item_path = path if on_leaf is None else (*path, key)
+                    frame = _frame(
+                        item, masker, item_options, key_options, pack, item_path
+                    )
+                    target[key] = frame[1]
+                    stack.append(frame)
+                    active.add(id(item))
+                    break
+                if on_leaf is None:
+                    target[key] = mask(item, **item_options)
+                else:
+                    target[key] = on_leaf((*path, key), item, item_options)
+            else:
+                stack.pop()
+                active.discard(ident)
+                if slot is not None:
+                    pack, source, parent, key = slot
+                    parent[key] = pack(source, target)
+        else:
+            append = target.append
+            for item in items:
+                masker = containers[type(item)]
+                if masker is not None:
+                    if id(item) in active:
+                        raise ValueError("Circular reference detected")
+                    pack = masker.pack and (masker.pack, item, target, len(target))
+                    item_path = path if on_leaf is None else (*path, None)
+                    frame = _frame(item, masker, options, key_options, pack, item_path)
+                    append(frame[1])
+                    stack.append(frame)
+                    active.add(id(item))
+                    break
+                if on_leaf is None:
+                    append(mask(item, **options))
+                else:
+                    append(on_leaf((*path, None), item, options))
+            else:
+                stack.pop()
+                active.discard(ident)
+                if slot is not None:
+                    pack, source, parent, key = slot
+                    parent[key] = pack(source, target)
+
+    if root_masker.pack is not None:
+        return root_masker.pack(value, root)
+    return root
@@ -0,0 +1,188 @@
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from functools import cache
+from typing import Any, overload
+
+from anonymizer_data.handlers.dispatch import MaskDispatch
+
+from .cache import MISSING
+from .plan import MaskDictPlan, ValuePlan
+
+type RuleResolver = Callable[[Any], ValuePlan]
+
+
+def _wrap(value: Any, rule: ValuePlan) -> Any:
+    """Masks a scalar now, or wraps a container to mask its values when they are read."""
+    value_type = type(value)
+    if value_type is dict:
+        return MaskDictView(value, lambda key: rule)
+    if value_type is list:
+        return MaskListView(value, rule)
+    return rule.apply(value)
+
+
+def _materialize(value: Any) -> Any:
+    if isinstance(value, (MaskDictView, MaskListView)):
+        return value.materialize()
+    return value
+
+
+def compile_resolver(
+    key_with_type_mask: bool = False,
+    selected_keys: list[str] | None = None,
+    **kwargs: Any,
+) -> RuleResolver:
+    """
+    Returns `key -> ValuePlan` with the rule `MaskDict` applies to the value of each key.
+
+    With `key_with_type_mask`, the rule of a key is compiled the first time the key is read,
+    so only the keys actually read pay for it. The mask type of a key is resolved by
+    `MaskDispatch.resolve_key`.
+
+    Raises:
+        ValueError: The 'size_anonymization' field must be between 0 and 1.
+        ValueError: The 'size_anonymization' must be a float.
+    """
+    if key_with_type_mask:
+        ValuePlan.compile(**kwargs)  # validates the options up front
+
+        @cache
+        def resolve(key: Any) -> ValuePlan:
+            return ValuePlan.compile(
+                **{**kwargs, "type_mask": MaskDispatch.resolve_key(key)}
+            )
+
+        return resolve
+    if selected_keys:
+        selected = ValuePlan.compile(**kwargs)
+        not_selected = ValuePlan.compile(**{**kwargs, "anonymize_string": False})
+        return lambda key: selected if key in selected_keys else not_selected
+
+    rule = ValuePlan.compile(**kwargs)
+    return lambda key: rule
+
+
+class MaskDictView(Mapping[Any, Any]):
+    """
+    Read-only view of a `dict` that anonymizes each value the first time it is read.
+
+    Values are memoized per key, nested dicts and lists are returned as views too, so parts of
+    the document that are never read are never processed. `materialize` returns the fully
+    anonymized `dict`, equal to `MaskDict(data, ...).anonymize()`, reusing the values already
+    masked.
+
+    Parameters:
+        data (dict): The dictionary to anonymize, read when values are accessed.
+        resolve (Callable[[Any], ValuePlan]): Rule of each key, see `compile_resolver`.
+
+    Note:
+        The view reads `data` lazily, so changes made to `data` before a key is read are seen.
+
+    Examples:
+        >>> view = MaskDictView.from_options(document, key_with_type_mask=True)
+        >>> view["customer"]["email"]  # only this value is masked
+        '******e@example.com'
+        >>> view.anonymized_keys()
+        ['customer']
+    """
+
+    __slots__ = ("_data", "_resolve", "_values")
+
+    def __init__(self, data: dict[Any, Any], resolve: RuleResolver) -> None:
+        self._data = data
+        self._resolve = resolve
+        self._values: dict[Any, Any] = {}
+
+    @classmethod
+    def from_options(
+        cls,
+        data: dict[Any, Any],
+        key_with_type_mask: bool = False,
+        selected_keys: list[str] | None = None,
+        **kwargs: Any,
+    ) -> "MaskDictView":
+        """Creates a view with the options accepted by `MaskDict`."""
+        return cls(data, compile_resolver(key_with_type_mask, selected_keys, **kwargs))
+
+    @classmethod
+    def from_plan(cls, plan: MaskDictPlan, data: dict[Any, Any]) -> "MaskDictView":
+        """Creates a view applying the rules of a compiled plan."""
+        rules_get = plan.rules.get
+        default = plan.default
+        return cls(data, lambda key: rules_get(key, default))
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self._values.get(key, MISSING)
+        if value is MISSING:
+            value = self._values[key] = _wrap(self._data[key], self._resolve(key))
+        return value
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def anonymized_keys(self) -> list[Any]:
+        """Returns the keys whose values were already read."""
+        return list(self._values)
+
+    def materialize(self) -> dict[Any, Any]:
+        """Returns the whole anonymized `dict`, masking the values not read yet."""
+        return {key: _materialize(self[key]) for key in self._data}
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__} of {len(self._data)} keys, "
+            f"{len(self._values)} anonymized>"
+        )
+
+
+class MaskListView(Sequence[Any]):
+    """
+    Read-only view of a `list` that anonymizes each item the first time it is read.
+
+    Works like `MaskDictView`, with the same rule applied to every item.
+    """
+
+    __slots__ = ("_data", "_rule", "_values")
+
+    def __init__(self, data: list[Any], rule: ValuePlan) -> None:
+        self._data = data
+        self._rule = rule
+        self._values: dict[int, Any] = {}
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Any]: ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+
+        size = len(self._data)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("list index out of range")
+        value = self._values.get(index, MISSING)
+        if value is MISSING:
+            value = self._values[index] = _wrap(self._data[index], self._rule)
+        return value
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def materialize(self) -> list[Any]:
+        """Returns the whole anonymized `list`, masking the items not read yet."""
+        return [_materialize(self[index]) for index in range(len(self._data))]
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__} of {len(self._data)} items, "
+            f"{len(self._values)} anonymized>"
+        )
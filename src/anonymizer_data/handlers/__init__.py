@@ -1,11 +1,24 @@
+from .binary import (
+    anonymize_all_string_bytes,
+    anonymize_bytes,
+    anonymize_cep_bytes,
+    anonymize_cnpj_bytes,
+    anonymize_cpf_bytes,
+    anonymize_email_bytes,
+    anonymize_numeric_digits_bytes,
+    anonymize_phone_number_bytes,
+    anonymize_string_bytes,
+)
 from .dispatch import MaskDispatch
 from .functions import (
     anonymize_all_string,
+    anonymize_all_string_column,
     anonymize_cep,
     anonymize_cnpj,
     anonymize_cpf,
     anonymize_email,
     anonymize_numeric_digits,
+    anonymize_numeric_digits_column,
     anonymize_phone_number,
     anonymize_pis,
     anonymize_rg,
@@ -13,19 +26,47 @@ from .functions import (
     anonymize_substring,
     mask_string_part,
 )
+from .keys import KeyRules
+from .scanner import PiiScanner, anonymize_text
+from .validators import (
+    validate_cnpj,
+    validate_cpf,
+    validate_pis,
+    validation_cache_clear,
+    validation_cache_info,
+)
 
 __all__ = [
+    "KeyRules",
     "MaskDispatch",
+    "PiiScanner",
     "anonymize_all_string",
+    "anonymize_all_string_bytes",
+    "anonymize_all_string_column",
+    "anonymize_bytes",
     "anonymize_cep",
+    "anonymize_cep_bytes",
     "anonymize_cnpj",
+    "anonymize_cnpj_bytes",
     "anonymize_cpf",
+    "anonymize_cpf_bytes",
     "anonymize_email",
+    "anonymize_email_bytes",
     "anonymize_numeric_digits",
+    "anonymize_numeric_digits_bytes",
+    "anonymize_numeric_digits_column",
     "anonymize_phone_number",
+    "anonymize_phone_number_bytes",
     "anonymize_pis",
     "anonymize_rg",
     "anonymize_string",
+    "anonymize_string_bytes",
     "anonymize_substring",
+    "anonymize_text",
     "mask_string_part",
+    "validate_cnpj",
+    "validate_cpf",
+    "validate_pis",
+    "validation_cache_clear",
+    "validation_cache_info",
 ]
@@ -0,0 +1,351 @@
+"""
+Handlers for UTF-8 text held in `bytes`, `bytearray` or `memoryview`, such as the payloads of
+log shippers and network proxies.
+
+ASCII input, the common case for documents, phones and emails, is masked directly on its bytes
+without decoding it. Any other input is decoded as UTF-8, masked by the str handler and encoded
+again, so the result is always the same bytes as encoding the result of the str path. Bytes
+that are not valid UTF-8 are kept as they are.
+
+With `in_place=True` the masked value is written back into the given `bytearray` (which may
+change its size) or writable `memoryview` (which may not) and the same object is returned.
+Otherwise a new `bytes` is returned.
+
+Functions:
+    anonymize_bytes: Anonymize a bytes value with the handler of a mask type.
+    anonymize_string_bytes: Bytes version of `anonymize_string`.
+    anonymize_all_string_bytes: Bytes version of `anonymize_all_string`.
+    anonymize_email_bytes: Bytes version of `anonymize_email`.
+    anonymize_phone_number_bytes: Bytes version of `anonymize_phone_number`.
+    anonymize_numeric_digits_bytes: Bytes version of `anonymize_numeric_digits`.
+    anonymize_cpf_bytes: Bytes version of `anonymize_cpf`.
+    anonymize_cnpj_bytes: Bytes version of `anonymize_cnpj`.
+    anonymize_cep_bytes: Bytes version of `anonymize_cep`.
+"""
+
+import re
+from collections.abc import Callable
+from functools import partial, wraps
+from typing import Any
+
+from anonymizer_data.core.config import Config
+
+from .dispatch import MaskDispatch
+from .functions import (
+    anonymize_all_string,
+    anonymize_cep,
+    anonymize_cnpj,
+    anonymize_cpf,
+    anonymize_email,
+    anonymize_numeric_digits,
+    anonymize_phone_number,
+    anonymize_string,
+)
+from .validators import cnpj_validator, cpf_validator
+
+type Buffer = bytes | bytearray | memoryview
+type _AsciiHandler = Callable[..., bytes | bytearray | None]
+
+_DIGITS = b"0123456789"
+_NON_DIGITS = bytes(byte for byte in range(256) if byte not in _DIGITS)
+_DIGIT = re.compile(rb"[0-9]")
+_CEP = re.compile(rb"^[0-9]{5}-?[0-9]{3}$")
+
+
+def _mask_char(kwargs: dict[str, Any]) -> bytes:
+    return kwargs.get("mask_char", Config.default_mask_char).encode()
+
+
+def _check_writable(data: Buffer) -> None:
+    if type(data) is bytes or (type(data) is memoryview and data.readonly):
+        raise TypeError("in_place requires a bytearray or a writable memoryview")
+
+
+def _store(data: Buffer, result: bytes | bytearray) -> Buffer:
+    """Writes `result` over the contents of `data`, returning `data`."""
+    if type(data) is bytearray:
+        data[:] = result
+        return data
+
+    view = memoryview(data).cast("B")
+    if len(result) != view.nbytes:
+        raise ValueError(
+            f"The masked value has {len(result)} bytes and does not fit the "
+            f"{view.nbytes} bytes of the memoryview"
+        )
+    view[:] = result
+    return data
+
+
+def _through_str(
+    handler: Callable[..., Any], data: Buffer, *args: Any, **kwargs: Any
+) -> bytes:
+    text = str(data, "utf-8", "surrogateescape")
+    return str(handler(text, *args, **kwargs)).encode("utf-8", "surrogateescape")
+
+
+def _bytes_variant(handler: Callable[..., str]) -> Callable[[_AsciiHandler], Callable]:
+    """
+    Turns the implementation of `handler` over ASCII bytes into a handler of any buffer.
+
+    The implementation receives a `bytes` or `bytearray` and returns the masked bytes, or None
+    to let `handler` decide, as is done for invalid documents. Input that is not ASCII is
+    always masked by `handler`.
+    """
+
+    def decorator(ascii_handler: _AsciiHandler) -> Callable:
+        @wraps(ascii_handler)
+        def wrapper(
+            data: Buffer, *args: Any, in_place: bool = False, **kwargs: Any
+        ) -> Buffer:
+            if in_place:
+                _check_writable(data)
+            source = data.tobytes() if type(data) is memoryview else data
+            result = (
+                ascii_handler(source, *args, **kwargs) if source.isascii() else None
+            )
+            if result is None:
+                result = _through_str(handler, source, *args, **kwargs)
+            return _store(data, result) if in_place else bytes(result)
+
+        return wrapper
+
+    return decorator
+
+
+def _mask_prefix(
+    data: bytes | bytearray, size_anonymization: float, mask: bytes
+) -> bytes:
+    """Same as `anonymize_string` for ASCII bytes."""
+    if size_anonymization == 0:
+        return bytes(data)
+
+    total_to_mask = 1 if len(data) == 1 else int(len(data) * size_anonymization)
+    if total_to_mask > 0:
+        return b"".join((mask * total_to_mask, data[total_to_mask:]))
+    if total_to_mask == 0:
+        return b""
+
+    sliced = data[total_to_mask:]
+    start = data.find(sliced)
+    return b"".join((data[:start], mask * -total_to_mask, data[start + len(sliced) :]))
+
+
+def _mask_part(
+    data: bytes | bytearray,
+    start: int,
+    end: int,
+    mask: bytes,
+    occurrences: int = 1,
+    **kwargs: Any,
+) -> bytes | bytearray:
+    """Same as `mask_string_part` for ASCII bytes."""
+    if occurrences < 0:
+        return data
+    return data.replace(data[start:end], mask * (end - start), occurrences or -1)
+
+
+@MaskDispatch.register_bytes(*MaskDispatch.type_masks_of(anonymize_string))
+@_bytes_variant(anonymize_string)
+def anonymize_string_bytes(
+    value: bytes | bytearray, size_anonymization: float, **kwargs: Any
+) -> bytes:
+    """
+    Bytes version of `anonymize_string`, masking a fraction of the characters.
+
+    Examples:
+        >>> anonymize_string_bytes(b"Hello world", 0.5)
+        b'***** world'
+    """
+    return _mask_prefix(value, size_anonymization, _mask_char(kwargs))
+
+
+@MaskDispatch.register_bytes(*MaskDispatch.type_masks_of(anonymize_all_string))
+@_bytes_variant(anonymize_all_string)
+def anonymize_all_string_bytes(value: bytes | bytearray, **kwargs: Any) -> bytes:
+    """Bytes version of `anonymize_all_string`, masking every character."""
+    return _mask_char(kwargs) * len(value)
+
+
+@MaskDispatch.register_bytes(*MaskDispatch.type_masks_of(anonymize_email))
+@_bytes_variant(anonymize_email)
+def anonymize_email_bytes(email: bytes | bytearray, **kwargs: Any) -> bytes | None:
+    """
+    Bytes version of `anonymize_email`, masking the username and keeping the domain.
+
+    Examples:
+        >>> anonymize_email_bytes(b"jhondoe@example.com")
+        b'******e@example.com'
+    """
+    username, separator, domain = email.partition(b"@")
+    if not separator or not username or not domain:
+        return None
+    return b"".join(
+        (_mask_prefix(username, 0.9, _mask_char(kwargs)), separator, domain)
+    )
+
+
+@MaskDispatch.register_bytes(*MaskDispatch.type_masks_of(anonymize_phone_number))
+@_bytes_variant(anonymize_phone_number)
+def anonymize_phone_number_bytes(
+    phone: bytes | bytearray, **kwargs: Any
+) -> bytes | bytearray | None:
+    """
+    Bytes version of `anonymize_phone_number`, masking all digits but the last three.
+
+    Examples:
+        >>> anonymize_phone_number_bytes(b"+55 (11) 91234-5678")
+        b'+** (**) *****-*678'
+    """
+    total_digits = len(phone) - len(phone.translate(None, _DIGITS))
+    if total_digits < 3:
+        return None
+    if total_digits == 3:
+        return phone
+
+    template = _mask_char(kwargs).replace(b"\\", b"\\\\")
+    return _DIGIT.sub(template, phone, count=total_digits - 3)
+
+
+@MaskDispatch.register_bytes(*MaskDispatch.type_masks_of(anonymize_numeric_digits))
+@_bytes_variant(anonymize_numeric_digits)
+def anonymize_numeric_digits_bytes(
+    value: bytes | bytearray, **kwargs: Any
+) -> bytes | bytearray:
+    """
+    Bytes version of `anonymize_numeric_digits`, masking every digit.
+
+    Examples:
+        >>> anonymize_numeric_digits_bytes(b"My phone is 1234567890")
+        b'My phone is **********'
+    """
+    mask = _mask_char(kwargs)
+    if len(mask) == 1:
+        return value.translate(bytes.maketrans(_DIGITS, mask * 10))
+    return _DIGIT.sub(mask.replace(b"\\", b"\\\\"), value)
+
+
+@MaskDispatch.register_bytes(*MaskDispatch.type_masks_of(anonymize_cpf))
+@_bytes_variant(anonymize_cpf)
+def anonymize_cpf_bytes(
+    cpf: bytes | bytearray, **kwargs: Any
+) -> bytes | bytearray | None:
+    """
+    Bytes version of `anonymize_cpf`.
+
+    The checksum is verified by the same validator, and its cache, as the str handler.
+
+    Examples:
+        >>> anonymize_cpf_bytes(b"529.982.247-25")
+        b'***.982.***-**'
+    """
+    if not cpf_validator.validate(cpf.decode("ascii")):
+        return None
+
+    mask = _mask_char(kwargs)
+    digits = cpf.translate(None, _NON_DIGITS)
+    if b"." in cpf and b"-" in cpf:
+        return b"%s.%s.%s-%s" % (mask * 3, digits[3:6], mask * 3, mask * 2)
+    return _mask_part(digits, 0, 9, mask, **kwargs)
+
+
+@MaskDispatch.register_bytes(*MaskDispatch.type_masks_of(anonymize_cnpj))
+@_bytes_variant(anonymize_cnpj)
+def anonymize_cnpj_bytes(
+    cnpj: bytes | bytearray, **kwargs: Any
+) -> bytes | bytearray | None:
+    """
+    Bytes version of `anonymize_cnpj`.
+
+    The checksum is verified by the same validator, and its cache, as the str handler.
+
+    Examples:
+        >>> anonymize_cnpj_bytes(b"11.222.333/0001-81")
+        b'**.***.333/****-**'
+    """
+    if not cnpj_validator.validate(cnpj.decode("ascii")):
+        return None
+
+    mask = _mask_char(kwargs)
+    digits = cnpj.translate(None, _NON_DIGITS)
+    if b"." in cnpj and b"-" in cnpj and b"/" in cnpj:
+        return b"%s.%s.%s/%s-%s" % (
+            mask * 2,
+            mask * 3,
+            digits[5:8],
+            mask * 4,
+            mask * 2,
+        )
+    return _mask_part(digits, 0, 9, mask, **kwargs)
+
+
+@MaskDispatch.register_bytes(*MaskDispatch.type_masks_of(anonymize_cep))
+@_bytes_variant(anonymize_cep)
+def anonymize_cep_bytes(
+    cep: bytes | bytearray, **kwargs: Any
+) -> bytes | bytearray | None:
+    """
+    Bytes version of `anonymize_cep`.
+
+    Examples:
+        >>> anonymize_cep_bytes(b"12345-678")
+        b'*****-678'
+    """
+    if not _CEP.match(cep):
+        return None
+
+    mask = _mask_char(kwargs)
+    if b"-" in cep:
+        return b"%s-%s" % (mask * 5, cep[6:])
+    return _mask_part(cep.translate(None, _NON_DIGITS), 0, 5, mask, **kwargs)
+
+
+def anonymize_bytes(
+    data: Buffer, type_mask: str, *, in_place: bool = False, **kwargs: Any
+) -> Buffer:
+    """
+    Anonymize UTF-8 text held in bytes with the handler of `type_mask`.
+
+    Mask types with a bytes handler (strings, emails, phones, digits, CPF, CNPJ and CEP) mask
+    ASCII values without decoding them. The others decode the value, mask it with their str
+    handler and encode the result. Bytes handlers do not use the result cache.
+
+    Parameters:
+        data (bytes | bytearray | memoryview): The value to anonymize, as UTF-8.
+        type_mask (str): The mask type, as accepted by `MaskDispatch`.
+        in_place (Optional[bool]): If true, the masked value is written into `data`, which
+            must be a `bytearray` or a writable `memoryview`, and `data` is returned.
+        **kwargs: Options of the handler, such as `mask_char`.
+
+    Returns:
+        bytes | bytearray | memoryview: The masked bytes, or `data` itself when `in_place` is
+            true or `type_mask` has no handler.
+
+    Raises:
+        TypeError: in_place requires a bytearray or a writable memoryview.
+        ValueError: The masked value has {n} bytes and does not fit the {m} bytes of the
+            memoryview.
+
+    Examples:
+        >>> anonymize_bytes(b"529.982.247-25", "cpf")
+        b'***.982.***-**'
+        >>> buffer = bytearray(b"jhondoe@example.com")
+        >>> anonymize_bytes(buffer, "email", in_place=True)
+        bytearray(b'******e@example.com')
+    """
+    handler = MaskDispatch._bytes_handlers.get(type_mask)
+    if handler is not None:
+        if Config.metrics:
+            return MaskDispatch.metrics.call(
+                type_mask, data, partial(handler, data, in_place=in_place, **kwargs)
+            )
+        return handler(data, in_place=in_place, **kwargs)
+    if type_mask not in MaskDispatch._handlers:
+        if Config.metrics:
+            MaskDispatch.metrics.record_unmatched(type_mask)
+        return data
+
+    if in_place:
+        _check_writable(data)
+    result = _through_str(partial(MaskDispatch().mask, type_mask), data, **kwargs)
+    return _store(data, result) if in_place else result
@@ -1,10 +1,75 @@
-from typing import Any, Callable
+import re
+from collections.abc import Iterable
+from functools import partial
+from typing import Any, Callable, ClassVar
+
+from anonymizer_data.core.cache import MISSING, CacheInfo, LRUCache
+from anonymizer_data.core.config import Config
+from anonymizer_data.core.metrics import MetricsRegistry, MetricsSnapshot
+
+from .keys import KeyRules, resolve_key
+
+type Masker = Callable[[Any], Any]
+type Validator = Callable[[str], bool]
+
+
+def _freeze(kwargs: dict[str, Any]) -> tuple:
+    """Hashable form of the options, with types so that `1` and `True` stay apart."""
+    return tuple((key, type(value), value) for key, value in sorted(kwargs.items()))
+
+
+class _KeyIndex(dict[Any, Any]):
+    """
+    Mask type of each dict key, resolved with `MaskDispatch.key_rules` on first lookup.
+
+    At most `maxsize` keys are kept, the oldest is forgotten first, so payloads whose keys
+    are ids, hashes or timestamps do not grow it without limit. Lookups of known keys stay
+    plain dict reads.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __missing__(self, key: Any) -> Any:
+        type_mask = key
+        if type(key) is str:
+            type_mask = (
+                resolve_key(key, MaskDispatch.key_rules, MaskDispatch._handlers) or key
+            )
+        if len(self) >= self.maxsize:
+            del self[next(iter(self))]
+        self[key] = type_mask
+        return type_mask
 
 
 class MaskDispatch:
-    """Class responsible for managing anonymization handlers."""
+    """
+    Class responsible for managing anonymization handlers.
+
+    Results can be memoized by setting `Config.result_cache_size`: they are kept in
+    `MaskDispatch.result_cache`, keyed by the mask type, the value and the effective options
+    (including the global mask char, strict mode and fallback masking).
 
-    _handlers: dict[str, Callable[..., Any]] = {}
+    With `Config.metrics`, every value masked through the dispatcher is counted in
+    `MaskDispatch.metrics`, see `metrics_snapshot`.
+
+    With `key_with_type_mask`, dict keys are resolved to a mask type by `resolve_key`, which
+    follows `key_rules` and remembers the result of the last `key_index.maxsize` keys in
+    `key_index`.
+    """
+
+    _handlers: ClassVar[dict[str, Callable[..., Any]]] = {}
+    _column_handlers: ClassVar[dict[str, Callable[..., list[Any]]]] = {}
+    _bytes_handlers: ClassVar[dict[str, Callable[..., Any]]] = {}
+    _patterns: ClassVar[dict[str, tuple[str, Validator | None]]] = {}
+    result_cache: LRUCache[tuple, Any] = LRUCache()
+    key_rules: KeyRules = KeyRules()
+    key_index: _KeyIndex = _KeyIndex(maxsize=4096)
+    metrics: MetricsRegistry = MetricsRegistry()
+    # Default `PiiScanner` of `anonymize_text`, built on first use and dropped whenever a
+    # pattern or a handler is registered.
+    default_scanner: Any = None
 
     @classmethod
     def register(cls, *type_masks: str) -> Callable:
@@ -17,13 +82,281 @@ class MaskDispatch:
 
         return decorator
 
+    @classmethod
+    def register_column(cls, *type_masks: str) -> Callable:
+        """
+        Decorator to register a native column implementation for specific mask types.
+
+        The handler receives the whole sequence of values plus the options and must return a
+        list with the same result as calling the per-value handler on each value. It must be
+        registered after the per-value handler, since `add_handler` discards it.
+        """
+
+        def decorator(handler: Callable) -> Callable:
+            for type_mask in type_masks:
+                cls._column_handlers[type_mask] = handler
+            return handler
+
+        return decorator
+
+    @classmethod
+    def register_bytes(cls, *type_masks: str) -> Callable:
+        """
+        Decorator to register a native bytes implementation for specific mask types.
+
+        The handler receives a `bytes`, `bytearray` or `memoryview` holding UTF-8 text, the
+        `in_place` flag and the options, and must return the same bytes as encoding the result
+        of the per-value handler. It must be registered after the per-value handler, since
+        `add_handler` discards it.
+        """
+
+        def decorator(handler: Callable) -> Callable:
+            for type_mask in type_masks:
+                cls._bytes_handlers[type_mask] = handler
+            return handler
+
+        return decorator
+
+    @classmethod
+    def register_pattern(
+        cls, type_mask: str, pattern: str, validator: Validator | None = None
+    ) -> Callable:
+        """
+        Decorator to register how values of a mask type are found inside free text.
+
+        `pattern` is a regular expression without capturing groups, and `validator` optionally
+        confirms each candidate (for example a checksum). The patterns are combined by
+        `PiiScanner`, in which candidates with a validator are tried first.
+
+        Raises:
+            ValueError: The pattern of {type_mask} must not have capturing groups.
+        """
+        if re.compile(pattern).groups:
+            raise ValueError(
+                f"The pattern of {type_mask!r} must not have capturing groups"
+            )
+
+        def decorator(handler: Callable) -> Callable:
+            cls._patterns[type_mask] = (pattern, validator)
+            cls.default_scanner = None
+            return handler
+
+        return decorator
+
     @classmethod
     def add_handler(cls, type_mask: str, handler: Callable) -> None:
         """Adds a handler for a specific mask type."""
         cls._handlers[type_mask] = handler
+        cls._column_handlers.pop(type_mask, None)
+        cls._bytes_handlers.pop(type_mask, None)
+        cls.result_cache.clear()
+        cls.key_index.clear()
+        cls.default_scanner = None
+
+    @classmethod
+    def resolve_key(cls, key: Any) -> Any:
+        """
+        Returns the mask type used for the values of a dict key with `key_with_type_mask`.
+
+        A key that is a registered mask type is used as is. Otherwise `key_rules` is followed
+        (case folding, camelCase and snake_case words, known prefixes, suffixes and aliases),
+        and when nothing matches the key itself is returned, so its values are not masked.
+        Each key is analyzed once, later lookups read `key_index`, which keeps the last
+        `key_index.maxsize` keys.
+
+        Examples:
+            >>> MaskDispatch.resolve_key("userCpf")
+            'cpf'
+            >>> MaskDispatch.resolve_key("tags")
+            'tags'
+        """
+        return cls.key_index[key]
+
+    @classmethod
+    def set_key_rules(cls, rules: KeyRules) -> None:
+        """
+        Replaces the rules used to resolve dict keys and forgets the keys already resolved.
+
+        Use `KeyRules.exact()` to only accept keys that are registered mask types. Plans and
+        lazy views keep the keys they already resolved.
+        """
+        cls.key_rules = rules
+        cls.key_index.clear()
+
+    @classmethod
+    def type_masks_of(cls, handler: Callable) -> tuple[str, ...]:
+        """Returns the mask types registered for `handler`."""
+        return tuple(
+            type_mask
+            for type_mask, registered in cls._handlers.items()
+            if registered is handler
+        )
+
+    @classmethod
+    def cache_info(cls) -> CacheInfo:
+        """Returns hits, misses and size of the result cache."""
+        cls._sync_cache_size()
+        return cls.result_cache.info()
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Empties the result cache and resets its statistics."""
+        cls.result_cache.clear()
+
+    @classmethod
+    def metrics_snapshot(cls) -> MetricsSnapshot:
+        """
+        Returns the metrics recorded while `Config.metrics` is true.
+
+        Each value masked by `mask`, `bind`, `mask_column`, `anonymize_bytes` or `PiiScanner`
+        adds a call, its time and its size in bytes to the stats of its mask type, including
+        values served by the result cache. Handlers called directly are not counted.
+
+        Examples:
+            >>> Config.setup(metrics=True)
+            >>> MaskDispatch().mask("cpf", "529.982.247-26")
+            '**************'
+            >>> MaskDispatch().mask("tags", "vip")
+            'vip'
+            >>> snapshot = MaskDispatch.metrics_snapshot()
+            >>> snapshot.handlers["cpf"].calls, snapshot.invalid, snapshot.unmatched
+            (1, {'CPF': 1}, {'tags': 1})
+        """
+        return cls.metrics.snapshot(cls.cache_info())
+
+    @classmethod
+    def metrics_reset(cls) -> None:
+        """Sets the metrics back to zero, leaving the result cache statistics as they are."""
+        cls.metrics.reset()
+
+    @classmethod
+    def _sync_cache_size(cls) -> None:
+        if cls.result_cache.maxsize != Config.result_cache_size:
+            cls.result_cache.maxsize = Config.result_cache_size
+
+    @classmethod
+    def _mask_cached(
+        cls,
+        type_mask: str,
+        handler: Callable[..., Any],
+        data: Any,
+        kwargs: dict[str, Any],
+        frozen_kwargs: tuple,
+    ) -> Any:
+        cls._sync_cache_size()
+        cache = cls.result_cache
+
+        key = (
+            type_mask,
+            type(data),
+            data,
+            kwargs.get("mask_char", Config.default_mask_char),
+            Config.strict_mode,
+            Config.fallback_masking,
+            frozen_kwargs,
+        )
+        try:
+            result = cache.get(key, MISSING)
+        except TypeError:  # unhashable data or options
+            return handler(data, **kwargs)
+
+        if result is MISSING:
+            result = handler(data, **kwargs)
+            cache.put(key, result)
+        return result
 
     def mask(self, type_mask: str, data: Any, **kwargs: Any) -> Any:
         """Applies the appropriate mask to the given data if the type exists."""
         if type_mask not in self._handlers:
+            if Config.metrics:
+                self.metrics.record_unmatched(type_mask)
             return data
+        if Config.metrics:
+            return self.metrics.call(
+                type_mask, data, self._apply, type_mask, data, kwargs
+            )
+        if Config.result_cache_size > 0:
+            return self._mask_cached(
+                type_mask, self._handlers[type_mask], data, kwargs, _freeze(kwargs)
+            )
         return self._handlers[type_mask](data, **kwargs)
+
+    @classmethod
+    def _apply(cls, type_mask: str, data: Any, kwargs: dict[str, Any]) -> Any:
+        """Body of `mask` for a registered mask type, without the metrics."""
+        handler = cls._handlers[type_mask]
+        if Config.result_cache_size > 0:
+            return cls._mask_cached(type_mask, handler, data, kwargs, _freeze(kwargs))
+        return handler(data, **kwargs)
+
+    def bind(self, type_mask: str, **kwargs: Any) -> Masker:
+        """
+        Resolves the handler of `type_mask` once, returning `data -> masked data`.
+
+        The returned callable gives the same result as `mask(type_mask, data, **kwargs)`,
+        including the use of the result cache, without looking the handler up on each call.
+        Handlers registered later for `type_mask` are not seen by it.
+        """
+        handler = self._handlers.get(type_mask)
+        if handler is None:
+            return self._keep_unmatched(type_mask)
+
+        frozen_kwargs = _freeze(kwargs)
+        mask_cached = self._mask_cached
+        metrics = self.metrics
+
+        def apply(data: Any) -> Any:
+            if Config.result_cache_size > 0:
+                return mask_cached(type_mask, handler, data, kwargs, frozen_kwargs)
+            return handler(data, **kwargs)
+
+        def masker(data: Any) -> Any:
+            if Config.metrics:
+                return metrics.call(type_mask, data, apply, data)
+            if Config.result_cache_size > 0:
+                return mask_cached(type_mask, handler, data, kwargs, frozen_kwargs)
+            return handler(data, **kwargs)
+
+        return masker
+
+    @classmethod
+    def _keep_unmatched(cls, type_mask: Any) -> Masker:
+        """`data -> data`, counting each value kept while `Config.metrics` is true."""
+        metrics = cls.metrics
+
+        def keep(data: Any) -> Any:
+            if Config.metrics:
+                metrics.record_unmatched(type_mask)
+            return data
+
+        return keep
+
+    def mask_column(
+        self, type_mask: str, values: Iterable[Any], **kwargs: Any
+    ) -> list[Any]:
+        """
+        Applies the mask of `type_mask` to every value of a column.
+
+        The handler, the mask char and the options are resolved a single time for the whole
+        column. The result is the same as calling `mask` for each value, although native
+        column handlers do not use the result cache.
+
+        Examples:
+            >>> MaskDispatch().mask_column("cep", ["12345-678", "87654321"])
+            ['*****-678', '*****321']
+        """
+        if type_mask not in self._handlers:
+            return list(map(self._keep_unmatched(type_mask), values))
+
+        kwargs.setdefault("mask_char", Config.default_mask_char)
+
+        column_handler = self._column_handlers.get(type_mask)
+        if column_handler is not None:
+            if Config.metrics:
+                values = list(values)
+                return self.metrics.call_column(
+                    type_mask, values, partial(column_handler, values, **kwargs)
+                )
+            return column_handler(values, **kwargs)
+
+        return list(map(self.bind(type_mask, **kwargs), values))
@@ -10,18 +10,42 @@ Functions:
     anonymize_cnpj: Anonymize a Brazilian CNPJ (Cadastro Nacional da Pessoa Jurídica) number by masking parts of it.
     anonymize_rg: Anonymize a Brazilian RG (Registro Geral) number by masking parts of it.
     anonymize_pis: Anonymize a Brazilian PIS (Programa de Integração Social) number by masking parts of it.
+    anonymize_all_string_column: Anonymize all characters of every string of a column.
+    anonymize_numeric_digits_column: Anonymize all numeric digits of every string of a column.
 """
 
 import re
+from collections.abc import Iterable
 from typing import Any
 
-from validate_docbr import CNPJ, CPF, PIS
 from anonymizer_data.core.config import Config
 from .dispatch import MaskDispatch
+from .validators import cnpj_validator, cpf_validator, pis_validator
+
+_DIGIT = re.compile(r"\d")
+_NON_DIGIT = re.compile(r"[^0-9]")
+_RG = re.compile(r"^(?:\d{9}|\d{2}\.\d{3}\.\d{3}-\d)$")
+_CEP = re.compile(r"^\d{5}-?\d{3}$")
+
+
+def _replace_literal(string: str, old: str, new: str, count: int) -> str:
+    """Same as `re.sub(re.escape(old), new, string, count=count)` for a literal `new`."""
+    if count < 0:
+        return string
+    if count == 0:
+        return string.replace(old, new)
+    return string.replace(old, new, count)
+
+
+def _literal_template(mask_char: str) -> str:
+    """Escapes `mask_char` to be used as a literal regex replacement."""
+    return mask_char.replace("\\", "\\\\")
 
 
 def _handle_invalid_doc(doc: str, doc_name: str, **kwargs: Any) -> str:
     """Helper to handle invalid documents according to Config."""
+    if Config.metrics:
+        MaskDispatch.metrics.record_invalid(doc_name)
     if Config.strict_mode:
         raise ValueError(f"Invalid {doc_name}: {doc}")
     if Config.fallback_masking:
@@ -50,14 +74,20 @@ def anonymize_string(value: str, size_anonymization: float, **kwargs: Any) -> st
 
     mask_char = kwargs.get("mask_char", Config.default_mask_char)
     total_to_mask = 1 if len(value) == 1 else int(len(value) * size_anonymization)
-    string_sliced = (
-        value[:total_to_mask] if total_to_mask > 0 else value[total_to_mask:]
+
+    if total_to_mask > 0:
+        return mask_char * total_to_mask + value[total_to_mask:]
+    if total_to_mask == 0:
+        return ""
+
+    string_sliced = value[total_to_mask:]
+    start = value.find(string_sliced)
+    return (
+        value[:start] + mask_char * -total_to_mask + value[start + len(string_sliced) :]
     )
-    pattern = re.escape(string_sliced)
-    modified = re.sub(pattern, mask_char * abs(total_to_mask), value, count=1)
-    return modified
 
 
+@MaskDispatch.register_pattern("email", r"(?<![\w.+-])[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
 @MaskDispatch.register("email", "mail")
 def anonymize_email(email: str, **kwargs: Any) -> str:
     """
@@ -85,6 +115,10 @@ def anonymize_email(email: str, **kwargs: Any) -> str:
     return f"{masked_username}@{domain}"
 
 
+@MaskDispatch.register_pattern(
+    "phone",
+    r"(?<![\w+])(?:\+\d{2,3}[ \t]?)?(?:\(\d{2}\)|\d{2})[ \t]?9?\d{4}[- \t]?\d{4}(?!\w)",
+)
 @MaskDispatch.register(
     "phone",
     "smartphone",
@@ -111,22 +145,15 @@ def anonymize_phone_number(phone: str, **kwargs: Any) -> str:
     if not isinstance(phone, str):
         return _handle_invalid_doc(str(phone), "Phone", **kwargs)
 
-    phone_digits = re.findall(r"\d", phone)
+    total_digits = len(_DIGIT.findall(phone))
 
-    if len(phone_digits) < 3:
+    if total_digits < 3:
         return _handle_invalid_doc(phone, "Phone", **kwargs)
+    if total_digits == 3:
+        return phone
 
     mask_char = kwargs.get("mask_char", Config.default_mask_char)
-    last_three = phone_digits[-3:]
-    anonymized = [mask_char] * (len(phone_digits) - 3)
-
-    replace_iter = iter(anonymized + last_three)
-
-    def to_replace(match):
-        return next(replace_iter)
-
-    phone_anonymized = re.sub(r"\d", to_replace, phone)
-    return phone_anonymized
+    return _DIGIT.sub(_literal_template(mask_char), phone, count=total_digits - 3)
 
 
 def mask_string_part(
@@ -148,8 +175,9 @@ def mask_string_part(
         str: The modified string with the specified substring replaced by asterisks.
     """
     mask_char = kwargs.get("mask_char", Config.default_mask_char)
-    pattern = re.escape(string[start:end])
-    return re.sub(pattern, mask_char * (end - start), string, count=occurrences)
+    return _replace_literal(
+        string, string[start:end], mask_char * (end - start), occurrences
+    )
 
 
 @MaskDispatch.register("numero", "number")
@@ -167,7 +195,15 @@ def anonymize_numeric_digits(string: str, **kwargs: Any) -> str:
         str: The modified string with all numeric digits replaced by asterisks.
     """
     mask_char = kwargs.get("mask_char", Config.default_mask_char)
-    return re.sub(r"\d", mask_char, str(string))
+    return _DIGIT.sub(_literal_template(mask_char), str(string))
+
+
+@MaskDispatch.register_column("numero", "number")
+def anonymize_numeric_digits_column(values: Iterable[Any], **kwargs: Any) -> list[str]:
+    """Column version of `anonymize_numeric_digits`, compiling the pattern once."""
+    template = _literal_template(kwargs.get("mask_char", Config.default_mask_char))
+    sub = _DIGIT.sub
+    return [sub(template, str(value)) for value in values]
 
 
 def anonymize_substring(
@@ -188,13 +224,14 @@ def anonymize_substring(
         str: The modified text with the specified substring replaced by asterisks.
     """
     mask_char = kwargs.get("mask_char", Config.default_mask_char)
-    escaped_substring = re.escape(substring)
-    anonymized_text = re.sub(
-        escaped_substring, mask_char * len(substring), str(main_text), count=occurrences
+    return _replace_literal(
+        str(main_text), substring, mask_char * len(substring), occurrences
     )
-    return anonymized_text
 
 
+@MaskDispatch.register_pattern(
+    "cpf", r"(?<![\w.])\d{3}\.?\d{3}\.?\d{3}-?\d{2}(?!\w)", cpf_validator.validate
+)
 @MaskDispatch.register("cpf", "cpfs")
 def anonymize_cpf(cpf: str, **kwargs: Any) -> str:
     """
@@ -211,18 +248,22 @@ def anonymize_cpf(cpf: str, **kwargs: Any) -> str:
     Returns:
         str: The masked version of the CPF number.
     """
-    validate_cpf = CPF()
-    if not isinstance(cpf, str) or not validate_cpf.validate(cpf):
+    if not isinstance(cpf, str) or not cpf_validator.validate(cpf):
         return _handle_invalid_doc(str(cpf), "CPF", **kwargs)
 
     mask_char = kwargs.get("mask_char", Config.default_mask_char)
-    pattern = re.sub(r"[^0-9]", "", cpf)
+    pattern = _NON_DIGIT.sub("", cpf)
 
     if "." in cpf and "-" in cpf:
         return f"{mask_char*3}.{pattern[3:6]}.{mask_char*3}-{mask_char*2}"
     return mask_string_part(pattern, start=0, end=9, **kwargs)
 
 
+@MaskDispatch.register_pattern(
+    "cnpj",
+    r"(?<![\w.])\d{2}\.?\d{3}\.?\d{3}/?\d{4}-?\d{2}(?!\w)",
+    cnpj_validator.validate,
+)
 @MaskDispatch.register("cnpj")
 def anonymize_cnpj(cnpj: str, **kwargs: Any) -> str:
     """
@@ -239,12 +280,11 @@ def anonymize_cnpj(cnpj: str, **kwargs: Any) -> str:
     Returns:
         str: The masked version of the CNPJ number.
     """
-    validate_cnpj = CNPJ()
-    if not isinstance(cnpj, str) or not validate_cnpj.validate(cnpj):
+    if not isinstance(cnpj, str) or not cnpj_validator.validate(cnpj):
         return _handle_invalid_doc(str(cnpj), "CNPJ", **kwargs)
 
     mask_char = kwargs.get("mask_char", Config.default_mask_char)
-    pattern = re.sub(r"[^0-9]", "", cnpj)
+    pattern = _NON_DIGIT.sub("", cnpj)
 
     if (
         "." in cnpj and "-" in cnpj and "/" in cnpj
@@ -253,6 +293,7 @@ def anonymize_cnpj(cnpj: str, **kwargs: Any) -> str:
     return mask_string_part(pattern, start=0, end=9, **kwargs)
 
 
+@MaskDispatch.register_pattern("rg", r"(?<![\w.])\d{2}\.\d{3}\.\d{3}-\d(?!\w)")
 @MaskDispatch.register("rg")
 def anonymize_rg(rg: str, **kwargs: Any) -> str:
     """
@@ -269,19 +310,18 @@ def anonymize_rg(rg: str, **kwargs: Any) -> str:
     Returns:
         str: The masked version of the RG number.
     """
-    if not isinstance(rg, str) or not re.match(
-        r"^(?:\d{9}|\d{2}\.\d{3}\.\d{3}-\d)$", rg
-    ):
+    if not isinstance(rg, str) or not _RG.match(rg):
         return _handle_invalid_doc(str(rg), "RG", **kwargs)
 
     mask_char = kwargs.get("mask_char", Config.default_mask_char)
-    pattern = re.sub(r"[^0-9]", "", rg)
+    pattern = _NON_DIGIT.sub("", rg)
 
     if "." in rg and "-" in rg:
         return f"{mask_char*2}.{pattern[2:5]}.{mask_char*3}-{mask_char*2}"
     return mask_string_part(pattern, start=0, end=6, **kwargs)
 
 
+@MaskDispatch.register_pattern("cep", r"(?<![\w.-])\d{5}-\d{3}(?![\w-])")
 @MaskDispatch.register("cep")
 def anonymize_cep(cep: str, **kwargs: Any) -> str:
     """
@@ -298,17 +338,20 @@ def anonymize_cep(cep: str, **kwargs: Any) -> str:
     Returns:
         str: The masked version of the CEP number.
     """
-    if not isinstance(cep, str) or not re.match(r"^\d{5}-?\d{3}$", cep):
+    if not isinstance(cep, str) or not _CEP.match(cep):
         return _handle_invalid_doc(str(cep), "CEP", **kwargs)
 
     mask_char = kwargs.get("mask_char", Config.default_mask_char)
-    pattern = re.sub(r"[^0-9]", "", cep)
+    pattern = _NON_DIGIT.sub("", cep)
 
     if "-" in cep:
         return f"{mask_char*5}-{cep[6:]}"
     return mask_string_part(pattern, start=0, end=5, **kwargs)
 
 
+@MaskDispatch.register_pattern(
+    "pis", r"(?<![\w.])\d{3}\.?\d{5}\.?\d{2}-?\d(?!\w)", pis_validator.validate
+)
 @MaskDispatch.register("pis")
 def anonymize_pis(pis: str, **kwargs: Any) -> str:
     """
@@ -325,13 +368,11 @@ def anonymize_pis(pis: str, **kwargs: Any) -> str:
     Returns:
         str: The masked version of the PIS number.
     """
-    validate_pis = PIS()
-
-    if not isinstance(pis, str) or not validate_pis.validate(pis):
+    if not isinstance(pis, str) or not pis_validator.validate(pis):
         return _handle_invalid_doc(str(pis), "PIS", **kwargs)
 
     mask_char = kwargs.get("mask_char", Config.default_mask_char)
-    pattern = re.sub(r"[^0-9]", "", pis)
+    pattern = _NON_DIGIT.sub("", pis)
 
     if "-" in pis:
         return f"{mask_char*3}.{mask_char*2}{pattern[5:8]}.{mask_char*2}-{mask_char}"
@@ -367,3 +408,10 @@ def anonymize_pis(pis: str, **kwargs: Any) -> str:
 def anonymize_all_string(string: str, **kwargs: Any) -> str:
     """Anonymize all characters of a string."""
     return anonymize_string(str(string), size_anonymization=1.0, **kwargs)
+
+
+@MaskDispatch.register_column(*MaskDispatch.type_masks_of(anonymize_all_string))
+def anonymize_all_string_column(values: Iterable[Any], **kwargs: Any) -> list[str]:
+    """Column version of `anonymize_all_string`, without regex work per value."""
+    mask_char = kwargs.get("mask_char", Config.default_mask_char)
+    return [mask_char * len(str(value)) for value in values]
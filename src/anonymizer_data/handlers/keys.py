@@ -0,0 +1,166 @@
+import re
+from collections.abc import Container, Iterator, Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any
+
+_CAMEL_BOUNDARY = re.compile(r"(?<=[^\W_])(?<![A-Z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])")
+_SEPARATORS = re.compile(r"[\W_]+")
+
+DEFAULT_PREFIXES = frozenset(
+    {
+        "billing",
+        "cliente",
+        "client",
+        "contact",
+        "contato",
+        "customer",
+        "home",
+        "main",
+        "num",
+        "numero",
+        "nr",
+        "personal",
+        "primary",
+        "principal",
+        "shipping",
+        "user",
+        "usuario",
+    }
+)
+DEFAULT_SUFFIXES = frozenset(
+    {
+        "celular",
+        "cliente",
+        "comercial",
+        "completo",
+        "customer",
+        "empresa",
+        "fixo",
+        "number",
+        "numero",
+        "pessoal",
+        "principal",
+        "residencial",
+        "responsavel",
+        "titular",
+        "user",
+        "usuario",
+        "value",
+    }
+)
+DEFAULT_ALIASES: Mapping[str, str] = MappingProxyType(
+    {
+        "e_mail": "email",
+        "email_address": "email",
+        "fone": "phone",
+        "mobile": "phone",
+        "tel": "phone",
+        "zip": "cep",
+        "zip_code": "cep",
+        "zipcode": "cep",
+    }
+)
+
+
+@dataclass(frozen=True, slots=True)
+class KeyRules:
+    """
+    Rules to find the mask type of a dict key that is not a registered mask type itself.
+
+    The key is tried as is first. Then, in order: its case folded form, its words joined by
+    `_` (camelCase, snake_case and kebab-case are split into words) and joined without a
+    separator, and the same after dropping the known leading and trailing words. Each form is
+    also looked up in `aliases`. The first form that is a registered mask type is used, so
+    `CPF`, `userCpf`, `cpf_titular` and `telefoneCelular` resolve to `cpf`, `cpf`, `cpf` and
+    `telefone`.
+
+    Attributes:
+        case_fold (bool): Compare the keys ignoring case.
+        split_words (bool): Split the keys into words and drop `prefixes` and `suffixes`.
+        prefixes (frozenset[str]): Leading words that are dropped, such as `user`.
+        suffixes (frozenset[str]): Trailing words that are dropped, such as `titular`.
+        aliases (Mapping[str, str]): Mask type of other names, such as `zip` for `cep`.
+
+    Examples:
+        >>> rules = KeyRules()
+        >>> list(rules.candidates("userCpf"))
+        ['usercpf', 'user_cpf', 'cpf']
+    """
+
+    case_fold: bool = True
+    split_words: bool = True
+    prefixes: frozenset[str] = DEFAULT_PREFIXES
+    suffixes: frozenset[str] = DEFAULT_SUFFIXES
+    aliases: Mapping[str, str] = field(default=DEFAULT_ALIASES, hash=False)
+
+    @classmethod
+    def exact(cls) -> "KeyRules":
+        """Rules that only accept keys that are registered mask types."""
+        return cls(False, False, frozenset(), frozenset(), MappingProxyType({}))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # `MappingProxyType` cannot be pickled, the aliases are sent as a dict and wrapped
+        # again, so the rules reach the spawned workers of `anonymize_batch`.
+        return (
+            _restore_key_rules,
+            (
+                self.case_fold,
+                self.split_words,
+                self.prefixes,
+                self.suffixes,
+                dict(self.aliases),
+            ),
+        )
+
+    def candidates(self, key: str) -> Iterator[str]:
+        """Yields the forms of `key` to look up, without repetitions, in priority order."""
+        seen = {key}
+        for form in self._forms(key):
+            for candidate in (form, self.aliases.get(form)):
+                if candidate is not None and candidate not in seen:
+                    seen.add(candidate)
+                    yield candidate
+
+    def _forms(self, key: str) -> Iterator[str]:
+        yield key.casefold() if self.case_fold else key
+        if not self.split_words:
+            return
+
+        text = _CAMEL_BOUNDARY.sub("_", key)
+        words = [word for word in _SEPARATORS.split(text) if word]
+        if self.case_fold:
+            words = [word.casefold() for word in words]
+        yield "_".join(words)
+        yield "".join(words)
+
+        start, end = 0, len(words)
+        while start < end - 1 and words[start] in self.prefixes:
+            start += 1
+        while end - 1 > start and words[end - 1] in self.suffixes:
+            end -= 1
+        if (start, end) != (0, len(words)):
+            yield "_".join(words[start:end])
+            yield "".join(words[start:end])
+
+
+def _restore_key_rules(
+    case_fold: bool,
+    split_words: bool,
+    prefixes: frozenset[str],
+    suffixes: frozenset[str],
+    aliases: dict[str, str],
+) -> KeyRules:
+    return KeyRules(
+        case_fold, split_words, prefixes, suffixes, MappingProxyType(aliases)
+    )
+
+
+def resolve_key(key: str, rules: KeyRules, type_masks: Container[str]) -> str | None:
+    """Returns the first form of `key` that is in `type_masks`, None if there is none."""
+    if key in type_masks:
+        return key
+    for candidate in rules.candidates(key):
+        if candidate in type_masks:
+            return candidate
+    return None
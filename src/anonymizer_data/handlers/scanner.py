@@ -0,0 +1,221 @@
+"""
+Detection of sensitive values (CPF, CNPJ, PIS, emails, phones, CEPs, RGs) inside free text.
+
+Classes:
+    PiiScanner: Finds and masks, in a single pass, the values of the registered patterns, in
+        text or in UTF-8 bytes.
+
+Functions:
+    anonymize_text: Anonymize every sensitive value found in a text.
+"""
+
+import io
+import re
+from collections.abc import Iterable, Iterator
+from functools import partial
+from mmap import mmap
+from typing import Any, BinaryIO, NamedTuple
+
+from anonymizer_data.core.config import Config
+
+from . import binary
+from .dispatch import MaskDispatch, Validator
+
+
+class Detection(NamedTuple):
+    """A sensitive value found by `PiiScanner`."""
+
+    type_mask: str
+    start: int
+    end: int
+    value: str
+
+
+class _Detector(NamedTuple):
+    type_mask: str
+    pattern: re.Pattern[str]
+    validator: Validator | None
+
+
+class PiiScanner:
+    """
+    Finds sensitive values in free text with one regular expression built from the patterns
+    registered with `MaskDispatch.register_pattern`, and masks them with their handlers.
+
+    The text is scanned once, whatever the number of types. Each candidate is confirmed by
+    the validator of its type (such as the CPF checksum); a candidate that fails is offered to
+    the other types whose pattern matches it entirely (an unformatted 11 digits value may be a
+    CPF, a PIS or a phone). Candidates that no type confirms are kept, unless
+    `mask_unconfirmed` is true.
+
+    Parameters:
+        type_masks (Optional[Iterable[str]]): Types to look for, all registered patterns when
+            None.
+        mask_unconfirmed (Optional[bool]): If true, candidates whose validation fails are
+            masked by the handler of their type, which follows `Config.fallback_masking`.
+
+    Examples:
+        >>> scanner = PiiScanner()
+        >>> scanner.anonymize("CPF 529.982.247-25, email jhondoe@example.com")
+        'CPF ***.982.***-**, email ******e@example.com'
+        >>> [d.type_mask for d in scanner.finditer("CEP 12345-678")]
+        ['cep']
+
+    Raises:
+        ValueError: Type mask {type_mask} has no registered pattern.
+    """
+
+    def __init__(
+        self, type_masks: Iterable[str] | None = None, mask_unconfirmed: bool = False
+    ) -> None:
+        patterns = MaskDispatch._patterns
+        names = list(patterns if type_masks is None else type_masks)
+        for type_mask in names:
+            if type_mask not in patterns:
+                raise ValueError(f"Type mask {type_mask!r} has no registered pattern")
+
+        # Validated types first, so that a checksum decides between overlapping patterns.
+        names.sort(key=lambda name: patterns[name][1] is None)
+        self._detectors = tuple(
+            _Detector(name, re.compile(patterns[name][0]), patterns[name][1])
+            for name in names
+        )
+        self._groups = {f"_{index}": index for index in range(len(names))}
+        self._regex = re.compile(
+            "|".join(
+                f"(?P<_{index}>{detector.pattern.pattern})"
+                for index, detector in enumerate(self._detectors)
+            )
+            or r"(?!)"
+        )
+        self._bytes_regex = re.compile(self._regex.pattern.encode())
+        self._mask_unconfirmed = mask_unconfirmed
+
+    def _confirm(self, index: int, value: str) -> str | None:
+        detector = self._detectors[index]
+        if detector.validator is None or detector.validator(value):
+            return detector.type_mask
+
+        for other in self._detectors[index + 1 :]:
+            if other.pattern.fullmatch(value) and (
+                other.validator is None or other.validator(value)
+            ):
+                return other.type_mask
+
+        return detector.type_mask if self._mask_unconfirmed else None
+
+    def finditer(self, text: str) -> Iterator[Detection]:
+        """Yields the confirmed sensitive values of `text`, in order."""
+        groups = self._groups
+        confirm = self._confirm
+        for match in self._regex.finditer(text):
+            value = match.group()
+            type_mask = confirm(groups[match.lastgroup], value)  # type: ignore[index]
+            if type_mask is not None:
+                yield Detection(type_mask, match.start(), match.end(), value)
+
+    def anonymize(self, text: str, **kwargs: Any) -> str:
+        """Returns `text` with each detected value masked by the handler of its type."""
+        handlers = MaskDispatch._handlers
+        metrics = MaskDispatch.metrics if Config.metrics else None
+        pieces = []
+        position = 0
+        for detection in self.finditer(text):
+            pieces.append(text[position : detection.start])
+            handler = handlers[detection.type_mask]
+            if metrics is None:
+                pieces.append(handler(detection.value, **kwargs))
+            else:
+                pieces.append(
+                    metrics.call(
+                        detection.type_mask,
+                        detection.value,
+                        partial(handler, detection.value, **kwargs),
+                    )
+                )
+            position = detection.end
+        if not pieces:
+            return text
+        pieces.append(text[position:])
+        return "".join(pieces)
+
+    def write_anonymized(
+        self,
+        data: binary.Buffer | mmap,
+        output: BinaryIO,
+        start: int = 0,
+        end: int | None = None,
+        **kwargs: Any,
+    ) -> int:
+        """
+        Writes `data[start:end]` to `output` with each detected value masked.
+
+        `data` is UTF-8 text in any buffer, such as a `bytes` or an `mmap`, and is scanned
+        without decoding it, so `\\d` and `\\w` in the patterns only match ASCII characters.
+        Each value is masked by the bytes handler of its type, see `anonymize_bytes`, and the
+        bytes between values are written straight from `data`, without copying them first.
+
+        Returns:
+            int: The number of values masked.
+        """
+        groups = self._groups
+        confirm = self._confirm
+        end = len(data) if end is None else end
+        position = start
+        total = 0
+        with memoryview(data) as view:
+            for match in self._bytes_regex.finditer(data, start, end):
+                value = match.group()
+                type_mask = confirm(
+                    groups[match.lastgroup],  # type: ignore[index]
+                    value.decode("utf-8", "surrogateescape"),
+                )
+                if type_mask is None:
+                    continue
+                output.write(view[position : match.start()])
+                output.write(binary.anonymize_bytes(value, type_mask, **kwargs))
+                position = match.end()
+                total += 1
+            output.write(view[position:end])
+        return total
+
+    def anonymize_bytes(self, data: binary.Buffer, **kwargs: Any) -> bytes:
+        """
+        Returns UTF-8 `data` with each detected value masked, see `write_anonymized`.
+
+        Examples:
+            >>> PiiScanner().anonymize_bytes(b"CPF 529.982.247-25")
+            b'CPF ***.982.***-**'
+        """
+        output = io.BytesIO()
+        self.write_anonymized(data, output, **kwargs)
+        return output.getvalue()
+
+
+def _get_default_scanner() -> PiiScanner:
+    scanner = MaskDispatch.default_scanner
+    if scanner is None:
+        scanner = MaskDispatch.default_scanner = PiiScanner()
+    return scanner
+
+
+@MaskDispatch.register("pii_text")
+def anonymize_text(text: str, **kwargs: Any) -> str:
+    """
+    Anonymize every sensitive value found in a free text, such as a ticket or a log message.
+
+    The options are passed to the handler of each value, except `size_anonymization`, since
+    each type uses its own masking size.
+
+    Parameters:
+        text (str): The text to scan.
+
+    Returns:
+        str: The text with each CPF, CNPJ, PIS, email, phone, CEP and RG masked.
+
+    Examples:
+        >>> anonymize_text("Call me at (11) 91234-5678")
+        'Call me at (**) *****-*678'
+    """
+    kwargs.pop("size_anonymization", None)
+    return _get_default_scanner().anonymize(str(text), **kwargs)
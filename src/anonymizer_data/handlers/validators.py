@@ -0,0 +1,215 @@
+"""
+Built-in CPF, CNPJ and PIS validators, shared with an optional bounded cache of verdicts.
+
+The checksums use precomputed weight tables over the ASCII bytes of the document, so no digit
+goes through `int` or an intermediate list. They give the same verdicts as `validate_docbr`,
+which is no longer needed at runtime.
+
+Attributes:
+    cpf_validator: Validator of Brazilian CPF numbers.
+    cnpj_validator: Validator of Brazilian CNPJ numbers.
+    pis_validator: Validator of Brazilian PIS numbers.
+
+Functions:
+    validate_cpf: Check the digits of a CPF.
+    validate_cnpj: Check the digits of a CNPJ, numeric or alphanumeric.
+    validate_pis: Check the digit of a PIS/NIS/PASEP/NIT.
+    validation_cache_info: Statistics of the validation cache of each document.
+    validation_cache_clear: Empty the validation cache of each document.
+"""
+
+import re
+from collections.abc import Sequence
+from operator import mul
+
+from anonymizer_data.core.cache import MISSING, CacheInfo, LRUCache
+from anonymizer_data.core.config import Config
+
+from .dispatch import Validator
+
+_NON_DIGIT = re.compile(r"[^0-9]")
+
+_CPF_FIRST = tuple(range(10, 1, -1))
+_CPF_SECOND = tuple(range(11, 1, -1))
+_CNPJ_FIRST = (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+_CNPJ_SECOND = (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+_PIS_WEIGHTS = (3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+
+# Maps each ASCII digit to its value and each letter to its code minus 48, the value of the
+# characters of an alphanumeric CNPJ, so a single `bytes.translate` gives every value.
+_VALUES = bytes.maketrans(
+    b"0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ", bytes(range(10)) + bytes(range(17, 43))
+)
+_CPF_ASCII = re.compile(r"[0-9.\-]*")
+_CNPJ_ASCII = re.compile(r"[0-9A-Za-z./\-]*")
+# What `validate_docbr` accepts: any Unicode decimal digit, and a final newline.
+_CPF_UNICODE = re.compile(r"^[\d.\-]*$")
+_CNPJ_UNICODE = re.compile(r"^[\da-zA-Z./\-]*$")
+
+
+def _check_digit(total: int) -> int:
+    remainder = total % 11
+    return 0 if remainder < 2 else 11 - remainder
+
+
+def _cpf_checksum(values: Sequence[int]) -> bool:
+    return (
+        sum(map(mul, _CPF_FIRST, values)) * 10 % 11 % 10 == values[9]
+        and sum(map(mul, _CPF_SECOND, values)) * 10 % 11 % 10 == values[10]
+    )
+
+
+def _cnpj_checksum(values: Sequence[int]) -> bool:
+    return (
+        _check_digit(sum(map(mul, _CNPJ_FIRST, values))) == values[12]
+        and _check_digit(sum(map(mul, _CNPJ_SECOND, values))) == values[13]
+    )
+
+
+def _pis_checksum(values: Sequence[int]) -> bool:
+    return _check_digit(sum(map(mul, _PIS_WEIGHTS, values))) == values[10]
+
+
+def validate_cpf(doc: str) -> bool:
+    """
+    Checks the two digits of a CPF, formatted (`529.982.247-25`) or not (`52998224725`).
+
+    Dots and dashes are ignored wherever they are, and numbers with fewer than 11 digits are
+    completed with zeros on the left, as happens to CPFs stored as integers. Numbers made of
+    a single repeated digit are invalid.
+
+    Examples:
+        >>> validate_cpf("529.982.247-25"), validate_cpf("529.982.247-26")
+        (True, False)
+    """
+    if not _CPF_ASCII.fullmatch(doc):
+        return _validate_unicode_cpf(doc)
+
+    values = doc.encode().translate(_VALUES, b".-")
+    if len(values) > 11:
+        return False
+    values = values.rjust(11, b"\0")
+    return values != values[:1] * 11 and _cpf_checksum(values)
+
+
+def validate_cnpj(doc: str) -> bool:
+    """
+    Checks the two digits of a CNPJ, formatted (`11.222.333/0001-81`) or not.
+
+    Dots, slashes and dashes are ignored wherever they are. The first 12 characters may be
+    letters, as in the alphanumeric CNPJ. Numbers made of a single repeated character are
+    invalid.
+
+    Examples:
+        >>> validate_cnpj("11.222.333/0001-81"), validate_cnpj("12.ABC.345/01DE-35")
+        (True, True)
+    """
+    if not _CNPJ_ASCII.fullmatch(doc):
+        return _validate_unicode_cnpj(doc)
+
+    values = doc.encode().upper().translate(_VALUES, b"./-")
+    return len(values) == 14 and values != values[:1] * 14 and _cnpj_checksum(values)
+
+
+def validate_pis(doc: str) -> bool:
+    """
+    Checks the digit of a PIS/NIS/PASEP/NIT, formatted (`689.37232.86-5`) or not.
+
+    Examples:
+        >>> validate_pis("689.37232.86-5"), validate_pis("68937232864")
+        (True, False)
+    """
+    if not _CPF_ASCII.fullmatch(doc):
+        return _validate_unicode_pis(doc)
+
+    values = doc.encode().translate(_VALUES, b".-")
+    return len(values) == 11 and values != values[:1] * 11 and _pis_checksum(values)
+
+
+# Documents with other characters are rare. They are checked as `validate_docbr` does: the
+# check digits are compared as text, so they only match ASCII digits.
+
+
+def _validate_unicode_cpf(doc: str) -> bool:
+    if not _CPF_UNICODE.match(doc):
+        return False
+    digits = "".join(char for char in doc if char.isdigit())
+    if len(digits) > 11:
+        return False
+    digits = digits.rjust(11, "0")
+    if len(set(digits)) == 1 or not digits[9:].isascii():
+        return False
+    return _cpf_checksum([int(char) for char in digits])
+
+
+def _validate_unicode_cnpj(doc: str) -> bool:
+    if not _CNPJ_UNICODE.match(doc):
+        return False
+    chars = [char for char in doc.strip().upper() if char.isdigit() or char.isalpha()]
+    if len(chars) != 14 or len(set(chars)) == 1:
+        return False
+    return _cnpj_checksum([ord(char) - 48 for char in chars])
+
+
+def _validate_unicode_pis(doc: str) -> bool:
+    if not _CPF_UNICODE.match(doc):
+        return False
+    digits = "".join(char for char in doc if char.isdigit())
+    if len(digits) != 11 or len(set(digits)) == 1 or not digits[10].isascii():
+        return False
+    return _pis_checksum([int(char) for char in digits])
+
+
+class DocumentValidator:
+    """
+    Wraps a validator function, caching verdicts by the digits of the document.
+
+    The cache is disabled by default and is sized by `Config.validation_cache_size`. Only
+    documents made of digits and the separators in `separators` are cached, since for
+    those the verdict depends on the digits alone; anything else is always validated.
+    """
+
+    def __init__(self, validator: Validator, separators: str) -> None:
+        self._validator = validator
+        self._cacheable = re.compile(rf"[0-9{re.escape(separators)}]*")
+        self._cache: LRUCache[str, bool] = LRUCache()
+
+    def validate(self, doc: str) -> bool:
+        maxsize = Config.validation_cache_size
+        if maxsize <= 0 or not self._cacheable.fullmatch(doc):
+            return self._validator(doc)
+
+        cache = self._cache
+        if cache.maxsize != maxsize:
+            cache.maxsize = maxsize
+
+        digits = _NON_DIGIT.sub("", doc)
+        verdict = cache.get(digits, MISSING)
+        if verdict is MISSING:
+            verdict = self._validator(doc)
+            cache.put(digits, verdict)
+        return verdict
+
+    def cache_info(self) -> CacheInfo:
+        return self._cache.info()
+
+    def cache_clear(self) -> None:
+        self._cache.clear()
+
+
+cpf_validator = DocumentValidator(validate_cpf, ".-")
+cnpj_validator = DocumentValidator(validate_cnpj, "./-")
+pis_validator = DocumentValidator(validate_pis, ".-")
+
+_VALIDATORS = {"cpf": cpf_validator, "cnpj": cnpj_validator, "pis": pis_validator}
+
+
+def validation_cache_info() -> dict[str, CacheInfo]:
+    """Returns hits, misses and size of the validation cache of each document."""
+    return {name: validator.cache_info() for name, validator in _VALIDATORS.items()}
+
+
+def validation_cache_clear() -> None:
+    """Empties the validation cache of each document and resets its statistics."""
+    for validator in _VALIDATORS.values():
+        validator.cache_clear()
@@ -0,0 +1,211 @@
+"""
+Integration with the standard `logging` module, anonymizing log records in-flight.
+
+Classes:
+    AnonymizingFilter: Filter masking the arguments, the message and the extra fields of records.
+    AnonymizingQueueHandler: Handler that only enqueues records, leaving the work to a listener.
+    AnonymizingQueueListener: Listener that anonymizes records in its own thread.
+
+Functions:
+    queue_handler: Creates a queue handler and its listener, anonymizing away from the call site.
+"""
+
+import logging
+import queue
+from collections.abc import Mapping
+from copy import copy
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
+
+from .core.config import Config
+from .core.plan import MaskDictPlan, ValuePlan
+from .handlers.dispatch import MaskDispatch
+
+_MARK = "_anonymizer_data"
+_RECORD_ATTRIBUTES = frozenset(
+    [*logging.makeLogRecord({}).__dict__, "message", "asctime", "taskName", _MARK]
+)
+
+
+class AnonymizingFilter(logging.Filter):
+    """
+    Filter that anonymizes log records with the registered handlers.
+
+    Rules are compiled once, when the filter is created:
+
+    - each `str` in `record.args` (also inside lists and dicts) is masked with `args_type_mask`.
+      Numbers and other values are kept, so format specifiers such as `%d` keep working;
+    - `dict` arguments and `extra` fields whose name resolves to a registered mask type with
+      `MaskDispatch.resolve_key` (such as `cpf`, `userCpf` or `email`) are masked with that
+      type, like the dict keys of `key_with_type_mask`, and `fields` maps other names to
+      mask types;
+    - when `message_type_mask` is given, the rendered message is masked too.
+
+    The filter never drops records and marks them, so a record going through two filtered
+    loggers or handlers is masked only once. Values rejected by a handler (for example in
+    `Config.strict_mode`) are fully masked instead of raising at the logging call.
+
+    Parameters:
+        args_type_mask (Optional[str]): Mask type of the arguments (default is "string"), None
+            keeps them.
+        message_type_mask (Optional[str]): Mask type of the rendered message, None keeps it.
+        fields (Optional[Mapping[str, str]]): Extra field or argument name to mask type.
+        **kwargs: Options passed to the handlers, such as `size_anonymization`.
+
+    Examples:
+        >>> handler = logging.StreamHandler()
+        >>> handler.addFilter(AnonymizingFilter(fields={"document": "cpf"}))
+        >>> logger.warning("Login of %s", "jhondoe", extra={"document": "529.982.247-25"})
+
+    Raises:
+        ValueError: The 'size_anonymization' field must be between 0 and 1.
+        ValueError: The 'size_anonymization' must be a float.
+    """
+
+    def __init__(
+        self,
+        args_type_mask: str | None = "string",
+        message_type_mask: str | None = None,
+        fields: Mapping[str, str] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__()
+        self._args: ValuePlan | None = None
+        if args_type_mask is not None:
+            plan = ValuePlan.compile(**kwargs, type_mask=args_type_mask)
+            self._args = ValuePlan(plan.mask_string, coerce=False)
+
+        self._message: ValuePlan | None = None
+        if message_type_mask is not None:
+            self._message = ValuePlan.compile(**kwargs, type_mask=message_type_mask)
+
+        self._type_masks: dict[str, ValuePlan] = {
+            type_mask: rule
+            for type_mask, rule in MaskDictPlan.compile(True, **kwargs).rules.items()
+            if type_mask
+        }
+        self._fields: dict[str, ValuePlan] = {
+            field: ValuePlan.compile(**kwargs, type_mask=type_mask)
+            for field, type_mask in (fields or {}).items()
+        }
+
+    def _rule(self, key: Any) -> ValuePlan | None:
+        """Rule of an `extra` field or `dict` argument, None when it is kept."""
+        rule = self._fields.get(key)
+        if rule is None and key not in _RECORD_ATTRIBUTES:
+            rule = self._type_masks.get(MaskDispatch.resolve_key(key))
+        return rule
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        attributes = record.__dict__
+        if attributes.get(_MARK):
+            return True
+        attributes[_MARK] = True
+
+        if record.args:
+            record.args = self._mask_args(record.args)
+
+        keys = attributes.keys()
+        for key in (keys - _RECORD_ATTRIBUTES) | (keys & self._fields.keys()):
+            rule = self._rule(key)
+            if rule is not None:
+                attributes[key] = _apply(rule, attributes[key])
+
+        if self._message is not None:
+            try:
+                message = record.getMessage()
+            except (TypeError, ValueError):
+                return True  # left for the handler to report as a formatting error
+            record.msg = _apply(self._message, message)
+            record.args = None
+        return True
+
+    def _mask_args(self, args: Any) -> Any:
+        if isinstance(args, Mapping):
+            return {
+                key: self._mask_arg(value) if rule is None else _apply(rule, value)
+                for key, value in args.items()
+                for rule in [self._rule(key)]
+            }
+        return tuple(self._mask_arg(value) for value in args)
+
+    def _mask_arg(self, value: Any) -> Any:
+        if self._args is None:
+            return value
+        return _apply(self._args, value)
+
+
+def _apply(rule: ValuePlan, value: Any) -> Any:
+    try:
+        return rule.apply(value)
+    except ValueError:
+        return Config.default_mask_char * len(str(value))
+
+
+class AnonymizingQueueHandler(QueueHandler):
+    """
+    `QueueHandler` that enqueues a copy of the record without formatting it.
+
+    Formatting and anonymizing are left to `AnonymizingQueueListener`, so the logging call only
+    pays for the copy and the `put`. Arguments are kept as they are, so mutable arguments
+    should not be changed after the logging call.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return copy(record)
+
+
+class AnonymizingQueueListener(QueueListener):
+    """
+    `QueueListener` that anonymizes each record in its thread before passing it to `handlers`.
+
+    Parameters:
+        queue: The queue shared with `AnonymizingQueueHandler`.
+        *handlers (logging.Handler): Handlers receiving the anonymized records.
+        respect_handler_level (Optional[bool]): Same as `QueueListener`.
+        anonymizer (Optional[AnonymizingFilter]): The filter applied, one is created with the
+            `kwargs` when not given.
+        **kwargs: Options of `AnonymizingFilter`.
+    """
+
+    def __init__(
+        self,
+        queue: Any,
+        *handlers: logging.Handler,
+        respect_handler_level: bool = False,
+        anonymizer: AnonymizingFilter | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(queue, *handlers, respect_handler_level=respect_handler_level)
+        self.anonymizer = anonymizer or AnonymizingFilter(**kwargs)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        self.anonymizer.filter(record)
+        return record
+
+
+def queue_handler(
+    *handlers: logging.Handler, **kwargs: Any
+) -> tuple[AnonymizingQueueHandler, AnonymizingQueueListener]:
+    """
+    Creates a non-blocking handler whose records are anonymized and emitted in another thread.
+
+    Parameters:
+        *handlers (logging.Handler): Handlers receiving the anonymized records.
+        **kwargs: Options of `AnonymizingFilter`, such as `fields` and `message_type_mask`.
+
+    Returns:
+        tuple[AnonymizingQueueHandler, AnonymizingQueueListener]: The handler to add to the
+            loggers and the listener, which must be started and stopped by the caller.
+
+    Examples:
+        >>> handler, listener = queue_handler(logging.FileHandler("app.log"))
+        >>> logging.getLogger().addHandler(handler)
+        >>> listener.start()
+        >>> ...
+        >>> listener.stop()  # flushes the pending records
+    """
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    return AnonymizingQueueHandler(records), AnonymizingQueueListener(
+        records, *handlers, **kwargs
+    )
@@ -0,0 +1,300 @@
+"""
+Streaming anonymization of large exports, one record at a time.
+
+Functions:
+    anonymize_jsonl: Anonymize JSON Lines records with a compiled `MaskDictPlan` or
+        `PathSelector`.
+    anonymize_csv: Anonymize CSV rows mapping columns to registered mask types.
+    anonymize_log_file: Anonymize the sensitive values of a memory-mapped text file.
+"""
+
+import csv
+import json
+import mmap
+import os
+import re
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, BinaryIO, TextIO
+
+from anonymizer_data.handlers.dispatch import MaskDispatch
+from anonymizer_data.handlers.scanner import PiiScanner
+
+from .core.paths import PathSelector
+from .core.plan import MaskDictPlan, StringMasker, _compile_string_masker
+
+if TYPE_CHECKING:
+    import _csv
+
+WRITE_BATCH_SIZE = 1000
+LOG_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+def anonymize_jsonl(
+    lines: Iterable[str],
+    output: TextIO,
+    plan: MaskDictPlan | PathSelector,
+    batch_size: int = WRITE_BATCH_SIZE,
+) -> int:
+    """
+    Anonymize JSON Lines read from `lines` and write them to `output`.
+
+    Records are processed one at a time, so memory does not grow with the size of the input,
+    and written in batches of `batch_size` lines to reduce the number of writes. Blank lines
+    are skipped.
+
+    Parameters:
+        lines (Iterable[str]): Source of JSON Lines, such as an open file or `sys.stdin`.
+        output (TextIO): Destination of the anonymized records.
+        plan (MaskDictPlan | PathSelector): Plan applied to each record, see
+            `MaskDict.compile` and `PathSelector.compile`.
+        batch_size (Optional[int]): Number of lines buffered before each write (default is 1000).
+
+    Returns:
+        int: The number of records written.
+
+    Raises:
+        ValueError: Line {number} is not valid JSON.
+        TypeError: Line {number} is not a JSON object.
+    """
+    anonymize = plan.anonymize
+    dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    loads = json.loads
+    buffer: list[str] = []
+    total = 0
+
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = loads(line)
+        except json.JSONDecodeError as error:
+            raise ValueError(f"Line {number} is not valid JSON: {error.msg}") from error
+        if not isinstance(record, dict):
+            raise TypeError(f"Line {number} is not a JSON object")
+        buffer.append(dumps(anonymize(record)) + "\n")
+        if len(buffer) >= batch_size:
+            output.writelines(buffer)
+            total += len(buffer)
+            buffer.clear()
+
+    output.writelines(buffer)
+    return total + len(buffer)
+
+
+def _compile_csv_columns(
+    header: list[str], columns: Mapping[str, str], **kwargs: Any
+) -> list[tuple[int, StringMasker]]:
+    """Resolves each mapped column to its position and bound handler."""
+    rules = []
+    for column, name in columns.items():
+        if column not in header:
+            raise ValueError(f"Column {column!r} is not in the CSV header")
+        type_mask = MaskDispatch.resolve_key(name)
+        if type_mask not in MaskDispatch._handlers:
+            raise ValueError(f"Type mask {name!r} is not registered")
+        mask = _compile_string_masker(type_mask=type_mask, **kwargs)
+        rules.append((header.index(column), mask))
+    return rules
+
+
+def _csv_field_end(dialect: "_csv.Dialect") -> Callable[[str, int], int]:
+    """
+    Returns the function that finds where the field of a record that starts at a position
+    ends, quoted or not, as written in `dialect`.
+    """
+    if (
+        dialect.quoting == csv.QUOTE_NONE
+        or dialect.escapechar is not None
+        or not dialect.doublequote
+    ):
+        raise ValueError(
+            "The CSV dialect must quote fields and double the quote characters"
+        )
+    delimiter = re.escape(dialect.delimiter)
+    quote = re.escape(dialect.quotechar or '"')
+    match = re.compile(
+        rf"{quote}(?:[^{quote}]|{quote}{quote})*{quote}[^{delimiter}\r\n]*"
+        rf"|[^{delimiter}\r\n]*"
+    ).match
+
+    def field_end(record: str, position: int) -> int:
+        found = match(record, position)
+        return position if found is None else found.end()
+
+    return field_end
+
+
+def _csv_quoter(dialect: "_csv.Dialect") -> Callable[[str], str]:
+    """Returns the function that writes a value as a field of `dialect`."""
+    quote = dialect.quotechar or '"'
+    special = re.compile(f"[{re.escape(dialect.delimiter + quote)}\r\n]").search
+    always = dialect.quoting != csv.QUOTE_MINIMAL
+
+    def quoted(value: str) -> str:
+        if always or special(value):
+            return quote + value.replace(quote, quote * 2) + quote
+        return value
+
+    return quoted
+
+
+def anonymize_csv(
+    source: Iterable[str],
+    output: TextIO,
+    columns: Mapping[str, str],
+    batch_size: int = WRITE_BATCH_SIZE,
+    dialect: str = "excel",
+    delimiter: str = ",",
+    **kwargs: Any,
+) -> int:
+    """
+    Anonymize CSV rows read from `source` and write them to `output`.
+
+    The first row is the header. Each column of `columns` is bound once to the handler of its
+    mask type, rows are processed one at a time and written in batches of `batch_size`.
+    Only the fields of the mapped columns are rewritten, quoted as the dialect requires; the
+    header, the other fields, their quoting and the line breaks are copied as they were read.
+
+    Parameters:
+        source (Iterable[str]): Source of CSV lines, such as a file opened with `newline=""`.
+        output (TextIO): Destination of the anonymized rows.
+        columns (Mapping[str, str]): Column name to mask type, such as `{"doc": "cpf"}`. Mask
+            types are resolved like dict keys, see `MaskDispatch.resolve_key`.
+        batch_size (Optional[int]): Number of rows buffered before each write (default is 1000).
+        dialect (Optional[str]): The `csv` dialect of the rows (default is "excel").
+        delimiter (Optional[str]): The field delimiter (default is ",").
+        **kwargs: Options passed to the handlers, such as `mask_char` and `size_anonymization`.
+
+    Returns:
+        int: The number of rows written, without the header.
+
+    Examples:
+        >>> import io, sys
+        >>> anonymize_csv(io.StringIO("name,cpf\\nJhon,529.982.247-25\\n"), sys.stdout, {"cpf": "cpf"})
+        name,cpf
+        Jhon,***.982.***-**
+        1
+
+    Raises:
+        ValueError: Column {column} is not in the CSV header.
+        ValueError: Type mask {type_mask} is not registered.
+        ValueError: The CSV dialect must quote fields and double the quote characters.
+    """
+    # The reader pulls the lines of one record at a time, so the lines it consumed since
+    # the previous row are the text of the current one.
+    lines: list[str] = []
+
+    def read() -> Iterator[str]:
+        for line in source:
+            lines.append(line)
+            yield line
+
+    reader = csv.reader(read(), dialect, delimiter=delimiter)
+    field_end = _csv_field_end(reader.dialect)
+    quote = _csv_quoter(reader.dialect)
+
+    header = next(reader, None)
+    if header is None:
+        return 0
+    rules = sorted(_compile_csv_columns(header, columns, **kwargs), key=itemgetter(0))
+    output.write("".join(lines))
+    lines.clear()
+
+    buffer: list[str] = []
+    total = 0
+    for row in reader:
+        record = "".join(lines)
+        lines.clear()
+        size = len(row)
+        parts = []
+        copied = position = column = 0
+        for index, mask in rules:
+            if index >= size:
+                break
+            while column < index:
+                position = field_end(record, position) + 1
+                column += 1
+            parts.append(record[copied:position])
+            parts.append(quote(mask(row[index])))
+            copied = field_end(record, position)
+        parts.append(record[copied:])
+        buffer.append("".join(parts))
+        if len(buffer) >= batch_size:
+            output.write("".join(buffer))
+            total += len(buffer)
+            buffer.clear()
+
+    output.write("".join(buffer))
+    return total + len(buffer)
+
+
+def anonymize_log_file(
+    path: str | os.PathLike[str],
+    output: BinaryIO,
+    scanner: PiiScanner | None = None,
+    chunk_size: int = LOG_CHUNK_SIZE,
+    **kwargs: Any,
+) -> int:
+    """
+    Anonymize the CPFs, emails, phones and other values of the registered patterns found in
+    a UTF-8 text file, such as an application log, and write the result to `output`.
+
+    The file is memory-mapped and scanned as bytes by `PiiScanner.write_anonymized`, in
+    chunks of about `chunk_size` bytes that end at a line break. The pages of each chunk are
+    released once it is written, so memory does not grow with the size of the file. Open
+    `output` with a large buffer so that it receives large sequential writes.
+
+    Parameters:
+        path (str | os.PathLike): The file to anonymize.
+        output (BinaryIO): Destination of the anonymized bytes.
+        scanner (Optional[PiiScanner]): The scanner to use, all registered patterns when None.
+        chunk_size (Optional[int]): Approximate number of bytes scanned at a time (default is
+            4 MiB). Chunks end at a line break, so a line longer than it is one chunk.
+        **kwargs: Options passed to the handlers, such as `mask_char`.
+
+    Returns:
+        int: The number of values masked.
+
+    Examples:
+        >>> import sys
+        >>> anonymize_log_file("app.log", sys.stdout.buffer)  # doctest: +SKIP
+        3
+    """
+    scanner = scanner or PiiScanner()
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if size == 0:
+            return 0
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return _anonymize_mapped(data, size, output, scanner, chunk_size, kwargs)
+
+
+def _anonymize_mapped(
+    data: mmap.mmap,
+    size: int,
+    output: BinaryIO,
+    scanner: PiiScanner,
+    chunk_size: int,
+    kwargs: dict[str, Any],
+) -> int:
+    releases_pages = hasattr(mmap, "MADV_DONTNEED")
+    if hasattr(mmap, "MADV_SEQUENTIAL"):
+        data.madvise(mmap.MADV_SEQUENTIAL)
+
+    total = 0
+    start = released = 0
+    while start < size:
+        end = min(start + chunk_size, size)
+        if end < size:
+            line_end = data.find(b"\n", end - 1)
+            end = size if line_end < 0 else line_end + 1
+        total += scanner.write_anonymized(data, output, start, end, **kwargs)
+        start = end
+
+        # Drop the scanned pages from the process, the kernel may still cache them.
+        page_end = end - end % mmap.PAGESIZE
+        if releases_pages and page_end > released:
+            data.madvise(mmap.MADV_DONTNEED, released, page_end - released)
+            released = page_end
+    return total
@@ -1,3 +1,6 @@
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
 COMPLEX_DICT = {
     "outer_key": {
         "inner_key1": [
@@ -24,3 +27,16 @@ COMPLEX_DICT = {
     },
     "outer_key3": "SensitiveData3",
 }
+
+
+class Customer(NamedTuple):
+    name: str
+    email: str
+
+
+@dataclass(frozen=True, slots=True)
+class Account:
+    email: str
+    cpf: str
+    tags: tuple[str, ...] = ()
+    internal: str = field(default="Hello world", init=False)
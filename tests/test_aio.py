@@ -0,0 +1,166 @@
+import asyncio
+import threading
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest.mock import patch
+
+from anonymizer_data import MaskDict, anonymize_value
+from anonymizer_data.aio import aiter_anonymize, anonymize_async
+from anonymizer_data.core import MaskDictPlan
+from tests.conftest import fake
+from tests.payloads import COMPLEX_DICT
+
+
+def make_records(size):
+    return [
+        {"name": fake.name(), "cpf": fake.cpf(), "email": fake.email()}
+        for _ in range(size)
+    ]
+
+
+async def async_source(records):
+    for record in records:
+        await asyncio.sleep(0)
+        yield record
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """Keeps the highest number of jobs running at the same time."""
+
+    def __init__(self):
+        super().__init__(max_workers=8)
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+
+    def submit(self, fn, /, *args, **kwargs):
+        def job():
+            with self.lock:
+                self.running += 1
+                self.peak = max(self.peak, self.running)
+            try:
+                threading.Event().wait(0.01)
+                return fn(*args, **kwargs)
+            finally:
+                with self.lock:
+                    self.running -= 1
+
+        return super().submit(job)
+
+
+class TestAnonymizeAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_same_result_as_anonymize_value(self):
+        for options in ({}, {"key_with_type_mask": True}, {"selected_keys": ["cpf"]}):
+            with self.subTest(options=options):
+                self.assertEqual(
+                    await anonymize_async(COMPLEX_DICT, **options),
+                    anonymize_value(COMPLEX_DICT, **options),
+                )
+
+    async def test_chunked_dict_and_list(self):
+        records = make_records(25)
+        data = {f"key{index}": record for index, record in enumerate(records)}
+
+        for value in (records, data):
+            with self.subTest(type=type(value).__name__):
+                self.assertEqual(
+                    await anonymize_async(value, chunk_size=4, selected_keys=["cpf"]),
+                    anonymize_value(value, selected_keys=["cpf"]),
+                )
+
+    async def test_inline_mode_yields_to_other_tasks(self):
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        start = ticks
+        await anonymize_async(make_records(20), offload=False, chunk_size=2)
+        task.cancel()
+
+        self.assertGreaterEqual(ticks - start, 5)
+
+    async def test_custom_executor_and_concurrency(self):
+        with CountingExecutor() as executor:
+            await anonymize_async(
+                make_records(40), executor=executor, chunk_size=2, max_concurrency=3
+            )
+        self.assertEqual(executor.peak, 3)
+
+    async def test_plan_compiled_once(self):
+        data = {f"key{index}": record for index, record in enumerate(make_records(9))}
+        with patch.object(
+            MaskDictPlan, "compile", side_effect=MaskDictPlan.compile
+        ) as compile_plan:
+            await anonymize_async(data, chunk_size=2, key_with_type_mask=True)
+            async for _ in aiter_anonymize(make_records(9), chunk_size=2):
+                pass
+        self.assertEqual(compile_plan.call_count, 2)
+
+    async def test_process_pool(self):
+        records = make_records(6)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            result = [
+                record
+                async for record in aiter_anonymize(
+                    records, executor=executor, chunk_size=2, key_with_type_mask=True
+                )
+            ]
+        self.assertEqual(result, anonymize_value(records, key_with_type_mask=True))
+
+    async def test_not_container(self):
+        self.assertEqual(await anonymize_async("Hello world"), "*******orld")
+
+    async def test_invalid_options(self):
+        with self.assertRaises(ValueError):
+            await anonymize_async({"name": "Jhon"}, size_anonymization=2.0)
+
+
+class TestAiterAnonymize(unittest.IsolatedAsyncioTestCase):
+    async def test_order_and_result(self):
+        records = make_records(53)
+        expected = [
+            MaskDict(record, key_with_type_mask=True).anonymize() for record in records
+        ]
+
+        result = [
+            record
+            async for record in aiter_anonymize(
+                async_source(records), chunk_size=5, key_with_type_mask=True
+            )
+        ]
+
+        self.assertEqual(result, expected)
+
+    async def test_sync_iterable_inline(self):
+        records = make_records(7)
+        result = [
+            record
+            async for record in aiter_anonymize(records, offload=False, chunk_size=3)
+        ]
+        self.assertEqual(result, [MaskDict(record).anonymize() for record in records])
+
+    async def test_bounded_concurrency(self):
+        with CountingExecutor() as executor:
+            async for _ in aiter_anonymize(
+                async_source(make_records(30)),
+                executor=executor,
+                chunk_size=2,
+                max_concurrency=2,
+            ):
+                pass
+        self.assertLessEqual(executor.peak, 2)
+
+    async def test_invalid_options_before_reading(self):
+        with self.assertRaises(ValueError):
+            async for _ in aiter_anonymize([], size_anonymization="0.5"):
+                pass
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,6 +16,10 @@ class TestAnonymizeNumericDigits(unittest.TestCase):
         result = anonymize_numeric_digits("abc123xyz")
         self.assertEqual(result, "abc***xyz")
 
+    def test_mask_char_is_literal(self):
+        result = anonymize_numeric_digits("a1b2", mask_char="\\")
+        self.assertEqual(result, "a\\b\\")
+
 
 if __name__ == "__main__":
     unittest.main()
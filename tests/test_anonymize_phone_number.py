@@ -15,6 +15,15 @@ class TestAnonymizePhoneNumber(TestCase):
     def test_anonymize_valid_phone_without_format(self):
         self.assertEqual(anonymize_phone_number("9876543210"), "*******210")
 
+    def test_anonymize_phone_with_three_digits(self):
+        self.assertEqual(anonymize_phone_number("(123)"), "(123)")
+
+    def test_anonymize_phone_with_mask_char(self):
+        self.assertEqual(
+            anonymize_phone_number("123-456-7890", mask_char="\\"),
+            "\\\\\\-\\\\\\-\\890",
+        )
+
     def test_anonymize_short_phone(self):
         self.assertEqual(anonymize_phone_number("12"), "**")
 
@@ -22,6 +22,10 @@ class TestAnonymizeSubstring(unittest.TestCase):
         result = anonymize_substring("Hello world!", "", occurrences=1)
         self.assertEqual(result, "Hello world!")
 
+    def test_anonymize_all_occurrences(self):
+        result = anonymize_substring("a-a-a", "a", occurrences=0, mask_char="#")
+        self.assertEqual(result, "#-#-#")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+
+from anonymizer_data import MaskStr, anonymize_value
+from anonymizer_data.core.dispatcher import DEFAULT_MASKERS
+from tests.conftest import fake
+from tests.payloads import COMPLEX_DICT
+
+
+class TestAnonymizeValue(unittest.TestCase):
+    def test_string_default(self):
+        self.assertEqual(anonymize_value("SensitiveData"), "*********Data")
+
+    def test_string_same_as_mask_str(self):
+        cpf = fake.cpf()
+        cases = [
+            ("SensitiveData", {"size_anonymization": 0.5}),
+            ("SensitiveData", {"size_anonymization": -0.5, "mask_char": "#"}),
+            (cpf, {"type_mask": "cpf"}),
+            ("jhondoe@example.com", {"type_mask": "email"}),
+            ("SensitiveData", {"type_mask": "unknown"}),
+            ("SensitiveData", {"anonymize_string": False}),
+        ]
+        for value, options in cases:
+            self.assertEqual(
+                anonymize_value(value, **options),
+                MaskStr(value, **options).anonymize(),
+            )
+
+    def test_invalid_size_anonymization(self):
+        with self.assertRaises(ValueError) as context:
+            anonymize_value("SensitiveData", size_anonymization=1.5)
+        self.assertEqual(
+            str(context.exception),
+            "The 'size_anonymization' field must be between 0 and 1.",
+        )
+
+    def test_list(self):
+        self.assertEqual(
+            anonymize_value(["SensitiveData1", ["MoreData1"], 7]),
+            ["*********Data1", ["******ta1"], 7],
+        )
+
+    def test_dict_options(self):
+        data = {"email": "jhondoe@example.com", "name": "Jhon", "age": 33}
+        self.assertEqual(
+            anonymize_value(data, key_with_type_mask=True),
+            {"email": "******e@example.com", "name": "****", "age": "33"},
+        )
+        self.assertEqual(
+            anonymize_value(data, selected_keys=["name"]),
+            {"email": "jhondoe@example.com", "name": "**on", "age": 33},
+        )
+
+    def test_complex_dict(self):
+        result = anonymize_value(COMPLEX_DICT)
+        self.assertEqual(result["outer_key3"], "*********Data3")
+        self.assertEqual(
+            result["outer_key"]["inner_key1"][1]["outer_key2"]["inner_key2"],
+            "*********Data2",
+        )
+
+    def test_unsupported_type(self):
+        self.assertEqual(anonymize_value(12345), 12345)
+        self.assertEqual(anonymize_value(12345, type_mask="number"), "*****")
+
+    def test_maskers_are_built_once(self):
+        self.assertEqual(set(DEFAULT_MASKERS), {"str", "list", "dict"})
+        maskers = dict(DEFAULT_MASKERS)
+        anonymize_value({"key": ["value"]})
+        self.assertEqual(DEFAULT_MASKERS, maskers)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import pickle
+import unittest
+from types import MappingProxyType
+
+from anonymizer_data import anonymize_value
+from anonymizer_data.batch import anonymize_batch, iter_anonymize_batch
+from anonymizer_data.core.config import Config
+from anonymizer_data.handlers import KeyRules, MaskDispatch
+from tests.conftest import fake
+from tests.payloads import COMPLEX_DICT
+
+
+class TestAnonymizeBatch(unittest.TestCase):
+    def setUp(self):
+        self.records = [
+            {"name": fake.name(), "cpf": fake.cpf(), "email": fake.email()}
+            for _ in range(20)
+        ]
+        self.records += [COMPLEX_DICT, ["SensitiveData", {"cpf": fake.cpf()}]]
+
+    def expected(self, **options):
+        return [anonymize_value(record, **options) for record in self.records]
+
+    def test_same_result_in_process(self):
+        result = anonymize_batch(self.records, workers=1, chunk_size=3)
+        self.assertEqual(result, self.expected())
+
+    def test_same_result_and_order_in_pool(self):
+        for options in [{}, {"key_with_type_mask": True}, {"selected_keys": ["cpf"]}]:
+            result = anonymize_batch(
+                self.records, workers=2, chunk_size=3, mp_context="spawn", **options
+            )
+            self.assertEqual(result, self.expected(**options))
+
+    def test_config_is_sent_to_workers(self):
+        Config.setup(mask_char="#")
+        try:
+            result = anonymize_batch(["SensitiveData"], workers=2, mp_context="spawn")
+        finally:
+            Config.setup()
+        self.assertEqual(result, ["#########Data"])
+
+    def test_key_rules_are_sent_to_workers(self):
+        previous = MaskDispatch.key_rules
+        MaskDispatch.set_key_rules(
+            KeyRules(aliases=MappingProxyType({"documento": "cpf"}))
+        )
+        self.addCleanup(MaskDispatch.set_key_rules, previous)
+        records = [{"documento": fake.cpf(), "userDocumento": fake.cpf()}] * 4
+
+        result = anonymize_batch(
+            records, workers=2, mp_context="spawn", key_with_type_mask=True
+        )
+
+        expected = [
+            anonymize_value(record, key_with_type_mask=True) for record in records
+        ]
+        self.assertEqual(result, expected)
+        self.assertNotEqual(result[0]["userDocumento"], records[0]["userDocumento"])
+
+    def test_key_rules_pickle(self):
+        rules = KeyRules(prefixes=frozenset({"titular"}))
+        self.assertEqual(pickle.loads(pickle.dumps(rules)), rules)
+        self.assertIsInstance(
+            pickle.loads(pickle.dumps(rules)).aliases, MappingProxyType
+        )
+
+    def test_iter_is_lazy(self):
+        iterator = iter_anonymize_batch(iter(self.records), workers=1, chunk_size=5)
+        self.assertEqual(next(iterator), self.expected()[0])
+
+    def test_invalid_options_raise_immediately(self):
+        with self.assertRaises(ValueError):
+            iter_anonymize_batch(self.records, workers=2, size_anonymization=2.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
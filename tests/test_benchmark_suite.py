@@ -0,0 +1,63 @@
+import json
+import unittest
+
+from benchmarks.suite import Comparison, Result, compare, nested, run, to_json
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    def test_run_filter_and_json(self):
+        results = run("strategy/", repeat=1, min_time=0.0)
+        self.assertEqual(
+            list(results),
+            [
+                "strategy/default",
+                "strategy/key_based",
+                "strategy/key_as_type_mask",
+                "strategy/path",
+            ],
+        )
+
+        saved = json.loads(json.dumps(to_json(results)))
+        self.assertEqual(saved["schema"], 1)
+        self.assertEqual(
+            set(saved["results"]["strategy/default"]),
+            {"ns_per_op", "ops_per_s", "peak_kib", "items"},
+        )
+
+    def test_every_handler_is_covered(self):
+        results = run("handler/", repeat=1, min_time=0.0)
+        self.assertIn("handler/cpf", results)
+        self.assertIn("handler/name", results)
+
+    def test_every_bytes_handler_is_covered(self):
+        results = run("bytes/", repeat=1, min_time=0.0)
+        self.assertIn("bytes/cpf", results)
+        self.assertIn("bytes/name", results)
+
+    def test_compare_with_baseline(self):
+        baseline = {
+            "results": {
+                "fast": {"ns_per_op": 100.0},
+                "slow": {"ns_per_op": 100.0},
+                "removed": {"ns_per_op": 100.0},
+            }
+        }
+        results = {
+            "fast": Result(105.0, 0.0, 0.0),
+            "slow": Result(130.0, 0.0, 0.0),
+            "new": Result(1.0, 0.0, 0.0),
+        }
+
+        comparisons = compare(results, baseline)
+
+        self.assertEqual([c.name for c in comparisons], ["fast", "slow"])
+        self.assertEqual([c.is_regression(0.1) for c in comparisons], [False, True])
+        self.assertFalse(Comparison("zero", 0.0, 10.0).is_regression(0.1))
+
+    def test_nested_depth(self):
+        value = nested(3, "leaf")
+        self.assertEqual(value, {"k": {"level1": [{"k": "leaf"}, "Sensitive"]}})
+
+
+if __name__ == "__main__":
+    unittest.main()
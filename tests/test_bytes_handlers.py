@@ -0,0 +1,151 @@
+import unittest
+
+from anonymizer_data.core.config import Config
+from anonymizer_data.handlers import (
+    MaskDispatch,
+    anonymize_bytes,
+    anonymize_cpf_bytes,
+    anonymize_email_bytes,
+    anonymize_numeric_digits_bytes,
+    anonymize_string_bytes,
+)
+from tests.conftest import fake
+
+VALUES = {
+    "string": ["Hello world", "a", "", "abcabc", "Olá mundo", "ação"],
+    "name": ["Jhon Doe", "João da Silva", ""],
+    "email": ["jhondoe@example.com", "joão@example.com", "invalid", "@example.com"],
+    "phone": ["+55 (11) 91234-5678", "11912345678", "123", "12", "(11) 9١٢٣4-5678"],
+    "number": ["My phone is 1234567890", "Número ١٢٣ 45", "no digits"],
+    "cpf": ["529.982.247-25", "52998224725", "529.982.247-26", "5299822472"],
+    "cnpj": ["11.222.333/0001-81", "11222333000181", "11.222.333/0001-82"],
+    "cep": ["12345-678", "12345678", "12345-678\n", "1234-5678", "١٢٣٤٥-678"],
+    "rg": ["12.345.678-9", "123456789", "invalid"],
+    "pis": ["689.37232.86-5", "68937232864"],
+}
+
+
+def cases():
+    for type_mask, values in VALUES.items():
+        values = [*values, *(fake.cpf() for _ in range(5))]
+        for value in values:
+            yield type_mask, value
+
+
+class TestBytesHandlers(unittest.TestCase):
+    def tearDown(self):
+        Config.setup()
+
+    def assert_same_as_str(self, **kwargs):
+        dispatch = MaskDispatch()
+        for type_mask, value in cases():
+            options = dict(kwargs)
+            if type_mask == "string":
+                options.setdefault("size_anonymization", 0.5)
+            expected = dispatch.mask(type_mask, value, **options).encode()
+            data = value.encode()
+            for buffer in (data, bytearray(data), memoryview(data)):
+                with self.subTest(
+                    type_mask=type_mask, value=value, buffer=type(buffer)
+                ):
+                    result = anonymize_bytes(buffer, type_mask, **options)
+                    self.assertIs(type(result), bytes)
+                    self.assertEqual(result, expected)
+
+    def test_same_result_as_str(self):
+        self.assert_same_as_str()
+
+    def test_same_result_as_str_with_options(self):
+        self.assert_same_as_str(mask_char="#")
+        self.assert_same_as_str(mask_char="\\")
+        self.assert_same_as_str(mask_char="•")
+
+    def test_same_result_as_str_with_fallback_masking(self):
+        Config.setup(fallback_masking=True)
+        self.assert_same_as_str()
+
+    def test_strict_mode(self):
+        Config.setup(strict_mode=True)
+        with self.assertRaisesRegex(ValueError, "Invalid CPF: 529.982.247-26"):
+            anonymize_cpf_bytes(b"529.982.247-26")
+        with self.assertRaisesRegex(ValueError, "Invalid Email: invalid"):
+            anonymize_email_bytes(b"invalid")
+
+    def test_string_sizes(self):
+        for size in (0, 0.3, 1, 1.5, -0.3, -2):
+            with self.subTest(size=size):
+                self.assertEqual(
+                    anonymize_string_bytes(b"Hello world", size),
+                    MaskDispatch()
+                    .mask("string", "Hello world", size_anonymization=size)
+                    .encode(),
+                )
+
+    def test_in_place_bytearray(self):
+        buffer = bytearray(b"529.982.247-25")
+
+        result = anonymize_bytes(buffer, "cpf", in_place=True)
+
+        self.assertIs(result, buffer)
+        self.assertEqual(buffer, b"***.982.***-**")
+
+    def test_in_place_bytearray_can_change_size(self):
+        buffer = bytearray(b"12345678")
+
+        anonymize_numeric_digits_bytes(buffer, in_place=True, mask_char="••")
+
+        self.assertEqual(buffer.decode(), "••" * 8)
+
+    def test_in_place_memoryview_of_a_larger_buffer(self):
+        line = bytearray(
+            b"cpf=529.982.247-25 email=jhondoe@example.com pis=689.37232.86-5"
+        )
+        view = memoryview(line)
+
+        anonymize_bytes(view[4:18], "cpf", in_place=True)
+        anonymize_bytes(view[25:44], "email", in_place=True)
+        anonymize_bytes(view[49:], "pis", in_place=True)  # no bytes handler
+
+        self.assertEqual(
+            line, b"cpf=***.982.***-** email=******e@example.com pis=***.**232.**-*"
+        )
+
+    def test_in_place_memoryview_must_keep_its_size(self):
+        line = bytearray(b"12345678")
+
+        with self.assertRaisesRegex(ValueError, "does not fit"):
+            anonymize_bytes(memoryview(line), "number", in_place=True, mask_char="••")
+        self.assertEqual(line, b"12345678")
+
+    def test_in_place_needs_a_writable_buffer(self):
+        for buffer in (b"12345678", memoryview(b"12345678")):
+            with self.subTest(buffer=type(buffer)):
+                with self.assertRaises(TypeError):
+                    anonymize_bytes(buffer, "number", in_place=True)
+                with self.assertRaises(TypeError):
+                    anonymize_bytes(buffer, "rg", in_place=True)
+
+    def test_invalid_utf8_is_kept(self):
+        self.assertEqual(
+            anonymize_bytes(b"\xff\xfe 12345", "number"), b"\xff\xfe *****"
+        )
+
+    def test_unknown_type_mask(self):
+        data = bytearray(b"Hello world")
+        self.assertIs(anonymize_bytes(data, "unknown"), data)
+
+    def test_registering_a_handler_discards_the_bytes_handler(self):
+        self.addCleanup(
+            MaskDispatch._bytes_handlers.__setitem__,
+            "cep",
+            MaskDispatch._bytes_handlers["cep"],
+        )
+        self.addCleanup(MaskDispatch.add_handler, "cep", MaskDispatch._handlers["cep"])
+
+        MaskDispatch.add_handler("cep", lambda value, **kwargs: "cep")
+
+        self.assertEqual(anonymize_bytes(b"12345-678", "cep"), b"cep")
+
+
+if __name__ == "__main__":
+    unittest.main()
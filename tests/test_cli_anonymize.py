@@ -1,3 +1,5 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 from unittest.mock import patch
 
@@ -18,3 +20,228 @@ class TestAnonymizeFunction(TestCase):
 
         self.assertEqual(result.exit_code, 0)
         mock_print.assert_called_once_with(expected_output, style="#ccc010 bold")
+
+    def test_anonymize_string_command(self):
+        result = runner.invoke(app=app, args=["string", "Sensitive Data"])
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn("********* Data", result.output)
+
+    def test_command_names_after_double_dash(self):
+        for value, expected in (("log", "**g"), ("csv", "**v"), ("-x", "*x")):
+            with self.subTest(value=value):
+                result = runner.invoke(app=app, args=["string", "--", value])
+
+                self.assertEqual(result.exit_code, 0)
+                self.assertEqual(result.output.strip(), expected)
+
+    def test_single_command_name_is_masked(self):
+        for args, expected in (
+            (["log"], "**g"),
+            (["jsonl"], "***nl"),
+            (["--", "csv"], "**v"),
+            (["--", "-x"], "*x"),
+        ):
+            with self.subTest(args=args):
+                result = runner.invoke(app=app, args=args)
+
+                self.assertEqual(result.exit_code, 0)
+                self.assertEqual(result.output.strip(), expected)
+
+
+class TestAnonymizeJsonlCommand(TestCase):
+    def setUp(self):
+        self.input = (
+            '{"name": "Jhon Doe", "email": "jhondoe@example.com"}\n'
+            '{"name": "Maria", "email": "maria@example.com"}\n'
+        )
+
+    def test_stdin_to_stdout(self):
+        result = runner.invoke(app=app, args=["jsonl", "-k", "email"], input=self.input)
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn(
+            '{"name":"Jhon Doe","email":"*************le.com"}', result.output
+        )
+        self.assertIn('{"name":"Maria","email":"***********le.com"}', result.output)
+        self.assertIn("2 records in", result.output)
+
+    def test_files(self):
+        with TemporaryDirectory() as directory:
+            input_path = Path(directory, "input.jsonl")
+            output_path = Path(directory, "output.jsonl")
+            input_path.write_text(self.input, encoding="utf-8")
+
+            result = runner.invoke(
+                app=app,
+                args=[
+                    "jsonl",
+                    "--input",
+                    str(input_path),
+                    "--output",
+                    str(output_path),
+                    "--key-with-type-mask",
+                ],
+            )
+
+            self.assertEqual(result.exit_code, 0)
+            self.assertEqual(
+                output_path.read_text(encoding="utf-8").splitlines(),
+                [
+                    '{"name":"********","email":"******e@example.com"}',
+                    '{"name":"*****","email":"****a@example.com"}',
+                ],
+            )
+
+    def test_invalid_record(self):
+        result = runner.invoke(app=app, args=["jsonl", "-i", "-"], input="[1]\n")
+
+        self.assertNotEqual(result.exit_code, 0)
+        self.assertIn("Line 1 is not a JSON object", result.output)
+
+    def test_paths(self):
+        result = runner.invoke(
+            app=app,
+            args=["jsonl", "-p", "customer.email=email", "--path", "tags[0]"],
+            input='{"customer": {"email": "jhondoe@example.com"}, "tags": ["vip", "a"]}\n',
+        )
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn(
+            '{"customer":{"email":"******e@example.com"},"tags":["**p","a"]}',
+            result.output,
+        )
+
+    def test_paths_with_keys(self):
+        for args in (["-k", "email"], ["--key-with-type-mask"], ["-p", "a[x]"]):
+            with self.subTest(args=args):
+                result = runner.invoke(
+                    app=app, args=["jsonl", "-p", "email", *args], input=self.input
+                )
+                self.assertNotEqual(result.exit_code, 0)
+
+    def test_invalid_size_anonymization(self):
+        result = runner.invoke(
+            app=app, args=["jsonl", "--size-anonymization", "2"], input=self.input
+        )
+
+        self.assertNotEqual(result.exit_code, 0)
+
+    def test_profile(self):
+        with TemporaryDirectory() as directory:
+            profile_path = Path(directory, "profile.folded")
+
+            result = runner.invoke(
+                app=app,
+                args=["jsonl", "--key-with-type-mask", "--profile", str(profile_path)],
+                input='{"customer": {"name": "Jhon"}, "email": "jhondoe@example.com"}\n',
+            )
+
+            self.assertEqual(result.exit_code, 0)
+            self.assertIn('"email":"******e@example.com"', result.output)
+            self.assertIn("customer.name", result.output)
+            self.assertIn("anonymize_email", result.output)
+            stacks = [
+                line.rpartition(" ")[0]
+                for line in profile_path.read_text(encoding="utf-8").splitlines()
+            ]
+            self.assertIn("MaskDictPlan;email;anonymize_email", stacks)
+
+    def test_profile_with_paths(self):
+        result = runner.invoke(
+            app=app,
+            args=["jsonl", "-p", "email", "--profile", "profile.folded"],
+            input=self.input,
+        )
+
+        self.assertNotEqual(result.exit_code, 0)
+
+
+class TestAnonymizeCsvCommand(TestCase):
+    def test_stdin_to_stdout(self):
+        result = runner.invoke(
+            app=app,
+            args=["csv", "name", "mail=email", "-d", ";"],
+            input="name;mail;age\nJhon Doe;jhondoe@example.com;33\n",
+        )
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn("********;******e@example.com;33", result.output)
+        self.assertIn("1 records in", result.output)
+
+    def test_stdin_keeps_line_breaks_inside_fields(self):
+        result = runner.invoke(
+            app=app,
+            args=["csv", "cep"],
+            input='cep,notes\r\n12345-678,"a\r\nb"\r\n',
+        )
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn(b'*****-678,"a\r\nb"\r\n', result.stdout_bytes)
+
+    def test_files(self):
+        with TemporaryDirectory() as directory:
+            input_path = Path(directory, "input.csv")
+            output_path = Path(directory, "output.csv")
+            input_path.write_text("cep,city\n12345-678,São Paulo\n", encoding="utf-8")
+
+            result = runner.invoke(
+                app=app,
+                args=["csv", "cep", "-i", str(input_path), "-o", str(output_path)],
+            )
+
+            self.assertEqual(result.exit_code, 0)
+            self.assertEqual(
+                output_path.read_text(encoding="utf-8"),
+                "cep,city\n*****-678,São Paulo\n",
+            )
+
+    def test_unknown_column(self):
+        result = runner.invoke(app=app, args=["csv", "cpf"], input="name\nJhon\n")
+
+        self.assertNotEqual(result.exit_code, 0)
+        self.assertIn("Column 'cpf' is not in the CSV header", result.output)
+
+
+class TestAnonymizeLogCommand(TestCase):
+    def test_files(self):
+        with TemporaryDirectory() as directory:
+            input_path = Path(directory, "app.log")
+            output_path = Path(directory, "app.masked.log")
+            input_path.write_text(
+                "login jhondoe@example.com\ncpf 529.982.247-25\n", encoding="utf-8"
+            )
+
+            result = runner.invoke(
+                app=app,
+                args=["log", str(input_path), "-o", str(output_path), "-t", "cpf"],
+            )
+
+            self.assertEqual(result.exit_code, 0)
+            self.assertIn("1 values masked in", result.output)
+            self.assertEqual(
+                output_path.read_text(encoding="utf-8"),
+                "login jhondoe@example.com\ncpf ***.982.***-**\n",
+            )
+
+    def test_stdout(self):
+        with TemporaryDirectory() as directory:
+            input_path = Path(directory, "app.log")
+            input_path.write_text("login jhondoe@example.com\n", encoding="utf-8")
+
+            result = runner.invoke(app=app, args=["log", str(input_path)])
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn("login ******e@example.com\n", result.output)
+
+    def test_invalid_options(self):
+        result = runner.invoke(app=app, args=["log", "missing.log"])
+        self.assertNotEqual(result.exit_code, 0)
+
+        with TemporaryDirectory() as directory:
+            input_path = Path(directory, "app.log")
+            input_path.write_text("", encoding="utf-8")
+            result = runner.invoke(app=app, args=["log", str(input_path), "-t", "x"])
+
+        self.assertNotEqual(result.exit_code, 0)
+        self.assertIn("has no registered pattern", result.output)
@@ -36,6 +36,16 @@ class TestHandlerAnonymizeString(unittest.TestCase):
         result = anonymize_string("SensitiveData", size_anonymization=-0)
         self.assertEqual(result, "SensitiveData")
 
+    def test_negative_size_masks_first_occurrence_of_suffix(self):
+        result = anonymize_string("abab", size_anonymization=-0.5)
+        self.assertEqual(result, "**ab")
+
+    def test_mask_char(self):
+        result = anonymize_string(
+            "SensitiveData", size_anonymization=0.5, mask_char="#"
+        )
+        self.assertEqual(result, "######iveData")
+
     def test_default_size_anonymization(self):
         with self.assertRaises(TypeError):
             anonymize_string("SensitiveData")
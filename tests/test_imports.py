@@ -0,0 +1,54 @@
+import os
+import subprocess
+import sys
+import unittest
+
+import anonymizer_data
+
+
+def imported_modules(statement: str) -> set[str]:
+    """Returns the modules loaded by `statement` in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-c", f"{statement}\nimport sys\nprint(*sys.modules)"],
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_package_import_loads_no_handler(self):
+        modules = imported_modules("import anonymizer_data")
+
+        self.assertIn("anonymizer_data", modules)
+        self.assertNotIn("anonymizer_data.core", modules)
+        self.assertNotIn("anonymizer_data.handlers", modules)
+
+    def test_names_imported_on_first_use(self):
+        modules = imported_modules(
+            "from anonymizer_data import MaskDict\n"
+            "assert MaskDict({'email': 'jhondoe@example.com'}).anonymize()"
+        )
+
+        self.assertIn("anonymizer_data.handlers.functions", modules)
+
+    def test_cli_import_defers_rich_and_handlers(self):
+        modules = imported_modules("import anonymizer_data.cli")
+
+        self.assertIn("typer", modules)
+        self.assertNotIn("rich", modules)
+        self.assertNotIn("anonymizer_data.core", modules)
+
+    def test_lazy_attributes(self):
+        from anonymizer_data.core import MaskStr
+
+        self.assertIs(anonymizer_data.MaskStr, MaskStr)
+        self.assertLessEqual(set(anonymizer_data.__all__), set(dir(anonymizer_data)))
+        with self.assertRaises(AttributeError):
+            anonymizer_data.missing  # noqa: B018
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import random
+import unittest
+from copy import deepcopy
+
+from anonymizer_data import MaskDict, MaskList, anonymize_in_place, anonymize_value
+from tests.conftest import fake
+from tests.payloads import COMPLEX_DICT
+from tests.trees import OPTIONS, random_tree
+
+
+class TestAnonymizeInPlace(unittest.TestCase):
+    def test_same_result_as_copy(self):
+        rng = random.Random(14)
+        for _ in range(200):
+            tree = {"root": random_tree(rng), "cpf": random_tree(rng)}
+            for options in OPTIONS:
+                with self.subTest(tree=tree, options=options):
+                    expected = anonymize_value(tree, **options)
+                    self.assertEqual(
+                        anonymize_in_place(deepcopy(tree), **options), expected
+                    )
+                    self.assertEqual(
+                        anonymize_in_place([deepcopy(tree)], **options),
+                        anonymize_value([tree], **options),
+                    )
+
+    def test_containers_are_reused(self):
+        data = deepcopy(COMPLEX_DICT)
+        inner = data["outer_key"]["inner_key1"]
+
+        result = anonymize_in_place(data)
+
+        self.assertIs(result, data)
+        self.assertIs(data["outer_key"]["inner_key1"], inner)
+        self.assertEqual(inner[0], "*********Data1")
+
+    def test_shared_container_masked_once(self):
+        shared = [fake.cpf()]
+        data = {"cpf": shared, "cpfs": shared}
+        expected = anonymize_value([shared[0]], type_mask="cpf")
+
+        anonymize_in_place(data, key_with_type_mask=True)
+
+        self.assertEqual(data, {"cpf": expected, "cpfs": expected})
+
+    def test_cycles_and_depth(self):
+        data = {"name": "Hello world"}
+        data["self"] = data
+        anonymize_in_place(data)
+        self.assertEqual(data["name"], "*******orld")
+
+        deep = node = []
+        for _ in range(5000):
+            child = []
+            node.append(child)
+            node = child
+        node.append("Hello world")
+        anonymize_in_place(deep)
+        self.assertEqual(node, ["*******orld"])
+
+    def test_scalar(self):
+        self.assertEqual(anonymize_in_place("Hello world"), "*******orld")
+
+
+class TestInPlaceClasses(unittest.TestCase):
+    def test_mask_dict(self):
+        data = deepcopy(COMPLEX_DICT)
+        expected = MaskDict(COMPLEX_DICT, selected_keys=["outer_key3"]).anonymize()
+
+        mask = MaskDict(data, selected_keys=["outer_key3"], in_place=True)
+
+        self.assertIs(mask.anonymize(), data)
+        self.assertEqual(data, expected)
+        self.assertIs(mask.view(), data)
+
+    def test_mask_dict_with_keys(self):
+        data = {"name": "Jhon Doe", "email": "jhondoe@example.com"}
+        MaskDict(data, in_place=True).with_keys(["name"]).anonymize()
+        self.assertEqual(data, {"name": "*****Doe", "email": "jhondoe@example.com"})
+
+    def test_mask_list(self):
+        data = ["Hello world", {"cpf": "Hello world"}]
+        expected = MaskList(deepcopy(data), key_with_type_mask=True).anonymize()
+
+        self.assertIs(
+            MaskList(data, in_place=True, key_with_type_mask=True).anonymize(), data
+        )
+        self.assertEqual(data, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
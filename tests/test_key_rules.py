@@ -0,0 +1,157 @@
+import io
+import unittest
+from copy import deepcopy
+from types import MappingProxyType
+from unittest.mock import patch
+
+from anonymizer_data import MaskDict, anonymize_in_place, anonymize_value
+from anonymizer_data.core import MaskDictPlan, MaskDictView
+from anonymizer_data.handlers import KeyRules, MaskDispatch
+from anonymizer_data.streams import anonymize_csv
+
+RECORD = {
+    "CPF": "529.982.247-25",
+    "userCpf": "529.982.247-25",
+    "cpf_titular": "529.982.247-25",
+    "telefoneCelular": "(11) 91234-5678",
+    "customerEmail": "jhondoe@example.com",
+    "zipCode": "01001-000",
+    "tags": "Hello world",
+    "": "Hello world",
+}
+
+
+def use_key_rules(test, rules):
+    previous = MaskDispatch.key_rules
+    MaskDispatch.set_key_rules(rules)
+    test.addCleanup(MaskDispatch.set_key_rules, previous)
+
+
+class TestKeyRules(unittest.TestCase):
+    def test_resolve_key(self):
+        cases = {
+            "cpf": "cpf",
+            "CPF": "cpf",
+            "userCpf": "cpf",
+            "userCPF": "cpf",
+            "cpf_titular": "cpf",
+            "CPFTitular": "cpf",
+            "numeroCpf": "cpf",
+            "telefoneCelular": "telefone",
+            "phoneNumber": "phone",
+            "firstName": "first_name",
+            "customer-email": "email",
+            "emailAddress": "email",
+            "NomeCompleto": "nome",
+            "zipCode": "cep",
+            "number": "number",
+            "tags": "tags",
+            "user": "user",
+            "": "",
+            1: 1,
+        }
+        for key, type_mask in cases.items():
+            with self.subTest(key=key):
+                self.assertEqual(MaskDispatch.resolve_key(key), type_mask)
+
+    def test_same_result_everywhere(self):
+        expected = {
+            key: anonymize_value(value, type_mask=type_mask)
+            for key, value in RECORD.items()
+            for type_mask in [MaskDispatch.resolve_key(key)]
+        }
+        self.assertEqual(expected["CPF"], "***.982.***-**")
+        self.assertEqual(expected["tags"], "Hello world")
+
+        self.assertEqual(anonymize_value(RECORD, key_with_type_mask=True), expected)
+        self.assertEqual(
+            MaskDict(RECORD, key_with_type_mask=True).anonymize(), expected
+        )
+        self.assertEqual(
+            MaskDictPlan.compile(key_with_type_mask=True).anonymize(RECORD), expected
+        )
+        self.assertEqual(
+            MaskDictView.from_options(RECORD, key_with_type_mask=True).materialize(),
+            expected,
+        )
+        self.assertEqual(
+            anonymize_in_place(deepcopy(RECORD), key_with_type_mask=True), expected
+        )
+
+    def test_each_key_is_analyzed_once(self):
+        MaskDispatch.key_index.clear()
+        plan = MaskDictPlan.compile(key_with_type_mask=True)
+
+        with patch.object(
+            KeyRules, "candidates", autospec=True, side_effect=KeyRules.candidates
+        ) as candidates:
+            for _ in range(50):
+                anonymize_value(RECORD, key_with_type_mask=True)
+                MaskDict(RECORD, key_with_type_mask=True).anonymize()
+                plan.anonymize(RECORD)
+
+        analyzed = [call.args[1] for call in candidates.call_args_list]
+        self.assertEqual(sorted(analyzed), sorted(set(analyzed)))
+        self.assertIn("userCpf", analyzed)
+        self.assertNotIn("cpf", analyzed)  # registered mask types are not analyzed
+        self.assertEqual(MaskDispatch.key_index["userCpf"], "cpf")
+
+    def test_index_is_bounded(self):
+        MaskDispatch.key_index.clear()
+        self.addCleanup(MaskDispatch.key_index.clear)
+        self.addCleanup(setattr, MaskDispatch.key_index, "maxsize", 4096)
+        MaskDispatch.key_index.maxsize = 100
+        plan = MaskDictPlan.compile(key_with_type_mask=True)
+
+        for index in range(1000):
+            record = {f"order-{index}": "value", "userCpf": "529.982.247-25"}
+            self.assertEqual(plan.anonymize(record)["userCpf"], "***.982.***-**")
+            anonymize_value(record, key_with_type_mask=True)
+
+        self.assertEqual(len(MaskDispatch.key_index), 100)
+        self.assertEqual(len(plan.rules), 100)
+        self.assertIn("order-999", MaskDispatch.key_index)
+        self.assertNotIn("order-0", MaskDispatch.key_index)
+        self.assertEqual(MaskDispatch.resolve_key("userCpf"), "cpf")
+
+    def test_exact_rules(self):
+        use_key_rules(self, KeyRules.exact())
+
+        result = anonymize_value(RECORD, key_with_type_mask=True)
+
+        self.assertEqual(result["CPF"], "529.982.247-25")
+        self.assertEqual(result["userCpf"], "529.982.247-25")
+        self.assertEqual(MaskDispatch.resolve_key("cpf"), "cpf")
+
+    def test_custom_rules(self):
+        use_key_rules(
+            self,
+            KeyRules(
+                prefixes=frozenset({"titular"}),
+                suffixes=frozenset(),
+                aliases=MappingProxyType({"documento": "cpf"}),
+            ),
+        )
+
+        self.assertEqual(MaskDispatch.resolve_key("titularDocumento"), "cpf")
+        self.assertEqual(MaskDispatch.resolve_key("cpf_titular"), "cpf_titular")
+
+    def test_registering_a_handler_clears_the_index(self):
+        self.assertEqual(MaskDispatch.resolve_key("userMatricula"), "userMatricula")
+
+        MaskDispatch.add_handler("matricula", lambda value, **kwargs: "***")
+        self.addCleanup(MaskDispatch.key_index.clear)
+        self.addCleanup(MaskDispatch._handlers.pop, "matricula")
+
+        self.assertEqual(MaskDispatch.resolve_key("userMatricula"), "matricula")
+
+    def test_csv_columns(self):
+        output = io.StringIO()
+
+        anonymize_csv(["name,CPF\n", "Jhon,529.982.247-25\n"], output, {"CPF": "CPF"})
+
+        self.assertEqual(output.getvalue().splitlines()[1], "Jhon,***.982.***-**")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+import io
+import logging
+import unittest
+
+from anonymizer_data.core.config import Config
+from anonymizer_data.logs import AnonymizingFilter, queue_handler
+from tests.conftest import fake
+
+
+class LoggingTestCase(unittest.TestCase):
+    def setUp(self):
+        self.stream = io.StringIO()
+        self.handler = logging.StreamHandler(self.stream)
+        self.handler.setFormatter(logging.Formatter("%(message)s"))
+        self.logger = logging.getLogger(f"tests.logs.{self.id()}")
+        self.logger.propagate = False
+        self.logger.setLevel(logging.INFO)
+
+    def tearDown(self):
+        self.logger.handlers.clear()
+        Config.setup()
+
+    def output(self):
+        return self.stream.getvalue().splitlines()
+
+
+class TestAnonymizingFilter(LoggingTestCase):
+    def setUp(self):
+        super().setUp()
+        self.logger.addHandler(self.handler)
+
+    def test_args_are_masked_and_numbers_kept(self):
+        self.handler.addFilter(AnonymizingFilter())
+        self.logger.info("user %s has %d items", "Hello world", 3)
+        self.assertEqual(self.output(), ["user *******orld has 3 items"])
+
+    def test_args_type_mask_none(self):
+        self.handler.addFilter(AnonymizingFilter(args_type_mask=None))
+        self.logger.info("user %s", "Hello world")
+        self.assertEqual(self.output(), ["user Hello world"])
+
+    def test_extra_fields(self):
+        self.handler.setFormatter(logging.Formatter("%(message)s %(cpf)s %(document)s"))
+        self.handler.addFilter(AnonymizingFilter(fields={"document": "cep"}))
+
+        self.logger.info(
+            "login", extra={"cpf": "529.982.247-25", "document": "12345-678"}
+        )
+
+        self.assertEqual(self.output(), ["login ***.982.***-** *****-678"])
+
+    def test_record_attributes_are_not_masked(self):
+        self.handler.setFormatter(logging.Formatter("%(name)s|%(message)s"))
+        self.handler.addFilter(AnonymizingFilter(args_type_mask=None))
+        self.logger.info("plain")
+        self.assertEqual(self.output(), [f"{self.logger.name}|plain"])
+
+    def test_mapping_args(self):
+        self.handler.addFilter(AnonymizingFilter())
+        self.logger.info(
+            "%(email)s %(note)s %(count)d",
+            {"email": "jhondoe@example.com", "note": "Hello world", "count": 2},
+        )
+        self.assertEqual(self.output(), ["******e@example.com *******orld 2"])
+
+    def test_field_names_resolved_like_dict_keys(self):
+        self.handler.setFormatter(logging.Formatter("%(message)s %(userCpf)s"))
+        self.handler.addFilter(AnonymizingFilter())
+
+        self.logger.info(
+            "%(customerEmail)s %(note)s",
+            {"customerEmail": "jhondoe@example.com", "note": "Hello world"},
+            extra={"userCpf": "529.982.247-25"},
+        )
+
+        self.assertEqual(
+            self.output(), ["******e@example.com *******orld ***.982.***-**"]
+        )
+
+    def test_message_type_mask(self):
+        self.handler.addFilter(
+            AnonymizingFilter(args_type_mask=None, message_type_mask="numero")
+        )
+        self.logger.info("call %s now", "1234-5678")
+        self.assertEqual(self.output(), ["call ****-**** now"])
+
+    def test_masked_once(self):
+        anonymizer = AnonymizingFilter()
+        self.logger.addFilter(anonymizer)
+        self.handler.addFilter(anonymizer)
+        self.logger.info("%s", "Hello world")
+        self.assertEqual(self.output(), ["*******orld"])
+
+    def test_rejected_value_does_not_raise(self):
+        Config.setup(strict_mode=True)
+        self.handler.addFilter(AnonymizingFilter(fields={"doc": "cpf"}))
+        self.logger.info("doc", extra={"doc": "123"})
+        self.assertEqual(self.stream.getvalue(), "doc\n")
+
+    def test_invalid_options(self):
+        with self.assertRaises(ValueError):
+            AnonymizingFilter(size_anonymization=2.0)
+
+
+class TestQueueHandler(LoggingTestCase):
+    def test_masked_in_listener(self):
+        handler, listener = queue_handler(self.handler, fields={"doc": "cpf"})
+        self.logger.addHandler(handler)
+        cpf = fake.cpf()
+
+        listener.start()
+        try:
+            for index in range(50):
+                self.logger.info("item %s %d", "Hello world", index, extra={"doc": cpf})
+        finally:
+            listener.stop()
+
+        self.assertEqual(
+            self.output(), [f"item *******orld {index}" for index in range(50)]
+        )
+
+    def test_call_site_record_is_untouched(self):
+        handler, listener = queue_handler(self.handler)
+        self.logger.addHandler(handler)
+        records = []
+        self.logger.addFilter(lambda record: records.append(record) or True)
+
+        listener.start()
+        self.logger.info("%s", "Hello world")
+        listener.stop()
+
+        self.assertEqual(records[0].args, ("Hello world",))
+        self.assertEqual(self.output(), ["*******orld"])
+
+
+if __name__ == "__main__":
+    unittest.main()
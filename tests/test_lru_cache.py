@@ -0,0 +1,45 @@
+import unittest
+
+from anonymizer_data.core.cache import MISSING, CacheInfo, LRUCache
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_disabled_by_default(self):
+        cache = LRUCache()
+        cache.put("key", "value")
+        self.assertIs(cache.get("key", MISSING), MISSING)
+        self.assertEqual(len(cache), 0)
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIn("c", cache)
+
+    def test_resize(self):
+        cache = LRUCache(maxsize=3)
+        for key in "abc":
+            cache.put(key, key)
+        cache.maxsize = 1
+        self.assertEqual(len(cache), 1)
+        self.assertIn("c", cache)
+
+    def test_info_and_clear(self):
+        cache = LRUCache(maxsize=2)
+        cache.put("a", False)
+        self.assertFalse(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.info(), CacheInfo(1, 1, 2, 1))
+        self.assertEqual(cache.info().hit_rate, 0.5)
+
+        cache.clear()
+        self.assertEqual(cache.info(), CacheInfo(0, 0, 2, 0))
+        self.assertEqual(cache.info().hit_rate, 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
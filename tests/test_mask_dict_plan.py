@@ -0,0 +1,89 @@
+import pickle
+import unittest
+
+from anonymizer_data.core import MaskDict, MaskDictPlan
+from anonymizer_data.handlers import MaskDispatch
+from tests.conftest import fake
+from tests.payloads import COMPLEX_DICT
+
+
+class TestMaskDictPlan(unittest.TestCase):
+    def setUp(self):
+        self.record = {
+            "username": "JhonDoe",
+            "password": "123Change",
+            "cpf": fake.cpf(),
+            "email": "jhondoe@example.com",
+            "age": 33,
+            "active": True,
+            "": "EmptyKey",
+            "roles": ["Admin", "developer", 7],
+            "contact": {"phone": "+55 (11) 91234-5678", "cep": "12345-678"},
+        }
+        self.payloads = [self.record, COMPLEX_DICT, {}]
+
+    def assertSameAsMaskDict(self, **options):
+        plan = MaskDict.compile(**options)
+        for payload in self.payloads:
+            self.assertEqual(
+                plan.anonymize(payload), MaskDict(payload, **options).anonymize()
+            )
+
+    def test_default(self):
+        self.assertSameAsMaskDict()
+
+    def test_default_with_options(self):
+        self.assertSameAsMaskDict(size_anonymization=0.5, mask_char="#")
+
+    def test_type_mask_option(self):
+        self.assertSameAsMaskDict(type_mask="cpf")
+
+    def test_selected_keys(self):
+        self.assertSameAsMaskDict(selected_keys=["password", "contact", "outer_key2"])
+
+    def test_key_with_type_mask(self):
+        self.assertSameAsMaskDict(key_with_type_mask=True)
+
+    def test_string_masker(self):
+        self.assertSameAsMaskDict(string_masker=MaskDispatch())
+
+    def test_anonymize_many(self):
+        plan = MaskDict.compile(key_with_type_mask=True)
+        records = [self.record, COMPLEX_DICT]
+        self.assertEqual(
+            list(plan.anonymize_many(records)),
+            [MaskDict(r, key_with_type_mask=True).anonymize() for r in records],
+        )
+
+    def test_does_not_mutate_input(self):
+        record = {"key": ["value", {"inner": "value"}]}
+        MaskDict.compile().anonymize(record)
+        self.assertEqual(record, {"key": ["value", {"inner": "value"}]})
+
+    def test_invalid_size_anonymization(self):
+        with self.assertRaises(ValueError):
+            MaskDict.compile(size_anonymization=1.5)
+
+    def test_plan_is_immutable(self):
+        plan = MaskDictPlan.compile(selected_keys=["key"])
+        with self.assertRaises(AttributeError):
+            plan.default = plan.rules["key"]  # type: ignore
+        with self.assertRaises(TypeError):
+            plan.rules["other"] = plan.default  # type: ignore
+
+    def test_pickle(self):
+        for options in ({}, {"key_with_type_mask": True}, {"selected_keys": ["cpf"]}):
+            with self.subTest(options=options):
+                plan = MaskDictPlan.compile(**options, mask_char="#")
+                restored = pickle.loads(pickle.dumps(plan))
+                self.assertEqual(
+                    restored.anonymize(COMPLEX_DICT), plan.anonymize(COMPLEX_DICT)
+                )
+                self.assertIs(pickle.loads(pickle.dumps(plan)), restored)
+
+        with self.assertRaises(TypeError):
+            pickle.dumps(MaskDictPlan({}, MaskDictPlan.compile().default))
+
+
+if __name__ == "__main__":
+    unittest.main()
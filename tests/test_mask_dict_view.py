@@ -0,0 +1,142 @@
+import unittest
+from copy import deepcopy
+from unittest import mock
+
+from anonymizer_data import MaskDict
+from anonymizer_data.core import MaskDictView, MaskListView
+from anonymizer_data.core.plan import MaskDictPlan
+from anonymizer_data.core.view import _materialize
+from tests.conftest import fake
+from tests.payloads import COMPLEX_DICT
+
+OPTIONS = [
+    {},
+    {"key_with_type_mask": True},
+    {"selected_keys": ["outer_key3", "inner_key1", "cpf"]},
+    {"size_anonymization": 0.5},
+]
+
+
+def document():
+    return {
+        "cpf": fake.cpf(),
+        "email": fake.email(),
+        "count": 3,
+        "customer": {"name": fake.name(), "phones": [fake.phone_number(), 11]},
+        "history": [{"cpf": fake.cpf()}, [fake.name()], "Hello world"],
+        **deepcopy(COMPLEX_DICT),
+    }
+
+
+class TestMaskDictView(unittest.TestCase):
+    def test_materialize_equals_mask_dict(self):
+        data = document()
+        for options in OPTIONS:
+            with self.subTest(options=options):
+                view = MaskDictView.from_options(data, **options)
+                self.assertEqual(
+                    view.materialize(), MaskDict(data, **options).anonymize()
+                )
+
+    def test_from_plan(self):
+        data = document()
+        plan = MaskDictPlan.compile(key_with_type_mask=True)
+        self.assertEqual(
+            MaskDictView.from_plan(plan, data).materialize(), plan.anonymize(data)
+        )
+
+    def test_nested_access_is_lazy(self):
+        data = document()
+        view = MaskDictView.from_options(data, key_with_type_mask=True)
+        expected = MaskDict(data, key_with_type_mask=True).anonymize()
+
+        customer = view["customer"]
+
+        self.assertIsInstance(customer, MaskDictView)
+        self.assertEqual(customer.anonymized_keys(), [])
+        self.assertEqual(customer["name"], expected["customer"]["name"])
+        self.assertEqual(customer.anonymized_keys(), ["name"])
+        self.assertEqual(view.anonymized_keys(), ["customer"])
+        self.assertIsInstance(customer["phones"], MaskListView)
+        self.assertEqual(customer["phones"][-1], expected["customer"]["phones"][-1])
+
+    def test_untouched_values_are_not_masked(self):
+        view = MaskDictView.from_options(document(), key_with_type_mask=True)
+        with mock.patch(
+            "anonymizer_data.handlers.functions.anonymize_cpf"
+        ) as anonymize_cpf:
+            view["email"]
+        anonymize_cpf.assert_not_called()
+
+    def test_values_are_memoized(self):
+        view = MaskDictView.from_options(document())
+        self.assertIs(view["customer"], view["customer"])
+        self.assertEqual(view["cpf"], view["cpf"])
+        self.assertEqual(len(view.anonymized_keys()), 2)
+
+    def test_mapping_interface(self):
+        data = document()
+        view = MaskDictView.from_options(data)
+        self.assertEqual(list(view), list(data))
+        self.assertEqual(len(view), len(data))
+        self.assertIn("cpf", view)
+        self.assertNotIn("missing", view)
+        with self.assertRaises(KeyError):
+            view["missing"]
+        self.assertEqual(view.get("missing", 1), 1)
+
+    def test_list_view_slices(self):
+        view = MaskDictView.from_options(
+            {"items": ["Hello world", "Hello Python", "abc"]}
+        )
+        self.assertEqual(view["items"][1:], ["********thon", "**c"])
+        self.assertEqual(len(view["items"]), 3)
+
+    def test_list_view_index_out_of_range(self):
+        items = MaskDictView.from_options({"items": ["Hello world", "abc"]})["items"]
+        for index in (-3, 2):
+            with self.subTest(index=index), self.assertRaises(IndexError):
+                items[index]
+        self.assertEqual(items[-1], "**c")
+        self.assertEqual(repr(items), "<MaskListView of 2 items, 1 anonymized>")
+
+    def test_invalid_options(self):
+        with self.assertRaises(ValueError):
+            MaskDictView.from_options(
+                {}, key_with_type_mask=True, size_anonymization=2.0
+            )
+
+
+class TestLazyMaskDict(unittest.TestCase):
+    def test_getitem_and_iteration(self):
+        data = document()
+        expected = MaskDict(data, key_with_type_mask=True).anonymize()
+        mask = MaskDict(data, key_with_type_mask=True, lazy=True)
+
+        self.assertEqual(mask["cpf"], expected["cpf"])
+        self.assertEqual(mask["customer"]["name"], expected["customer"]["name"])
+        self.assertEqual({key: _materialize(value) for key, value in mask}, expected)
+
+    def test_anonymize_materializes(self):
+        data = document()
+        mask = MaskDict(data, selected_keys=["cpf"], lazy=True)
+        mask["cpf"]
+        self.assertEqual(
+            mask.anonymize(), MaskDict(data, selected_keys=["cpf"]).anonymize()
+        )
+        self.assertEqual(mask["customer"], data["customer"])
+
+    def test_with_keys(self):
+        mask = MaskDict({"name": "Jhon Doe", "email": "a"}, lazy=True).with_keys(
+            ["name"]
+        )
+        self.assertEqual(mask["name"], "*****Doe")
+        self.assertEqual(mask["email"], "a")
+
+    def test_lazy_and_in_place(self):
+        with self.assertRaises(ValueError):
+            MaskDict({}, lazy=True, in_place=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
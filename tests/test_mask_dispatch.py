@@ -1,6 +1,8 @@
 import unittest
 
+from anonymizer_data.core.config import Config
 from anonymizer_data.handlers import MaskDispatch
+from tests.conftest import fake
 
 
 class TestMaskDispatch(unittest.TestCase):
@@ -19,6 +21,69 @@ class TestMaskDispatch(unittest.TestCase):
         result = self.dispatch.mask("invalid", "SensitiveData")
         self.assertEqual(result, "SensitiveData")
 
+    def test_mask_column_same_as_mask(self):
+        columns = {
+            "cpf": [fake.cpf(), "12345678910", fake.cpf().replace(".", "")],
+            "email": ["user@example.com", "invalid-email", ""],
+            "cep": ["12345-678", "12345678", "123"],
+            "number": ["My phone is 1234567890", "abc", 42],
+            "name": ["Jhon Doe", "x", "", 123],
+            "telefone": ["+55 (11) 91234-5678", "12"],
+        }
+        for type_mask, values in columns.items():
+            self.assertEqual(
+                self.dispatch.mask_column(type_mask, values),
+                [self.dispatch.mask(type_mask, value) for value in values],
+            )
+
+    def test_mask_column_with_options(self):
+        values = ["SensitiveData", "Data"]
+        self.assertEqual(
+            self.dispatch.mask_column("string", values, size_anonymization=0.5),
+            ["******iveData", "**ta"],
+        )
+        self.assertEqual(
+            self.dispatch.mask_column("name", values, mask_char="#"),
+            ["#############", "####"],
+        )
+
+    def test_mask_column_uses_config_mask_char(self):
+        Config.setup(mask_char="X")
+        try:
+            result = self.dispatch.mask_column("number", ["a1b2"])
+        finally:
+            Config.setup()
+        self.assertEqual(result, ["aXbX"])
+
+    def test_mask_column_with_invalid_handler(self):
+        values = (value for value in ["SensitiveData"])
+        self.assertEqual(
+            self.dispatch.mask_column("invalid", values), ["SensitiveData"]
+        )
+
+    def test_mask_column_uses_column_handler(self):
+        @MaskDispatch.register("test_column")
+        def handler(value, **kwargs):
+            return value.upper()
+
+        @MaskDispatch.register_column("test_column")
+        def column_handler(values, **kwargs):
+            return ["column"] * len(values)
+
+        try:
+            self.assertEqual(
+                self.dispatch.mask_column("test_column", ["a"]), ["column"]
+            )
+            MaskDispatch.add_handler("test_column", handler)
+            self.assertEqual(self.dispatch.mask_column("test_column", ["a"]), ["A"])
+        finally:
+            MaskDispatch._handlers.pop("test_column")
+
+    def test_type_masks_of(self):
+        self.assertEqual(
+            MaskDispatch.type_masks_of(MaskDispatch._handlers["cpf"]), ("cpf", "cpfs")
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
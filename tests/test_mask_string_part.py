@@ -19,6 +19,10 @@ class TestMaskStrPart(unittest.TestCase):
         result = mask_string_part("SensitiveData", 0, 8, occurrences=-1)
         self.assertEqual(result, "SensitiveData")
 
+    def test_mask_part_all_occurrences(self):
+        result = mask_string_part("abcabcabc", 0, 3, occurrences=0)
+        self.assertEqual(result, "*********")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,132 @@
+import unittest
+
+from anonymizer_data import MaskDict, anonymize_value
+from anonymizer_data.core.config import Config
+from anonymizer_data.handlers import PiiScanner, anonymize_bytes
+from anonymizer_data.handlers.dispatch import MaskDispatch
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        MaskDispatch.metrics_reset()
+        MaskDispatch.cache_clear()
+        Config.setup(metrics=True)
+
+    def tearDown(self):
+        Config.setup()
+        MaskDispatch.metrics_reset()
+        MaskDispatch.cache_clear()
+
+    def test_disabled_by_default(self):
+        Config.setup()
+
+        anonymize_value("529.982.247-25", type_mask="cpf")
+        anonymize_value("vip", type_mask="tags")
+
+        snapshot = MaskDispatch.metrics_snapshot()
+        self.assertEqual(
+            (snapshot.handlers, snapshot.invalid, snapshot.unmatched), ({}, {}, {})
+        )
+
+    def test_calls_time_and_bytes(self):
+        anonymize_value("529.982.247-25", type_mask="cpf")
+        anonymize_value("jhondoe@example.com", type_mask="email")
+        anonymize_value("joão@example.com", type_mask="email")
+
+        snapshot = MaskDispatch.metrics_snapshot()
+        self.assertEqual(set(snapshot.handlers), {"cpf", "email"})
+        self.assertEqual(snapshot.handlers["cpf"].calls, 1)
+        self.assertEqual(snapshot.handlers["cpf"].bytes, 14)
+        self.assertEqual(snapshot.handlers["email"].calls, 2)
+        self.assertEqual(snapshot.handlers["email"].bytes, 19 + 17)
+        self.assertGreater(snapshot.handlers["email"].seconds, 0)
+        self.assertEqual(snapshot.calls, 3)
+
+    def test_invalid_documents(self):
+        self.assertEqual(anonymize_value("529.982.247-26", type_mask="cpf"), "*" * 14)
+        anonymize_value("invalid", type_mask="email")
+        anonymize_value("11.222.333/0001-82", type_mask="cnpj")
+        anonymize_bytes(b"11.222.333/0001-82", "cnpj")
+
+        snapshot = MaskDispatch.metrics_snapshot()
+        self.assertEqual(snapshot.invalid, {"CPF": 1, "Email": 1, "CNPJ": 2})
+
+    def test_invalid_documents_in_strict_mode(self):
+        Config.setup(strict_mode=True, metrics=True)
+
+        with self.assertRaises(ValueError):
+            anonymize_value("529.982.247-26", type_mask="cpf")
+
+        snapshot = MaskDispatch.metrics_snapshot()
+        self.assertEqual(snapshot.invalid, {"CPF": 1})
+        self.assertEqual(snapshot.handlers["cpf"].calls, 1)
+
+    def test_unmatched_type_masks(self):
+        data = {"email": "jhondoe@example.com", "tags": ["vip", "new"], "id": "42"}
+
+        MaskDict(data, key_with_type_mask=True).anonymize()
+        MaskDict.compile(key_with_type_mask=True).anonymize(data)
+
+        snapshot = MaskDispatch.metrics_snapshot()
+        self.assertEqual(snapshot.unmatched, {"tags": 4, "id": 2})
+        self.assertEqual(snapshot.handlers["email"].calls, 2)
+
+    def test_columns(self):
+        values = ["12345678", "Número 123", "no digits"]
+
+        MaskDispatch().mask_column("number", iter(values))
+        MaskDispatch().mask_column("cep", ["12345-678"])
+        MaskDispatch().mask_column("unknown", values)
+
+        snapshot = MaskDispatch.metrics_snapshot()
+        self.assertEqual(snapshot.handlers["number"].calls, 3)
+        self.assertEqual(snapshot.handlers["number"].bytes, 8 + 11 + 9)
+        self.assertEqual(snapshot.handlers["cep"].calls, 1)
+        self.assertEqual(snapshot.unmatched, {"unknown": 3})
+
+    def test_bytes_and_free_text(self):
+        anonymize_bytes(memoryview(b"529.982.247-25"), "cpf")
+        anonymize_bytes(b"689.37232.86-5", "pis")  # through the str handler
+        anonymize_bytes(b"value", "unknown")
+        PiiScanner().anonymize("CPF 529.982.247-25, CEP 12345-678")
+
+        snapshot = MaskDispatch.metrics_snapshot()
+        self.assertEqual(snapshot.handlers["cpf"].calls, 2)
+        self.assertEqual(snapshot.handlers["cpf"].bytes, 28)
+        self.assertEqual(snapshot.handlers["pis"].calls, 1)
+        self.assertEqual(snapshot.handlers["cep"].calls, 1)
+        self.assertEqual(snapshot.unmatched, {"unknown": 1})
+
+    def test_result_cache(self):
+        Config.setup(result_cache_size=10, metrics=True)
+
+        for _ in range(3):
+            anonymize_value("529.982.247-25", type_mask="cpf")
+
+        snapshot = MaskDispatch.metrics_snapshot()
+        self.assertEqual(snapshot.handlers["cpf"].calls, 3)
+        self.assertEqual(snapshot.result_cache.hits, 2)
+
+    def test_snapshot_is_a_copy(self):
+        anonymize_value("12345-678", type_mask="cep")
+        snapshot = MaskDispatch.metrics_snapshot()
+
+        anonymize_value("12345-678", type_mask="cep")
+
+        self.assertEqual(snapshot.handlers["cep"].calls, 1)
+        self.assertEqual(MaskDispatch.metrics_snapshot().handlers["cep"].calls, 2)
+
+    def test_reset(self):
+        anonymize_value("12345-678", type_mask="cep")
+        anonymize_value("vip", type_mask="tags")
+
+        MaskDispatch.metrics_reset()
+
+        snapshot = MaskDispatch.metrics_snapshot()
+        self.assertEqual(
+            (snapshot.handlers, snapshot.invalid, snapshot.unmatched), ({}, {}, {})
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,205 @@
+import unittest
+from collections import OrderedDict
+from copy import deepcopy
+
+from anonymizer_data import MaskDict, anonymize_value
+from anonymizer_data.core import PathSelector
+from anonymizer_data.core.paths import parse_path
+from tests.payloads import Account, Customer
+
+
+def order():
+    return {
+        "id": 42,
+        "customer": {
+            "name": "Jhon Doe",
+            "email": "jhondoe@example.com",
+            "addresses": [
+                {"street": "Rua A", "cep": "01001-000"},
+                {"street": "Rua B", "cep": "20040-020"},
+            ],
+        },
+        "items": [{"sku": "A-1", "notes": ["Hello world"]}],
+        "history": [{"status": "created"}] * 3,
+    }
+
+
+class TestParsePath(unittest.TestCase):
+    def test_segments(self):
+        cases = {
+            "customer": ("customer",),
+            "$.customer.addresses[*].cep": ("customer", "addresses", None, "cep"),
+            "customer.*.cep": ("customer", None, "cep"),
+            'items[0]["first name"]': ("items", 0, "first name"),
+            "$['a.b'][12]": ("a.b", 12),
+            '[0]["say \\"hi\\""]': (0, 'say "hi"'),
+            "$": (),
+        }
+        for path, segments in cases.items():
+            with self.subTest(path=path):
+                self.assertEqual(parse_path(path), segments)
+
+    def test_invalid_paths(self):
+        for path in ("", "a..b", "a.", "a[-1]", "a[x]", "$x", "a[0", ".a"):
+            with (
+                self.subTest(path=path),
+                self.assertRaisesRegex(ValueError, "Invalid path"),
+            ):
+                parse_path(path)
+
+
+class TestPathSelector(unittest.TestCase):
+    def test_only_selected_values_are_masked(self):
+        data = order()
+        original = deepcopy(data)
+
+        result = PathSelector.compile(
+            ["customer.addresses[*].cep", "customer.email"]
+        ).anonymize(data)
+
+        expected = deepcopy(original)
+        expected["customer"]["email"] = anonymize_value("jhondoe@example.com")
+        for address in expected["customer"]["addresses"]:
+            address["cep"] = anonymize_value(address["cep"])
+        self.assertEqual(result, expected)
+        self.assertEqual(data, original)
+
+    def test_untouched_subtrees_are_shared(self):
+        data = order()
+
+        result = PathSelector.compile(["customer.addresses[1].cep"]).anonymize(data)
+
+        self.assertIsNot(result, data)
+        self.assertIsNot(result["customer"], data["customer"])
+        self.assertIs(result["items"], data["items"])
+        self.assertIs(result["history"], data["history"])
+        addresses = result["customer"]["addresses"]
+        self.assertIs(addresses[0], data["customer"]["addresses"][0])
+        self.assertIsNot(addresses[1], data["customer"]["addresses"][1])
+
+    def test_nothing_selected_returns_the_input(self):
+        data = order()
+        for path in ("missing.path", "items[5].sku", "customer.name.first", "id[0]"):
+            with self.subTest(path=path):
+                self.assertIs(PathSelector.compile([path]).anonymize(data), data)
+
+    def test_selected_container_is_masked_entirely(self):
+        data = order()
+
+        result = PathSelector.compile(["items"]).anonymize(data)
+
+        self.assertEqual(result["items"], anonymize_value(data["items"]))
+        self.assertEqual(
+            PathSelector.compile(["$"]).anonymize(data), anonymize_value(data)
+        )
+
+    def test_type_mask_per_path(self):
+        selector = PathSelector.compile(
+            {
+                "customer.email": "email",
+                "customer.addresses[*].cep": "cep",
+                "customer.name": None,
+            },
+        )
+
+        customer = selector.anonymize(order())["customer"]
+
+        self.assertEqual(
+            customer["email"], anonymize_value("jhondoe@example.com", type_mask="email")
+        )
+        self.assertEqual(
+            customer["addresses"][0]["cep"],
+            anonymize_value("01001-000", type_mask="cep"),
+        )
+        self.assertEqual(customer["name"], anonymize_value("Jhon Doe"))
+
+    def test_explicit_path_overrides_wildcard(self):
+        selector = PathSelector.compile(
+            {"customer.addresses[*].*": None, "customer.addresses[0].cep": "cep"}
+        )
+
+        addresses = selector.anonymize(order())["customer"]["addresses"]
+
+        self.assertEqual(
+            addresses[0]["cep"], anonymize_value("01001-000", type_mask="cep")
+        )
+        self.assertEqual(addresses[0]["street"], anonymize_value("Rua A"))
+        self.assertEqual(addresses[1]["cep"], anonymize_value("20040-020"))
+
+    def test_wildcard_and_explicit_children_are_merged(self):
+        selector = PathSelector.compile(["*.addresses[0].cep", "customer.email"])
+
+        customer = selector.anonymize(order())["customer"]
+
+        self.assertEqual(customer["email"], anonymize_value("jhondoe@example.com"))
+        self.assertEqual(customer["addresses"][0]["cep"], anonymize_value("01001-000"))
+        self.assertEqual(customer["addresses"][1]["cep"], "20040-020")
+
+    def test_other_container_types(self):
+        data = {
+            "customer": Customer("Jhon Doe", "jhondoe@example.com"),
+            "account": Account("jhondoe@example.com", "529.982.247-25"),
+            "tags": ("Hello world", "keep"),
+            "settings": OrderedDict(token="Hello world"),
+        }
+
+        result = PathSelector.compile(
+            {
+                "customer.email": "email",
+                "account.cpf": "cpf",
+                "tags[0]": None,
+                "settings.token": None,
+            }
+        ).anonymize(data)
+
+        self.assertEqual(
+            result["customer"], Customer("Jhon Doe", "******e@example.com")
+        )
+        self.assertEqual(result["account"].cpf, "***.982.***-**")
+        self.assertEqual(result["tags"], ("*******orld", "keep"))
+        self.assertEqual(result["settings"], {"token": "*******orld"})
+
+    def test_anonymize_many(self):
+        selector = PathSelector.compile(["customer.email"])
+        results = list(selector.anonymize_many([order(), order()]))
+        self.assertEqual(len(results), 2)
+        self.assertEqual(
+            results[1]["customer"]["email"], anonymize_value("jhondoe@example.com")
+        )
+
+    def test_paths_must_be_a_list(self):
+        with self.assertRaises(TypeError):
+            PathSelector.compile("customer.email")
+
+
+class TestMaskDictSelectedPaths(unittest.TestCase):
+    def test_same_result_as_selector(self):
+        paths = {"customer.addresses[*].cep": "cep", "customer.email": None}
+
+        result = MaskDict(order(), selected_paths=paths).anonymize()
+
+        self.assertEqual(result, PathSelector.compile(paths).anonymize(order()))
+
+    def test_dict_subclasses_on_a_selected_path(self):
+        data = {"settings": OrderedDict(token="secret"), "other": OrderedDict(a="b")}
+
+        result = MaskDict(data, selected_paths=["settings.token"]).anonymize()
+
+        self.assertEqual(result, {"settings": {"token": "****et"}, "other": {"a": "b"}})
+        self.assertIs(type(result["settings"]), dict)
+        self.assertIs(type(anonymize_value(data)["settings"]), dict)
+        self.assertIs(result["other"], data["other"])
+
+    def test_conflicting_options(self):
+        for option in (
+            {"key_with_type_mask": True},
+            {"selected_keys": ["id"]},
+            {"in_place": True},
+            {"lazy": True},
+        ):
+            with self.subTest(option=option), self.assertRaises(ValueError):
+                MaskDict(order(), selected_paths=["id"], **option)
+
+
+if __name__ == "__main__":
+    unittest.main()
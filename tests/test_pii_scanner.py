@@ -0,0 +1,179 @@
+import io
+import unittest
+
+from anonymizer_data import MaskDict, MaskStr
+from anonymizer_data.handlers import MaskDispatch, PiiScanner, anonymize_text
+from tests.conftest import fake
+
+
+class TestPiiScanner(unittest.TestCase):
+    def setUp(self):
+        self.scanner = PiiScanner()
+
+    def detect(self, text):
+        return [(d.type_mask, d.value) for d in self.scanner.finditer(text)]
+
+    def test_detects_each_type(self):
+        text = (
+            "CPF 529.982.247-25, CNPJ 11.222.333/0001-81, PIS 689.37232.86-5, "
+            "email jhondoe@example.com, tel (11) 91234-5678, CEP 12345-678, "
+            "RG 12.345.678-9."
+        )
+        self.assertEqual(
+            self.detect(text),
+            [
+                ("cpf", "529.982.247-25"),
+                ("cnpj", "11.222.333/0001-81"),
+                ("pis", "689.37232.86-5"),
+                ("email", "jhondoe@example.com"),
+                ("phone", "(11) 91234-5678"),
+                ("cep", "12345-678"),
+                ("rg", "12.345.678-9"),
+            ],
+        )
+
+    def test_masks_with_handlers(self):
+        self.assertEqual(
+            self.scanner.anonymize("CPF 529.982.247-25, email jhondoe@example.com"),
+            "CPF ***.982.***-**, email ******e@example.com",
+        )
+
+    def test_unformatted_digits_are_decided_by_validators(self):
+        cpf = fake.cpf().replace(".", "").replace("-", "")
+        pis = "68937232865"
+        phone = "11912345678"
+
+        self.assertEqual(
+            self.detect(f"{cpf} {pis} {phone}"),
+            [("cpf", cpf), ("pis", pis), ("phone", phone)],
+        )
+
+    def test_unconfirmed_candidates_are_kept(self):
+        text = "order 123.456.789-00 and 11.111.111/1111-11"
+        self.assertEqual(self.detect(text), [])
+        self.assertEqual(self.scanner.anonymize(text), text)
+
+    def test_mask_unconfirmed(self):
+        scanner = PiiScanner(mask_unconfirmed=True)
+        self.assertEqual(
+            scanner.anonymize("order 123.456.789-00"), "order **************"
+        )
+
+    def test_no_match_inside_longer_numbers(self):
+        self.assertEqual(self.detect("id 1529982247253 and 12345-6789"), [])
+
+    def test_no_match_across_lines(self):
+        for text in ("tel 11 91234\n5678 fim", "tel 11\n912345678", "tel 91234-\n5678"):
+            with self.subTest(text=text):
+                self.assertEqual(self.scanner.anonymize(text), text)
+                self.assertEqual(
+                    self.scanner.anonymize_bytes(text.encode()), text.encode()
+                )
+        self.assertEqual(
+            self.scanner.anonymize("tel 11\t91234 5678\nfim"), "tel **\t***** *678\nfim"
+        )
+
+    def test_selected_types(self):
+        scanner = PiiScanner(["cep"])
+        self.assertEqual(
+            scanner.anonymize("CEP 12345-678 CPF 529.982.247-25"),
+            "CEP *****-678 CPF 529.982.247-25",
+        )
+
+    def test_unknown_type(self):
+        with self.assertRaises(ValueError):
+            PiiScanner(["string"])
+
+    def test_empty_and_plain_text(self):
+        self.assertEqual(self.scanner.anonymize(""), "")
+        self.assertEqual(self.scanner.anonymize("nothing here"), "nothing here")
+        self.assertEqual(PiiScanner([]).anonymize("CEP 12345-678"), "CEP 12345-678")
+
+    def test_bytes(self):
+        text = (
+            "CPF 529.982.247-25, CNPJ 11.222.333/0001-81, PIS 689.37232.86-5, "
+            "email jhondoe@example.com, tel (11) 91234-5678, order 4412."
+        )
+        self.assertEqual(
+            self.scanner.anonymize_bytes(text.encode()),
+            self.scanner.anonymize(text).encode(),
+        )
+        self.assertEqual(
+            self.scanner.anonymize_bytes(memoryview(b"CEP 12345-678"), mask_char="#"),
+            b"CEP #####-678",
+        )
+
+    def test_write_anonymized_range(self):
+        output = io.BytesIO()
+        data = b"CEP 12345-678 CPF 529.982.247-25"
+
+        total = self.scanner.write_anonymized(data, output, 14, len(data))
+
+        self.assertEqual(total, 1)
+        self.assertEqual(output.getvalue(), b"CPF ***.982.***-**")
+
+
+class TestRegisterPattern(unittest.TestCase):
+    def tearDown(self):
+        MaskDispatch._patterns.pop("ticket", None)
+        MaskDispatch.default_scanner = None
+        MaskDispatch._handlers.pop("ticket", None)
+
+    def test_custom_pattern_is_used_by_anonymize_text(self):
+        self.assertEqual(anonymize_text("ticket TK-1234"), "ticket TK-1234")
+
+        @MaskDispatch.register_pattern("ticket", r"TK-\d{4}")
+        @MaskDispatch.register("ticket")
+        def anonymize_ticket(value, **kwargs):
+            return "TK-****"
+
+        self.assertEqual(anonymize_text("ticket TK-1234"), "ticket TK-****")
+
+    def test_default_scanner_is_reused_until_registration(self):
+        anonymize_text("CEP 12345-678")
+        scanner = MaskDispatch.default_scanner
+
+        anonymize_text("CEP 12345-678")
+        self.assertIs(MaskDispatch.default_scanner, scanner)
+
+        MaskDispatch.add_handler("ticket", lambda value, **kwargs: "TK-****")
+        self.assertIsNone(MaskDispatch.default_scanner)
+        anonymize_text("CEP 12345-678")
+        MaskDispatch.register_pattern("ticket", r"TK-\d{4}")(None)
+        self.assertIsNone(MaskDispatch.default_scanner)
+
+    def test_capturing_groups_are_rejected(self):
+        with self.assertRaises(ValueError):
+            MaskDispatch.register_pattern("ticket", r"(TK)-\d{4}")
+
+
+class TestAnonymizeText(unittest.TestCase):
+    def test_type_mask(self):
+        self.assertEqual(
+            MaskStr("meu cpf é 529.982.247-25", "pii_text").anonymize(),
+            "meu cpf é ***.982.***-**",
+        )
+
+    def test_key_with_type_mask_and_options(self):
+        data = {"pii_text": "CEP 12345-678", "name": "Jhon"}
+        self.assertEqual(
+            MaskDict(data, key_with_type_mask=True, mask_char="#").anonymize(),
+            {"pii_text": "CEP #####-678", "name": "####"},
+        )
+        self.assertEqual(
+            anonymize_text("mail jhondoe@example.com", size_anonymization=0.5),
+            "mail ******e@example.com",
+        )
+
+    def test_text_keys_are_not_scanned(self):
+        data = {
+            "text": "CEP 12345-678",
+            "texto": "CPF 529.982.247-25",
+            "userText": "CEP 12345-678",
+            "free_text": "CEP 12345-678",
+        }
+        self.assertEqual(MaskDict(data, key_with_type_mask=True).anonymize(), data)
+
+
+if __name__ == "__main__":
+    unittest.main()
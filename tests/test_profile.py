@@ -0,0 +1,211 @@
+import io
+import unittest
+from collections import namedtuple
+from copy import deepcopy
+from threading import Thread
+
+from anonymizer_data import MaskDict, MaskList
+from anonymizer_data.core import Profiler
+from anonymizer_data.core.config import Config
+from anonymizer_data.core.profile import format_path
+from anonymizer_data.handlers.dispatch import MaskDispatch
+from tests.payloads import COMPLEX_DICT
+
+Point = namedtuple("Point", ["x", "y"])
+
+CUSTOMERS = [
+    {"cpf": "529.982.247-25", "email": "jhondoe@example.com"},
+    {"cpf": "111.444.777-35", "email": "maria@example.com"},
+]
+ORDERS = {
+    "orders": [{"customer": customer} for customer in CUSTOMERS],
+    "status": "paid",
+    "total": 10.5,
+}
+PAYLOADS = [
+    ORDERS,
+    COMPLEX_DICT,
+    {"cpf": "529.982.247-25", "items": ("a", {"b", "c"}, Point("x", 1)), "n": None},
+    {"nested": [[["deep"]], {"empty": {}}, []], "rg": "12.345.678-9"},
+]
+OPTIONS = [
+    {},
+    {"key_with_type_mask": True},
+    {"selected_keys": ["cpf", "status", "outer_key3"]},
+    {"size_anonymization": 0.5, "mask_char": "#"},
+    {"type_mask": "number"},
+    {"lazy": True},
+    {"selected_paths": ["orders[*].customer.cpf"]},
+]
+
+
+class TestProfiler(unittest.TestCase):
+    def setUp(self):
+        MaskDispatch.metrics_reset()
+
+    def tearDown(self):
+        Config.setup()
+        MaskDispatch.metrics_reset()
+
+    def test_same_result_as_without_profiler(self):
+        for payload in PAYLOADS:
+            for options in OPTIONS:
+                with self.subTest(payload=payload, options=options):
+                    expected = MaskDict(payload, **options).anonymize()
+                    with Profiler():
+                        result = MaskDict(payload, **options).anonymize()
+                    self.assertEqual(result, expected)
+
+                    expected = MaskList([payload, "value"], **options).anonymize()
+                    with Profiler():
+                        result = MaskList([payload, "value"], **options).anonymize()
+                    self.assertEqual(result, expected)
+
+    def test_same_result_with_plans(self):
+        for payload in PAYLOADS:
+            for options in OPTIONS[:5]:
+                with self.subTest(payload=payload, options=options):
+                    plan = MaskDict.compile(**options)
+                    expected = plan.anonymize(payload)
+                    with Profiler():
+                        self.assertEqual(plan.anonymize(payload), expected)
+
+    def test_paths_and_handlers(self):
+        with Profiler() as profiler:
+            MaskDict(ORDERS).anonymize()
+            MaskDict.compile().anonymize(ORDERS)
+
+        paths = {spot.name: spot for spot in profiler.hot_paths()}
+        self.assertEqual(
+            set(paths),
+            {"orders[*].customer.cpf", "orders[*].customer.email", "status", "total"},
+        )
+        self.assertEqual(paths["orders[*].customer.cpf"].calls, 4)
+        self.assertEqual(profiler.calls, 2)
+        self.assertEqual(
+            [spot.seconds for spot in profiler.hot_paths()],
+            sorted((spot.seconds for spot in paths.values()), reverse=True),
+        )
+
+        handlers = {spot.name: spot.calls for spot in profiler.hot_handlers()}
+        self.assertEqual(handlers, {"anonymize_string": 10})
+
+    def test_keys_resolved_to_a_type_mask(self):
+        with Profiler() as profiler:
+            MaskList(CUSTOMERS, key_with_type_mask=True).anonymize()
+            MaskDict.compile(key_with_type_mask=True).anonymize({"userCpf": "1"})
+
+        paths = {spot.name: spot.calls for spot in profiler.hot_paths()}
+        self.assertEqual(paths, {"[*].cpf": 2, "[*].email": 2, "userCpf": 1})
+        handlers = {spot.name: spot.calls for spot in profiler.hot_handlers()}
+        self.assertEqual(handlers, {"anonymize_cpf": 3, "anonymize_email": 2})
+
+    def test_modes_timed_as_a_whole(self):
+        with Profiler() as profiler:
+            MaskDict(CUSTOMERS[0], lazy=True, key_with_type_mask=True).anonymize()
+            MaskList(deepcopy(CUSTOMERS), in_place=True).anonymize()
+
+        self.assertEqual([spot.name for spot in profiler.hot_paths()], ["$"])
+        self.assertEqual(profiler.hot_paths()[0].calls, 2)
+        self.assertEqual(
+            {spot.name for spot in profiler.hot_handlers()},
+            {"anonymize_cpf", "anonymize_email", "anonymize_string"},
+        )
+
+    def test_collapsed_stacks(self):
+        with Profiler() as profiler:
+            for _ in range(20):
+                MaskDict(ORDERS).anonymize()
+
+        output = io.StringIO()
+        profiler.write_collapsed(output)
+
+        lines = output.getvalue().splitlines()
+        stacks = {line.rpartition(" ")[0] for line in lines}
+        self.assertIn("MaskDict;orders;[*];customer;cpf;anonymize_string", stacks)
+        for line in lines:
+            stack, _, weight = line.rpartition(" ")
+            self.assertTrue(stack.startswith("MaskDict;"), line)
+            self.assertGreater(int(weight), 0)
+
+    def test_report(self):
+        with Profiler() as profiler:
+            MaskDict(ORDERS).anonymize()
+
+        report = profiler.report(limit=1)
+
+        self.assertIn("1 calls profiled", report)
+        self.assertEqual(report.count("\n"), 6)
+        self.assertIn("path", report)
+        self.assertIn("handler", report)
+
+    def test_only_inside_the_block(self):
+        with Profiler() as profiler:
+            pass
+        MaskDict(ORDERS, key_with_type_mask=True).anonymize()
+
+        self.assertIsNone(Profiler.active())
+        self.assertEqual((profiler.calls, profiler.hot_paths()), (0, []))
+        self.assertFalse(Config.metrics)
+
+    def test_keeps_metrics_setting(self):
+        Config.setup(metrics=True)
+        with Profiler():
+            MaskList(CUSTOMERS, key_with_type_mask=True).anonymize()
+
+        self.assertTrue(Config.metrics)
+        self.assertEqual(MaskDispatch.metrics_snapshot().handlers["cpf"].calls, 2)
+
+    def test_restores_observer(self):
+        seen = []
+        MaskDispatch.metrics.observer = lambda type_mask, _: seen.append(type_mask)
+        self.addCleanup(setattr, MaskDispatch.metrics, "observer", None)
+
+        with Profiler():
+            MaskDict({"cpf": "529.982.247-25"}, key_with_type_mask=True).anonymize()
+
+        self.assertEqual(seen, ["cpf"])
+        self.assertIsNotNone(MaskDispatch.metrics.observer)
+        MaskDispatch.metrics.observer = None
+        with Profiler():
+            pass
+        self.assertIsNone(MaskDispatch.metrics.observer)
+
+    def test_nested_profilers(self):
+        with Profiler() as outer:
+            with Profiler() as inner:
+                MaskDict(ORDERS).anonymize()
+            self.assertTrue(Config.metrics)
+            MaskDict(ORDERS).anonymize()
+
+        self.assertEqual((outer.calls, inner.calls), (1, 1))
+        self.assertEqual(len(inner.hot_handlers()), 1)
+        self.assertFalse(Config.metrics)
+        self.assertIsNone(MaskDispatch.metrics.observer)
+
+    def test_other_threads_not_counted(self):
+        def mask_in_thread():
+            MaskList(CUSTOMERS, key_with_type_mask=True).anonymize()
+
+        with Profiler() as profiler:
+            thread = Thread(target=mask_in_thread)
+            thread.start()
+            thread.join()
+
+        self.assertEqual((profiler.calls, profiler.hot_handlers()), (0, []))
+        self.assertEqual(MaskDispatch.metrics_snapshot().handlers, {})
+
+    def test_circular_reference(self):
+        data: dict = {"a": "value"}
+        data["self"] = data
+
+        with Profiler(), self.assertRaisesRegex(ValueError, "Circular"):
+            MaskDict(data).anonymize()
+
+    def test_format_path(self):
+        self.assertEqual(format_path(("a", None, "b.c", 'd"e')), 'a[*]["b.c"]["d\\"e"]')
+        self.assertEqual(format_path((None,)), "[*]")
+
+
+if __name__ == "__main__":
+    unittest.main()
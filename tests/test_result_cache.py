@@ -0,0 +1,102 @@
+import unittest
+
+from anonymizer_data import MaskDict, MaskStr, anonymize_value
+from anonymizer_data.core.config import Config
+from anonymizer_data.handlers.dispatch import MaskDispatch
+from anonymizer_data.streams import _compile_csv_columns
+from tests.conftest import fake
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        MaskDispatch.cache_clear()
+
+    def tearDown(self):
+        Config.setup()
+        MaskDispatch.cache_clear()
+
+    def test_cache_disabled_by_default(self):
+        MaskStr("Hello world").anonymize()
+        MaskStr("Hello world").anonymize()
+        self.assertEqual(MaskDispatch.cache_info(), (0, 0, 0, 0))
+
+    def test_hits_and_misses(self):
+        Config.setup(result_cache_size=10)
+        cpf = fake.cpf()
+
+        first = MaskStr(cpf, "cpf").anonymize()
+        second = anonymize_value(cpf, type_mask="cpf")
+
+        self.assertEqual(first, second)
+        info = MaskDispatch.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 1, 1))
+        self.assertEqual(info.hit_rate, 0.5)
+
+    def test_mask_char_is_part_of_the_key(self):
+        Config.setup(result_cache_size=10)
+        self.assertEqual(anonymize_value("Hello world"), "*******orld")
+
+        Config.setup(mask_char="#", result_cache_size=10)
+        self.assertEqual(anonymize_value("Hello world"), "#######orld")
+        self.assertEqual(anonymize_value("Hello world", mask_char="-"), "-------orld")
+        self.assertEqual(MaskDispatch.cache_info().hits, 0)
+
+    def test_options_are_part_of_the_key(self):
+        Config.setup(result_cache_size=10)
+        self.assertEqual(
+            anonymize_value("Hello world", size_anonymization=0.5), "***** world"
+        )
+        self.assertEqual(
+            anonymize_value("Hello world", size_anonymization=0.7), "*******orld"
+        )
+        self.assertEqual(MaskDispatch.cache_info().hits, 0)
+
+    def test_lru_eviction(self):
+        Config.setup(result_cache_size=2)
+        for value in ("first", "second", "third"):
+            anonymize_value(value)
+        anonymize_value("first")
+
+        info = MaskDispatch.cache_info()
+        self.assertEqual((info.hits, info.currsize), (0, 2))
+
+    def test_unhashable_options_bypass_cache(self):
+        Config.setup(result_cache_size=10)
+        dispatch = MaskDispatch()
+        self.assertEqual(
+            dispatch.mask("string", "Hello world", size_anonymization=0.5, tags=[]),
+            "***** world",
+        )
+        self.assertEqual(MaskDispatch.cache_info(), (0, 0, 10, 0))
+
+    def test_add_handler_clears_cache(self):
+        Config.setup(result_cache_size=10)
+        anonymize_value("Hello world")
+        self.addCleanup(MaskDispatch._handlers.pop, "cache_test", None)
+        MaskDispatch.add_handler("cache_test", lambda value, **_: value.upper())
+        self.assertEqual(len(MaskDispatch.result_cache), 0)
+        self.assertEqual(MaskDispatch().mask("cache_test", "abc"), "ABC")
+
+    def test_compiled_plans_use_cache(self):
+        Config.setup(result_cache_size=10)
+        plan = MaskDict.compile(key_with_type_mask=True)
+        cpf = fake.cpf()
+
+        records = list(plan.anonymize_many([{"cpf": cpf}, {"cpf": cpf}]))
+
+        self.assertEqual(records[0], records[1])
+        self.assertEqual(MaskDispatch.cache_info().hits, 1)
+
+    def test_csv_columns_use_cache(self):
+        Config.setup(result_cache_size=10)
+        [(_, mask)] = _compile_csv_columns(["doc"], {"doc": "cpf"})
+        cpf = fake.cpf()
+        self.assertEqual(mask(cpf), mask(cpf))
+        self.assertEqual(MaskDispatch.cache_info().hits, 1)
+
+    def test_bind_unknown_type_mask(self):
+        self.assertEqual(MaskDispatch().bind("unknown")("value"), "value")
+
+
+if __name__ == "__main__":
+    unittest.main()
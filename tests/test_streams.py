@@ -0,0 +1,243 @@
+import csv
+import io
+import unittest
+from pathlib import Path
+from random import Random
+from tempfile import TemporaryDirectory
+
+from anonymizer_data import MaskDict
+from anonymizer_data.handlers import PiiScanner, anonymize_text
+from anonymizer_data.streams import anonymize_csv, anonymize_jsonl, anonymize_log_file
+from tests.conftest import fake
+
+
+class TestAnonymizeJsonl(unittest.TestCase):
+    def setUp(self):
+        self.lines = [
+            '{"name": "Jhon Doe", "email": "jhondoe@example.com"}\n',
+            "\n",
+            '{"name": "Maria", "tags": ["admin"], "age": 30}\n',
+        ]
+
+    def test_default(self):
+        output = io.StringIO()
+        total = anonymize_jsonl(self.lines, output, MaskDict.compile())
+        self.assertEqual(total, 2)
+        self.assertEqual(
+            output.getvalue(),
+            '{"name":"*****Doe","email":"*************le.com"}\n'
+            '{"name":"***ia","tags":["***in"],"age":30}\n',
+        )
+
+    def test_selected_keys_and_batches(self):
+        output = io.StringIO()
+        plan = MaskDict.compile(selected_keys=["email"])
+        total = anonymize_jsonl(self.lines * 3, output, plan, batch_size=2)
+        self.assertEqual(total, 6)
+        self.assertEqual(len(output.getvalue().splitlines()), 6)
+        self.assertIn('"email":"*************le.com"', output.getvalue())
+        self.assertIn('"name":"Jhon Doe"', output.getvalue())
+
+    def test_key_with_type_mask(self):
+        output = io.StringIO()
+        anonymize_jsonl(
+            self.lines[:1], output, MaskDict.compile(key_with_type_mask=True)
+        )
+        self.assertEqual(
+            output.getvalue(), '{"name":"********","email":"******e@example.com"}\n'
+        )
+
+    def test_keeps_unicode(self):
+        output = io.StringIO()
+        anonymize_jsonl(['{"city": "São Paulo"}'], output, MaskDict.compile())
+        self.assertEqual(output.getvalue(), '{"city":"******ulo"}\n')
+
+    def test_invalid_lines(self):
+        with self.assertRaises(TypeError) as context:
+            anonymize_jsonl(["[1, 2]"], io.StringIO(), MaskDict.compile())
+        self.assertEqual(str(context.exception), "Line 1 is not a JSON object")
+
+        with self.assertRaises(ValueError) as context:
+            anonymize_jsonl(["{}", "{"], io.StringIO(), MaskDict.compile())
+        self.assertTrue(str(context.exception).startswith("Line 2 is not valid JSON"))
+
+
+class TestAnonymizeCsv(unittest.TestCase):
+    def setUp(self):
+        self.cpf = fake.cpf()
+        self.source = (
+            "name,cpf,email,notes\r\n"
+            f'Jhon Doe,{self.cpf},jhondoe@example.com,"keep, as is"\r\n'
+            "Maria,invalid,maria@example.com,\r\n"
+            "short\r\n"
+        )
+
+    def test_columns(self):
+        output = io.StringIO()
+        total = anonymize_csv(
+            io.StringIO(self.source, newline=""),
+            output,
+            {"cpf": "cpf", "email": "email", "name": "string"},
+            batch_size=2,
+        )
+        self.assertEqual(total, 3)
+        self.assertEqual(
+            output.getvalue(),
+            "name,cpf,email,notes\r\n"
+            f'*****Doe,***.{self.cpf[4:7]}.***-**,******e@example.com,"keep, as is"\r\n'
+            "***ia,*******,****a@example.com,\r\n"
+            "***rt\r\n",
+        )
+
+    def test_unmapped_fields_are_copied_verbatim(self):
+        output = io.StringIO()
+        anonymize_csv(
+            io.StringIO(
+                'name,"notes",cpf,city\n'
+                '"Jhon","a ""b"",\r\nc",529.982.247-25,"SP"\r\n'
+                '"Maria",x,529.982.247-25\n'
+                "short\n"
+                '"Ana",,529.982.247-25',
+                newline="",
+            ),
+            output,
+            {"cpf": "cpf", "name": "string"},
+        )
+        self.assertEqual(
+            output.getvalue(),
+            'name,"notes",cpf,city\n'
+            '**on,"a ""b"",\r\nc",***.982.***-**,"SP"\r\n'
+            "***ia,x,***.982.***-**\n"
+            "***rt\n"
+            "**a,,***.982.***-**",
+        )
+
+    def test_masked_fields_are_quoted_by_the_dialect(self):
+        output = io.StringIO()
+        anonymize_csv(
+            io.StringIO('a,b\nx y,"1,2"\n'),
+            output,
+            {"a": "string", "b": "string"},
+            mask_char=",",
+        )
+        self.assertEqual(output.getvalue(), 'a,b\n",,y",",,2"\n')
+
+        output = io.StringIO()
+        anonymize_csv(
+            io.StringIO("a,b\nxy,1\n"), output, {"b": "string"}, dialect="unix"
+        )
+        self.assertEqual(output.getvalue(), 'a,b\nxy,"*"\n')
+
+    def test_options_and_dialect(self):
+        output = io.StringIO()
+        anonymize_csv(
+            io.StringIO("name;age\nJhon;33\n"),
+            output,
+            {"name": "string", "age": "number"},
+            delimiter=";",
+            mask_char="#",
+            size_anonymization=0.5,
+        )
+        self.assertEqual(output.getvalue(), "name;age\n##on;##\n")
+
+    def test_empty_source(self):
+        self.assertEqual(anonymize_csv(io.StringIO(""), io.StringIO(), {}), 0)
+
+    def test_invalid_columns(self):
+        with self.assertRaises(ValueError) as context:
+            anonymize_csv(io.StringIO(self.source), io.StringIO(), {"doc": "cpf"})
+        self.assertEqual(
+            str(context.exception), "Column 'doc' is not in the CSV header"
+        )
+
+        with self.assertRaises(ValueError) as context:
+            anonymize_csv(io.StringIO(self.source), io.StringIO(), {"cpf": "unknown"})
+        self.assertEqual(
+            str(context.exception), "Type mask 'unknown' is not registered"
+        )
+
+        csv.register_dialect("escaped", escapechar="\\", doublequote=False)
+        self.addCleanup(csv.unregister_dialect, "escaped")
+        with self.assertRaisesRegex(ValueError, "double the quote characters"):
+            anonymize_csv(
+                io.StringIO(self.source), io.StringIO(), {}, dialect="escaped"
+            )
+
+
+class TestAnonymizeLogFile(unittest.TestCase):
+    def setUp(self):
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name, "app.log")
+        self.lines = [
+            f"2026-10-18 INFO order {index} of {fake.email()} cpf={fake.cpf()} "
+            f"tel {fake.cellphone_number()} cep {fake.postcode()}\n"
+            for index in range(300)
+        ]
+        self.path.write_text("".join(self.lines), encoding="utf-8")
+
+    def anonymize(self, *args, **kwargs):
+        output = io.BytesIO()
+        total = anonymize_log_file(self.path, output, *args, **kwargs)
+        return total, output.getvalue()
+
+    def test_same_result_as_text(self):
+        expected = "".join(map(anonymize_text, self.lines)).encode()
+
+        for chunk_size in (1, 100, 4096, 1 << 24):
+            with self.subTest(chunk_size=chunk_size):
+                total, result = self.anonymize(chunk_size=chunk_size)
+                self.assertEqual(result, expected)
+                self.assertGreaterEqual(total, 300 * 3)
+
+    def test_same_result_for_any_chunk_size(self):
+        random = Random(25)
+        parts = [
+            "cpf 529.982.247-25",
+            "tel 11 91234",
+            "5678 fim",
+            "(11) 91234-",
+            "+55",
+            "11912345678",
+            "jhondoe@",
+            "example.com",
+            "12345-678",
+            "",
+            "\r",
+        ]
+        scanner = PiiScanner()
+        for _ in range(20):
+            data = "".join(
+                random.choice(parts) + random.choice(("\n", " ", "\t", "\r\n"))
+                for _ in range(random.randint(1, 40))
+            ).encode()
+            self.path.write_bytes(data)
+            expected = scanner.anonymize_bytes(data)
+
+            for chunk_size in (1, 7, 64, 1 << 20):
+                with self.subTest(data=data, chunk_size=chunk_size):
+                    self.assertEqual(self.anonymize(chunk_size=chunk_size)[1], expected)
+
+    def test_scanner_and_options(self):
+        self.path.write_bytes(
+            b"Ol\xc3\xa1 jhondoe@example.com, CPF 529.982.247-25\n\xff\n"
+        )
+
+        total, result = self.anonymize(PiiScanner(["cpf"]), mask_char="#")
+
+        self.assertEqual(total, 1)
+        self.assertEqual(
+            result, b"Ol\xc3\xa1 jhondoe@example.com, CPF ###.982.###-##\n\xff\n"
+        )
+
+    def test_no_line_break(self):
+        self.path.write_text("CPF 529.982.247-25", encoding="utf-8")
+        self.assertEqual(self.anonymize(chunk_size=4), (1, b"CPF ***.982.***-**"))
+
+    def test_empty_file(self):
+        self.path.write_bytes(b"")
+        self.assertEqual(self.anonymize(), (0, b""))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+import random
+import unittest
+
+from anonymizer_data import MaskDict, MaskList, anonymize_value
+from anonymizer_data.core import MaskDictPlan, ValuePlan
+from anonymizer_data.core.traverse import copy_tree
+from anonymizer_data.handlers import MaskDispatch
+from tests.payloads import COMPLEX_DICT
+from tests.trees import OPTIONS, deep_payload, random_tree, recursive_anonymize_value
+
+
+def flatten(value):
+    """Leaves of a tree with their paths, without recursion, to compare deep trees."""
+    leaves = []
+    stack = [((), value)]
+    while stack:
+        path, node = stack.pop()
+        if type(node) is dict:
+            leaves.append((path, "dict", list(node)))
+            stack.extend((path + (key,), item) for key, item in node.items())
+        elif type(node) is list:
+            leaves.append((path, "list", len(node)))
+            stack.extend((path + (index,), item) for index, item in enumerate(node))
+        else:
+            leaves.append((path, type(node), node))
+    return leaves
+
+
+def deep_list(depth, leaf):
+    value = [leaf]
+    for _ in range(depth):
+        value = [value, leaf]
+    return value
+
+
+class TestCopyTree(unittest.TestCase):
+    def test_same_result_as_recursive(self):
+        rng = random.Random(16)
+        for _ in range(200):
+            tree = {"root": random_tree(rng), "cpf": random_tree(rng)}
+            for options in OPTIONS:
+                with self.subTest(tree=tree, options=options):
+                    self.assertEqual(
+                        anonymize_value(tree, **options),
+                        recursive_anonymize_value(tree, **options),
+                    )
+                    self.assertEqual(
+                        anonymize_value([tree], **options),
+                        recursive_anonymize_value([tree], **options),
+                    )
+
+    def test_leaves_masked_in_recursive_order(self):
+        calls = []
+
+        @MaskDispatch.register("traverse_test")
+        def record(value, **kwargs):
+            calls.append(value)
+            return value
+
+        self.addCleanup(MaskDispatch._handlers.pop, "traverse_test")
+
+        anonymize_value(COMPLEX_DICT, type_mask="traverse_test")
+        iterative, calls[:] = list(calls), []
+        recursive_anonymize_value(COMPLEX_DICT, type_mask="traverse_test")
+        self.assertEqual(iterative, calls)
+
+    def test_depth_beyond_recursion_limit(self):
+        payload = deep_payload(3_000)
+        expected = flatten(anonymize_value(payload))
+
+        self.assertIn(
+            (
+                ("child",) * 3_000 + ("email",),
+                str,
+                anonymize_value("jhondoe@example.com"),
+            ),
+            expected,
+        )
+        self.assertEqual(flatten(MaskDict(payload).anonymize()), expected)
+        self.assertEqual(flatten(MaskDictPlan.compile().anonymize(payload)), expected)
+        self.assertEqual(
+            flatten(MaskDict(payload, key_with_type_mask=True).anonymize()),
+            flatten(MaskDictPlan.compile(key_with_type_mask=True).anonymize(payload)),
+        )
+
+        deep = deep_list(3_000, "Hello world")
+        masked = flatten(deep_list(3_000, "*******orld"))
+        self.assertEqual(flatten(MaskList(deep).anonymize()), masked)
+        self.assertEqual(flatten(ValuePlan.compile().apply(deep)), masked)
+
+    def test_circular_reference(self):
+        data = {"name": "Hello world"}
+        data["items"] = [data]
+        with self.assertRaisesRegex(ValueError, "Circular reference"):
+            anonymize_value(data)
+        with self.assertRaisesRegex(ValueError, "Circular reference"):
+            ValuePlan.compile().apply(data)
+
+    def test_shared_container_is_copied_each_time(self):
+        shared = ["Hello world"]
+        result = anonymize_value({"a": shared, "b": shared})
+        self.assertEqual(result, {"a": ["*******orld"], "b": ["*******orld"]})
+        self.assertIsNot(result["a"], result["b"])
+
+    def test_packed_containers_replace_their_copy(self):
+        result = anonymize_value({"a": [("Hello world", {"Hello"})], "b": ("Hello",)})
+        self.assertEqual(result, {"a": [("*******orld", {"***lo"})], "b": ("***lo",)})
+
+    def test_key_options(self):
+        result = copy_tree(
+            {"a": 1, "b": [2, {"c": 3}]},
+            lambda value, **options: (value, options["key"]),
+            {"key": "root"},
+            lambda options: lambda key: {"key": key},
+        )
+        self.assertEqual(result, {"a": (1, "a"), "b": [(2, "b"), {"c": (3, "c")}]})
+
+    def test_leaf_paths(self):
+        leaves = []
+
+        def on_leaf(path, value, options):
+            leaves.append((path, value))
+            return value
+
+        value = {"a": [1, {"b": 2}], "c": (3,)}
+        result = copy_tree(value, None, {}, on_leaf=on_leaf, path=("root",))
+
+        self.assertEqual(result, value)
+        self.assertEqual(
+            leaves,
+            [
+                (("root", "a", None), 1),
+                (("root", "a", None, "b"), 2),
+                (("root", "c", None), 3),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
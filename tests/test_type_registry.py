@@ -0,0 +1,149 @@
+import unittest
+from collections import OrderedDict, UserDict, UserList, UserString, defaultdict
+from enum import Enum
+
+from anonymizer_data import MaskDict, anonymize_in_place, anonymize_value
+from anonymizer_data.core import TypeMasker, TypeRegistry
+from tests.payloads import Account, Customer
+
+
+class Color(str, Enum):
+    RED = "Hello world"
+
+
+class Pair:
+    def __init__(self, first, second):
+        self.first, self.second = first, second
+
+
+def register_pair(test):
+    TypeRegistry.register(
+        Pair,
+        list,
+        unpack=lambda pair: (pair.first, pair.second),
+        pack=lambda pair, items: Pair(*items),
+    )
+
+    def unregister():
+        del TypeRegistry._types[Pair]
+        TypeRegistry.resolved.clear()
+        TypeRegistry.containers.clear()
+
+    test.addCleanup(unregister)
+
+
+class TestTypeRegistry(unittest.TestCase):
+    def test_subclasses_resolve_through_the_mro(self):
+        data = {"email": "jhondoe@example.com", "name": "Jhon Doe"}
+        expected = anonymize_value(data, key_with_type_mask=True)
+
+        for mapping in (OrderedDict(data), defaultdict(str, data), UserDict(data)):
+            with self.subTest(type=type(mapping)):
+                result = anonymize_value(mapping, key_with_type_mask=True)
+                self.assertIs(type(result), dict)
+                self.assertEqual(result, expected)
+
+        self.assertEqual(anonymize_value(UserList(["Hello world"])), ["*******orld"])
+        self.assertEqual(anonymize_value(Color.RED), "*******orld")
+        self.assertEqual(anonymize_value(UserString("Hello world")), "*******orld")
+
+    def test_tuples_and_sets_keep_their_type(self):
+        self.assertEqual(anonymize_value(("Hello world", 1)), ("*******orld", 1))
+        self.assertEqual(anonymize_value({"Hello world"}), {"*******orld"})
+        self.assertEqual(
+            anonymize_value(frozenset({"Hello world"})), frozenset({"*******orld"})
+        )
+
+    def test_subclasses_of_tuples_and_sets_become_the_plain_type(self):
+        class Names(tuple):
+            pass
+
+        class Tags(frozenset):
+            pass
+
+        result = anonymize_value({"names": Names(["Hello world"]), "tags": Tags(["a"])})
+
+        self.assertIs(type(result["names"]), tuple)
+        self.assertIs(type(result["tags"]), frozenset)
+        self.assertEqual(result, {"names": ("*******orld",), "tags": {"*"}})
+
+    def test_named_tuples_use_field_names(self):
+        customer = Customer("Jhon Doe", "jhondoe@example.com")
+
+        result = anonymize_value(customer, key_with_type_mask=True)
+
+        self.assertIsInstance(result, Customer)
+        self.assertEqual(result.email, "******e@example.com")
+        self.assertEqual(
+            anonymize_value(customer, selected_keys=["name"]),
+            Customer("*****Doe", "jhondoe@example.com"),
+        )
+
+    def test_dataclasses_use_field_names(self):
+        account = Account("jhondoe@example.com", "529.982.247-25", ("Hello world",))
+
+        result = anonymize_value(account, key_with_type_mask=True)
+
+        self.assertIsInstance(result, Account)
+        self.assertEqual(result.email, "******e@example.com")
+        self.assertEqual(result.cpf, "***.982.***-**")
+        self.assertEqual(result.tags, ("Hello world",))  # "tags" is not a mask type
+        self.assertEqual(result.internal, "Hello world")
+        self.assertEqual(account.email, "jhondoe@example.com")
+        self.assertEqual(anonymize_value(account).tags, ("*******orld",))
+
+    def test_plans_and_classes_agree(self):
+        data = {
+            "email": Customer("Jhon Doe", "jhondoe@example.com"),
+            "name": OrderedDict(first="Hello world"),
+            "tags": ("Hello world", {"Hello world"}),
+            "account": Account("jhondoe@example.com", "529.982.247-25"),
+        }
+        for options in ({}, {"key_with_type_mask": True}, {"selected_keys": ["tags"]}):
+            with self.subTest(options=options):
+                self.assertEqual(
+                    MaskDict.compile(**options).anonymize(data),
+                    MaskDict(data, **options).anonymize(),
+                )
+
+    def test_in_place_replaces_immutable_containers(self):
+        inner = OrderedDict(name="Hello world")
+        data = {"inner": inner, "tags": ("Hello world",)}
+
+        anonymize_in_place(data)
+
+        self.assertIs(data["inner"], inner)
+        self.assertEqual(inner["name"], "*******orld")
+        self.assertEqual(data["tags"], ("*******orld",))
+
+    def test_register_container(self):
+        register_pair(self)
+
+        result = anonymize_value({"pair": Pair("Hello world", 42)})
+
+        self.assertIsInstance(result["pair"], Pair)
+        self.assertEqual(
+            (result["pair"].first, result["pair"].second), ("*******orld", 42)
+        )
+
+    def test_resolution_is_cached_per_type(self):
+        anonymize_value(OrderedDict(a="Hello"))
+        self.assertEqual(TypeRegistry.resolved[OrderedDict], TypeMasker(dict))
+        self.assertIn(OrderedDict, TypeRegistry.containers)
+
+        register_pair(self)
+        self.assertNotIn(OrderedDict, TypeRegistry.resolved)
+
+    def test_unknown_types(self):
+        value = object()
+        self.assertIs(anonymize_value(value), value)
+        self.assertIsNone(TypeRegistry.resolve(int))
+        self.assertEqual(anonymize_value(12345, type_mask="string"), "***45")
+
+    def test_invalid_shape(self):
+        with self.assertRaises(ValueError):
+            TypeRegistry.register(Pair, tuple)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+import random
+import unittest
+
+from anonymizer_data.core.config import Config
+from anonymizer_data.handlers import (
+    anonymize_cpf,
+    validate_cnpj,
+    validate_cpf,
+    validate_pis,
+    validation_cache_clear,
+    validation_cache_info,
+)
+from anonymizer_data.handlers.validators import cnpj_validator, cpf_validator
+from tests.conftest import fake
+
+try:
+    import validate_docbr
+except ImportError:  # pragma: no cover
+    validate_docbr = None
+
+
+def variants(doc, alphabet):
+    """The document, unformatted, with a changed character, and shortened and extended."""
+    rng = random.Random(doc)
+    digits = "".join(char for char in doc if char.isalnum())
+    index = rng.randrange(len(digits))
+    changed = digits[:index] + rng.choice(alphabet) + digits[index + 1 :]
+    return [
+        doc,
+        digits,
+        changed,
+        digits[1:],
+        digits[:-1],
+        digits + "0",
+        doc.replace(".", ""),
+        doc.replace("-", "/"),
+        doc.lower(),
+        f" {doc}",
+        f"{doc}\n",
+        doc.replace("1", "\u0661"),
+        doc.replace(digits[-1], "\uff10"),
+    ]
+
+
+EDGE_CASES = [
+    "",
+    ".",
+    "-",
+    "0",
+    "00000000000",
+    "11111111111",
+    "000.000.000-00",
+    "00000000000000",
+    "AAAAAAAAAAAAAA",
+    "abcdefghijklmn",
+    "12ABC34501DE35",
+    "12.ABC.345/01DE-35",
+    "12abc34501de35",
+    "12ABC34501DE3A",
+    "529.982.247-2",
+    "5299822472",
+    "abc",
+    "\u0665\u0662\u0669\u0669\u0668\u0662\u0662\u0664\u0667\u0662\u0665",
+]
+
+
+class TestDocumentValidator(unittest.TestCase):
+    def setUp(self):
+        validation_cache_clear()
+
+    def tearDown(self):
+        Config.setup()
+        validation_cache_clear()
+
+    def test_cache_disabled_by_default(self):
+        cpf = fake.cpf()
+        self.assertTrue(cpf_validator.validate(cpf))
+        self.assertTrue(cpf_validator.validate(cpf))
+        self.assertEqual(validation_cache_info()["cpf"].currsize, 0)
+        self.assertEqual(validation_cache_info()["cpf"].hits, 0)
+
+    def test_cache_by_digits(self):
+        Config.setup(validation_cache_size=10)
+        cpf = fake.cpf()
+        digits = cpf.replace(".", "").replace("-", "")
+
+        self.assertTrue(cpf_validator.validate(cpf))
+        self.assertTrue(cpf_validator.validate(digits))
+        self.assertFalse(cpf_validator.validate("123.456.789-00"))
+
+        info = validation_cache_info()["cpf"]
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 2, 2))
+        self.assertEqual(info.maxsize, 10)
+
+    def test_not_cacheable_input_is_validated(self):
+        Config.setup(validation_cache_size=10)
+        cpf = fake.cpf()
+        self.assertTrue(cpf_validator.validate(cpf))
+        self.assertFalse(cpf_validator.validate(cpf.replace(".", "/")))
+        self.assertEqual(validation_cache_info()["cpf"].hits, 0)
+
+    def test_bounded_size(self):
+        Config.setup(validation_cache_size=2)
+        for cnpj in [fake.cnpj() for _ in range(5)]:
+            self.assertTrue(cnpj_validator.validate(cnpj))
+        self.assertEqual(validation_cache_info()["cnpj"].currsize, 2)
+
+    def test_handler_uses_cache(self):
+        Config.setup(validation_cache_size=10)
+        cpf = fake.cpf()
+        self.assertEqual(anonymize_cpf(cpf), anonymize_cpf(cpf))
+        self.assertEqual(validation_cache_info()["cpf"].hits, 1)
+
+
+@unittest.skipIf(validate_docbr is None, "validate_docbr is not installed")
+class TestSameVerdictsAsValidateDocbr(unittest.TestCase):
+    def assert_same_verdicts(self, validate, reference, docs):
+        for doc in docs:
+            with self.subTest(doc=doc):
+                self.assertEqual(validate(doc), reference.validate(doc))
+
+    def test_cpf(self):
+        docs = [doc for _ in range(200) for doc in variants(fake.cpf(), "0123456789")]
+        self.assert_same_verdicts(validate_cpf, validate_docbr.CPF(), docs + EDGE_CASES)
+
+    def test_cnpj(self):
+        docs = [doc for _ in range(200) for doc in variants(fake.cnpj(), "0123456789")]
+        reference = validate_docbr.CNPJ()
+        alphanumeric = [
+            doc
+            for _ in range(200)
+            for doc in variants(
+                reference.generate(mask=True, digits_only=False),
+                "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ",
+            )
+        ]
+        self.assert_same_verdicts(
+            validate_cnpj, reference, docs + alphanumeric + EDGE_CASES
+        )
+
+    def test_pis(self):
+        reference = validate_docbr.PIS()
+        docs = [
+            doc
+            for doc in reference.generate_list(200, mask=True)
+            for doc in variants(doc, "0123456789")
+        ]
+        self.assert_same_verdicts(validate_pis, reference, docs + EDGE_CASES)
+
+    def test_known_documents(self):
+        self.assertTrue(validate_cpf("529.982.247-25"))
+        self.assertTrue(validate_cpf("52998224725"))
+        self.assertFalse(validate_cpf("529.982.247-26"))
+        self.assertTrue(validate_cnpj("11.222.333/0001-81"))
+        self.assertTrue(validate_cnpj("12.ABC.345/01DE-35"))
+        self.assertFalse(validate_cnpj("11.222.333/0001-82"))
+        self.assertTrue(validate_pis("689.37232.86-5"))
+        self.assertFalse(validate_pis("68937232864"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+from typing import Any
+
+from anonymizer_data.core.dispatcher import mask_str_value
+from tests.conftest import fake
+
+OPTIONS = [
+    {},
+    {"key_with_type_mask": True},
+    {"selected_keys": ["cpf", "outer_key3", "inner_key1"]},
+    {"size_anonymization": 0.5},
+    {"type_mask": "cpf"},
+    {"anonymize_string": False},
+]
+
+
+def random_tree(rng, depth=0):
+    kind = rng.choice(["dict", "list", "str", "int"] if depth < 4 else ["str", "int"])
+    if kind == "dict":
+        keys = ["cpf", "email", "name", "outer_key3", "other", "number"]
+        return {key: random_tree(rng, depth + 1) for key in rng.sample(keys, 3)}
+    if kind == "list":
+        return [random_tree(rng, depth + 1) for _ in range(rng.randint(0, 3))]
+    if kind == "str":
+        return rng.choice([fake.cpf(), fake.email(), fake.name(), "Hello world", ""])
+    return rng.randint(0, 10**6)
+
+
+def deep_payload(depth):
+    """A generated config: each level has a few settings and the next level."""
+    value: dict[str, Any] = {"name": "Jhon Doe", "email": "jhondoe@example.com"}
+    for level in range(depth):
+        value = {
+            "id": level,
+            "owner": "Jhon Doe",
+            "tags": ["config", f"level-{level}"],
+            "child": value,
+        }
+    return value
+
+
+def _recursive_dict(value, key_with_type_mask=False, selected_keys=None, **kwargs):
+    if key_with_type_mask:
+        return {
+            key: recursive_anonymize_value(item, **{**kwargs, "type_mask": key})
+            for key, item in value.items()
+        }
+    if selected_keys:
+        not_selected = {**kwargs, "anonymize_string": False}
+        return {
+            key: recursive_anonymize_value(
+                item, **(kwargs if key in selected_keys else not_selected)
+            )
+            for key, item in value.items()
+        }
+    return {
+        key: recursive_anonymize_value(item, **kwargs) for key, item in value.items()
+    }
+
+
+def recursive_anonymize_value(value, **extra):
+    """The recursive traversal `anonymize_value` used before the explicit stack."""
+    if type(value) is list:
+        return [recursive_anonymize_value(item, **extra) for item in value]
+    if type(value) is dict:
+        return _recursive_dict(value, **extra)
+    if type(value) is str:
+        return mask_str_value(value, **extra)
+    if extra.get("type_mask"):
+        return mask_str_value(str(value), **extra)
+    return value